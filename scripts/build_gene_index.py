@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Build the offline NCBI Gene symbol index consulted by crisprairs.apis.ncbi.
+
+Reads NCBI's ``gene_info.gz`` dump, keeps the species in ``SPECIES_TAXID``
+and writes a SQLite table keyed by (tax_id, symbol). Symbols keep their
+exact case, since some species have genes whose symbols differ only in
+case; a NOCASE index serves case-insensitive lookups. Point
+``CRISPRAIRS_GENE_INDEX`` at the output, or write it to the default path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+
+import requests
+
+from crisprairs.apis.ncbi import GENE_INDEX_PATH, SPECIES_TAXID
+
+GENE_INFO_URL = "https://ftp.ncbi.nlm.nih.gov/gene/DATA/gene_info.gz"
+DOWNLOAD_TIMEOUT = 60
+BATCH_ROWS = 10_000
+
+ORGANISM_NAMES = {
+    "9606": "Homo sapiens",
+    "10090": "Mus musculus",
+    "10116": "Rattus norvegicus",
+    "7955": "Danio rerio",
+    "7227": "Drosophila melanogaster",
+    "6239": "Caenorhabditis elegans",
+}
+
+SCHEMA = """
+CREATE TABLE gene (
+    tax_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    gene_id TEXT NOT NULL,
+    description TEXT NOT NULL,
+    chromosome TEXT NOT NULL,
+    synonyms TEXT NOT NULL,
+    organism TEXT NOT NULL,
+    PRIMARY KEY (tax_id, symbol)
+) WITHOUT ROWID
+"""
+SYMBOL_INDEX = "CREATE INDEX gene_symbol_nocase ON gene (tax_id, symbol COLLATE NOCASE)"
+
+# gene_info.gz column positions
+_TAX_ID, _GENE_ID, _SYMBOL, _SYNONYMS, _CHROMOSOME, _DESCRIPTION = 0, 1, 2, 4, 6, 8
+
+
+def _open_source(source: str) -> io.TextIOBase:
+    if source.startswith(("http://", "https://")):
+        resp = requests.get(source, stream=True, timeout=DOWNLOAD_TIMEOUT)
+        resp.raise_for_status()
+        raw = gzip.GzipFile(fileobj=resp.raw)
+    else:
+        raw = gzip.open(source, "rb")
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def _gene_rows(lines: Iterator[str], taxids: frozenset[str]) -> Iterator[tuple[str, ...]]:
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        cols = line.rstrip("\n").split("\t")
+        if len(cols) <= _DESCRIPTION or cols[_TAX_ID] not in taxids or cols[_SYMBOL] == "-":
+            continue
+        yield (
+            cols[_TAX_ID],
+            cols[_SYMBOL],
+            cols[_GENE_ID],
+            "" if cols[_DESCRIPTION] == "-" else cols[_DESCRIPTION],
+            "" if cols[_CHROMOSOME] == "-" else cols[_CHROMOSOME],
+            "" if cols[_SYNONYMS] == "-" else ", ".join(cols[_SYNONYMS].split("|")),
+            ORGANISM_NAMES.get(cols[_TAX_ID], ""),
+        )
+
+
+def build_index(source: str, output: Path) -> int:
+    """Write a fresh index to ``output`` and return the number of genes stored.
+
+    The first record for a symbol wins, matching NCBI's GeneID ordering.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_suffix(output.suffix + ".tmp")
+    tmp.unlink(missing_ok=True)
+
+    taxids = frozenset(SPECIES_TAXID.values())
+    with _open_source(source) as lines, closing(sqlite3.connect(tmp)) as conn:
+        conn.execute(SCHEMA)
+        rows = _gene_rows(lines, taxids)
+        while batch := [row for _, row in zip(range(BATCH_ROWS), rows)]:
+            conn.executemany("INSERT OR IGNORE INTO gene VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+        conn.execute(SYMBOL_INDEX)
+        # Without statistics the planner picks the primary key for tax_id alone.
+        conn.execute("ANALYZE")
+        conn.commit()
+        count = conn.execute("SELECT COUNT(*) FROM gene").fetchone()[0]
+        conn.execute("VACUUM")
+
+    tmp.replace(output)
+    return count
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--source",
+        default=GENE_INFO_URL,
+        help="gene_info.gz URL or local path (default: NCBI FTP over HTTPS).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=GENE_INDEX_PATH,
+        help=f"SQLite file to write (default: {GENE_INDEX_PATH}).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    count = build_index(args.source, args.output)
+    print(f"Indexed {count} genes for {len(SPECIES_TAXID)} species into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,11 +5,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import re
+import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from crisprairs._json import loads
 from crisprairs.apis.blast import BLAST_API_URL, ORGANISM_MAP
 from crisprairs.apis.crispor import API_URL as CRISPOR_API_URL
 from crisprairs.apis.crispor import GENOME_BUILDS
@@ -20,7 +29,24 @@ from crisprairs.apis.ncbi import SPECIES_TAXID
 from crisprairs.apis.primer3_api import check_available as primer3_available
 
 DEFAULT_TIMEOUT = 10
-CORE_SPECIES = {"human", "mouse", "rat", "zebrafish", "drosophila"}
+CHECK_TIMEOUT = 30  # overall seconds one check may take, including HTTP retries
+STALE_CACHE_PATH = Path("~/.cache/crisprairs/healthcheck.json").expanduser()
+STALE_MAX_AGE = 600  # seconds a cached success may stand in for a failed probe
+CORE_SPECIES = frozenset({"human", "mouse", "rat", "zebrafish", "drosophila"})
+
+_SPECIES_MAPS = {
+    "ensembl": SPECIES_MAP,
+    "crispor": GENOME_BUILDS,
+    "ncbi_taxid": SPECIES_TAXID,
+    "blast_organism": ORGANISM_MAP,
+}
+_KEYSETS = {name: frozenset(mapping) for name, mapping in _SPECIES_MAPS.items()}
+_BLAST_MARKER_RE = re.compile(rb"BLAST", re.IGNORECASE)
+
+# One keep-alive session for the concurrent probes. Retries are left off so a
+# failing source is reported promptly rather than masked.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 
 @dataclass(frozen=True)
@@ -29,27 +55,22 @@ class CheckResult:
     ok: bool
     details: str
     latency_ms: int
+    stale: bool = False
+    timed_out: bool = False
 
 
 def check_species_mappings() -> tuple[bool, str]:
     """Ensure core species coverage is present across integration maps."""
-    maps = {
-        "ensembl": SPECIES_MAP,
-        "crispor": GENOME_BUILDS,
-        "ncbi_taxid": SPECIES_TAXID,
-        "blast_organism": ORGANISM_MAP,
-    }
     missing: dict[str, list[str]] = {}
     blank_values: dict[str, list[str]] = {}
 
-    for name, mapping in maps.items():
-        keys = set(mapping.keys())
-        missing_keys = sorted(CORE_SPECIES - keys)
+    for name, mapping in _SPECIES_MAPS.items():
+        missing_keys = sorted(CORE_SPECIES.difference(_KEYSETS[name]))
         if missing_keys:
             missing[name] = missing_keys
-        blanks = [k for k, v in mapping.items() if not str(v).strip()]
+        blanks = sorted(k for k, v in mapping.items() if not v or not str(v).strip())
         if blanks:
-            blank_values[name] = sorted(blanks)
+            blank_values[name] = blanks
 
     if missing or blank_values:
         return (
@@ -69,14 +90,14 @@ def check_primer3_runtime() -> tuple[bool, str]:
 
 def check_ensembl() -> tuple[bool, str]:
     """Ping Ensembl REST API."""
-    resp = requests.get(
+    resp = _SESSION.get(
         f"{ENSEMBL_API_URL}/info/ping",
         params={"content-type": "application/json"},
         headers={"Accept": "application/json"},
         timeout=DEFAULT_TIMEOUT,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = loads(resp.content)
     if data.get("ping") == 1:
         return (True, "Ensembl ping ok")
     return (False, f"Unexpected Ensembl response: {data}")
@@ -84,20 +105,20 @@ def check_ensembl() -> tuple[bool, str]:
 
 def check_crispor() -> tuple[bool, str]:
     """Check CRISPOR API reachability."""
-    if crispor_is_available():
+    if crispor_is_available(use_cache=False):
         return (True, "CRISPOR endpoint reachable")
     return (False, f"CRISPOR endpoint unavailable: {CRISPOR_API_URL}")
 
 
 def check_ncbi_eutils() -> tuple[bool, str]:
     """Check NCBI Entrez E-utilities endpoint."""
-    resp = requests.get(
+    resp = _SESSION.get(
         "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/einfo.fcgi",
         params={"db": "gene", "retmode": "json"},
         timeout=DEFAULT_TIMEOUT,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = loads(resp.content)
     db_name = data.get("einforesult", {}).get("dbinfo", [{}])[0].get("dbname")
     if db_name == "gene":
         return (True, "NCBI eutils einfo ok")
@@ -106,13 +127,13 @@ def check_ncbi_eutils() -> tuple[bool, str]:
 
 def check_blast() -> tuple[bool, str]:
     """Check BLAST CGI endpoint reachability."""
-    resp = requests.get(
+    resp = _SESSION.get(
         BLAST_API_URL,
         params={"CMD": "Get"},
         timeout=DEFAULT_TIMEOUT,
     )
     resp.raise_for_status()
-    if "BLAST" in resp.text.upper():
+    if _BLAST_MARKER_RE.search(resp.content):
         return (True, "BLAST endpoint reachable")
     return (False, "BLAST response did not contain expected marker text")
 
@@ -128,6 +149,82 @@ def _run_check(name: str, fn) -> CheckResult:
     return CheckResult(name=name, ok=ok, details=details, latency_ms=latency_ms)
 
 
+def _run_checks_concurrently(
+    checks: list[tuple[str, Callable[[], tuple[bool, str]]]],
+    timeout: float = CHECK_TIMEOUT,
+) -> list[CheckResult]:
+    """Run checks in parallel, preserving the input order of results.
+
+    All checks start together, so a shared deadline bounds each one
+    individually; a check still running at the deadline is reported as failed
+    and marked ``timed_out``. Its thread cannot be cancelled, so callers that
+    exit afterwards must not wait for it (see ``main``).
+    """
+    if not checks:
+        return []
+    pool = ThreadPoolExecutor(max_workers=len(checks))
+    try:
+        futures = [pool.submit(_run_check, name, fn) for name, fn in checks]
+        deadline = time.monotonic() + timeout
+        results = []
+        for (name, _), future in zip(checks, futures):
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FuturesTimeoutError:
+                results.append(
+                    CheckResult(
+                        name=name,
+                        ok=False,
+                        details=f"timed out after {timeout:g}s",
+                        latency_ms=int(timeout * 1000),
+                        timed_out=True,
+                    )
+                )
+        return results
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _load_stale_cache() -> dict[str, dict]:
+    try:
+        data = json.loads(STALE_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_stale_cache(results: list[CheckResult], cache: dict[str, dict]) -> None:
+    """Record fresh successes so later runs can fall back to them."""
+    now = time.time()
+    for res in results:
+        if res.ok and not res.stale:
+            cache[res.name] = {"ts": now, "ok": res.ok, "details": res.details}
+    try:
+        STALE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        STALE_CACHE_PATH.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _with_stale_fallback(result: CheckResult, cache: dict[str, dict]) -> CheckResult:
+    """Serve a recent cached success in place of a failed probe."""
+    if result.ok:
+        return result
+    cached = cache.get(result.name)
+    if not cached:
+        return result
+    age = int(time.time() - float(cached.get("ts", 0)))
+    if age >= STALE_MAX_AGE:
+        return result
+    return CheckResult(
+        name=result.name,
+        ok=bool(cached.get("ok")),
+        details=f"stale ({age}s): {cached.get('details', '')}",
+        latency_ms=result.latency_ms,
+        stale=True,
+    )
+
+
 def _print_results(results: list[CheckResult]) -> None:
     print("External Source Health Check")
     print("=" * 80)
@@ -152,28 +249,53 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip network checks and only run local consistency/runtime checks.",
     )
+    parser.add_argument(
+        "--no-stale",
+        action="store_true",
+        help=(
+            "Report failed network checks as-is instead of falling back to a "
+            f"success cached within the last {STALE_MAX_AGE}s."
+        ),
+    )
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
 
-    results = [
-        _run_check("species_mappings", check_species_mappings),
-        _run_check("primer3_runtime", check_primer3_runtime),
+    checks = [
+        ("species_mappings", check_species_mappings),
+        ("primer3_runtime", check_primer3_runtime),
     ]
+    local_count = len(checks)
     if not args.skip_network:
-        results.extend(
-            [
-                _run_check("ensembl_api", check_ensembl),
-                _run_check("crispor_api", check_crispor),
-                _run_check("ncbi_eutils_api", check_ncbi_eutils),
-                _run_check("ncbi_blast_api", check_blast),
-            ]
-        )
+        checks += [
+            ("ensembl_api", check_ensembl),
+            ("crispor_api", check_crispor),
+            ("ncbi_eutils_api", check_ncbi_eutils),
+            ("ncbi_blast_api", check_blast),
+        ]
+
+    # Local checks share the pool so the primer3 import overlaps the probes.
+    results = _run_checks_concurrently(checks)
+    hung = any(r.timed_out for r in results)
+    if not args.skip_network:
+        network_results = results[local_count:]
+        cache = _load_stale_cache()
+        if not args.no_stale:
+            network_results = [_with_stale_fallback(r, cache) for r in network_results]
+        _save_stale_cache(network_results, cache)
+        results[local_count:] = network_results
 
     _print_results(results)
-    return 0 if all(r.ok for r in results) else 1
+    code = 0 if all(r.ok for r in results) else 1
+    if hung:
+        # The interpreter joins pool threads at exit, so a hung probe would
+        # keep the process alive past CHECK_TIMEOUT; exit without waiting.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    return code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+"""JSON encoding and decoding shared across the package.
+
+Uses orjson when it is installed and falls back to the standard library.
+``loads`` raises a ``ValueError`` subclass on malformed input; ``dumps``
+returns UTF-8 bytes and stringifies values JSON cannot represent.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    import json
+
+    loads = json.loads
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, default=str).encode("utf-8")
+
+else:
+    loads = orjson.loads
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+
+
+__all__ = ["dumps", "loads"]
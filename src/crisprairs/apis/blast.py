@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import codecs
+import functools
+import io
 import logging
+import re
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 BLAST_API_URL = "https://blast.ncbi.nlm.nih.gov/blast/Blast.cgi"
 DEFAULT_TIMEOUT = 10
 DEFAULT_POLL_INTERVAL = 5
+INITIAL_POLL_INTERVAL = 1.0
+POLL_BACKOFF = 1.5
 DEFAULT_MAX_WAIT = 60
+POLL_CHUNK_SIZE = 8192
 
 ORGANISM_MAP = {
     "human": "Homo sapiens",
@@ -24,6 +34,22 @@ ORGANISM_MAP = {
     "drosophila": "Drosophila melanogaster",
 }
 
+# Pooled keep-alive session: poll_results hits the same host up to a dozen
+# times per RID, so reusing the TLS connection avoids a handshake per poll.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+
+
+_STATUS_RE = re.compile(r"Status=(WAITING|FAILED|UNKNOWN)")
+_STATUS_OVERLAP = len("Status=UNKNOWN")
+
 
 @dataclass(frozen=True)
 class _BlastJob:
@@ -45,7 +71,7 @@ def submit_blast(
     )
 
     try:
-        response = requests.post(BLAST_API_URL, data=payload, timeout=DEFAULT_TIMEOUT)
+        response = _SESSION.post(BLAST_API_URL, data=payload, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
     except Exception as exc:
         logger.error("BLAST submission failed: %s", exc)
@@ -62,25 +88,39 @@ def poll_results(
     max_wait: int = DEFAULT_MAX_WAIT,
     poll_interval: int = DEFAULT_POLL_INTERVAL,
 ) -> list[dict]:
-    """Poll BLAST for a finished result set and return parsed hits."""
+    """Poll BLAST for a finished result set and return parsed hits.
+
+    Waits between status checks back off exponentially from
+    ``INITIAL_POLL_INTERVAL`` up to ``poll_interval`` seconds, so short jobs
+    are observed soon after they finish.
+    """
     job = _BlastJob(rid=rid)
-    started = time.time()
+    started = time.monotonic()
+    interval = min(INITIAL_POLL_INTERVAL, poll_interval)
 
-    while (time.time() - started) < max_wait:
+    while (time.monotonic() - started) < max_wait:
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 BLAST_API_URL,
                 params={"CMD": "Get", "RID": job.rid, "FORMAT_TYPE": "XML"},
                 timeout=DEFAULT_TIMEOUT,
+                stream=True,
             )
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
+                state, body = _read_poll_body(response)
+            finally:
+                response.close()
         except requests.RequestException as exc:
             logger.error("BLAST poll error: %s", exc)
             return []
 
-        state = _job_state(response.text)
         if state == "WAITING":
-            time.sleep(poll_interval)
+            remaining = max_wait - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * POLL_BACKOFF, poll_interval)
             continue
         if state == "FAILED":
             logger.error("BLAST job failed")
@@ -89,7 +129,7 @@ def poll_results(
             logger.error("BLAST job not found (RID may have expired)")
             return []
 
-        return _parse_blast_xml(response.text)
+        return _parse_blast_xml(body)
 
     logger.warning("BLAST timed out after %ds for RID %s", max_wait, job.rid)
     return []
@@ -109,18 +149,26 @@ def check_primer_specificity(
         "reverse_results": [],
     }
 
-    forward_rid = submit_blast(forward, organism=organism)
-    reverse_rid = submit_blast(reverse, organism=organism)
+    # Both primers are independent BLAST jobs, so submit and poll them side by
+    # side; total wait becomes max(forward, reverse) instead of the sum.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        fwd_submit = pool.submit(submit_blast, forward, organism=organism)
+        rev_submit = pool.submit(submit_blast, reverse, organism=organism)
+        forward_rid = fwd_submit.result()
+        reverse_rid = rev_submit.result()
 
-    if forward_rid:
-        f_hits = poll_results(forward_rid)
-        result["forward_hits"] = len(f_hits)
-        result["forward_results"] = f_hits[:5]
+        fwd_poll = pool.submit(poll_results, forward_rid) if forward_rid else None
+        rev_poll = pool.submit(poll_results, reverse_rid) if reverse_rid else None
 
-    if reverse_rid:
-        r_hits = poll_results(reverse_rid)
-        result["reverse_hits"] = len(r_hits)
-        result["reverse_results"] = r_hits[:5]
+        if fwd_poll is not None:
+            f_hits = fwd_poll.result()
+            result["forward_hits"] = len(f_hits)
+            result["forward_results"] = f_hits[:5]
+
+        if rev_poll is not None:
+            r_hits = rev_poll.result()
+            result["reverse_hits"] = len(r_hits)
+            result["reverse_results"] = r_hits[:5]
 
     both_submitted = forward_rid is not None and reverse_rid is not None
     result["specific"] = (
@@ -132,27 +180,35 @@ def check_primer_specificity(
 
 
 def _parse_blast_xml(xml_text: str) -> list[dict]:
-    """Parse BLAST XML and return first-HSP hit summaries."""
+    """Parse BLAST XML and return first-HSP hit summaries.
+
+    Streams the document with ``iterparse`` and clears each ``Hit`` once it
+    has been summarized, so peak memory tracks a single hit rather than the
+    whole (often multi-MB) result set.
+    """
+    parsed: list[dict] = []
     try:
-        root = ET.fromstring(xml_text)
+        for _, hit in ET.iterparse(io.StringIO(xml_text), events=("end",)):
+            if hit.tag != "Hit":
+                continue
+            findtext = hit.findtext
+            row = {
+                "accession": findtext("Hit_accession") or "",
+                "title": findtext("Hit_def") or "",
+                "length": findtext("Hit_len") or "",
+            }
+            first_hsp = hit.find("Hit_hsps/Hsp")
+            if first_hsp is not None:
+                hsp_text = first_hsp.findtext
+                row["identity"] = hsp_text("Hsp_identity") or ""
+                row["align_len"] = hsp_text("Hsp_align-len") or ""
+                row["e_value"] = hsp_text("Hsp_evalue") or ""
+                row["bit_score"] = hsp_text("Hsp_bit-score") or ""
+            parsed.append(row)
+            hit.clear()
     except ET.ParseError:
         logger.error("Failed to parse BLAST XML response")
         return []
-
-    parsed: list[dict] = []
-    for hit in root.iter("Hit"):
-        row = {
-            "accession": _get_text(hit, "Hit_accession"),
-            "title": _get_text(hit, "Hit_def"),
-            "length": _get_text(hit, "Hit_len"),
-        }
-        first_hsp = next(hit.iter("Hsp"), None)
-        if first_hsp is not None:
-            row["identity"] = _get_text(first_hsp, "Hsp_identity")
-            row["align_len"] = _get_text(first_hsp, "Hsp_align-len")
-            row["e_value"] = _get_text(first_hsp, "Hsp_evalue")
-            row["bit_score"] = _get_text(first_hsp, "Hsp_bit-score")
-        parsed.append(row)
     return parsed
 
 
@@ -172,11 +228,16 @@ def _submission_payload(
         "EXPECT": "10",
     }
     if organism:
-        org_name = ORGANISM_MAP.get(organism.lower(), organism)
-        payload["ENTREZ_QUERY"] = f'"{org_name}"[ORGN]'
+        payload["ENTREZ_QUERY"] = _organism_query(organism)
     return payload
 
 
+@functools.lru_cache(maxsize=64)
+def _organism_query(organism: str) -> str:
+    org_name = ORGANISM_MAP.get(organism.lower(), organism)
+    return f'"{org_name}"[ORGN]'
+
+
 def _extract_rid(text: str) -> str | None:
     for raw_line in text.splitlines():
         line = raw_line.strip()
@@ -185,18 +246,26 @@ def _extract_rid(text: str) -> str | None:
     return None
 
 
-def _job_state(text: str) -> str | None:
-    if "Status=WAITING" in text:
-        return "WAITING"
-    if "Status=FAILED" in text:
-        return "FAILED"
-    if "Status=UNKNOWN" in text:
-        return "UNKNOWN"
-    return None
+def _read_poll_body(response) -> tuple[str | None, str]:
+    """Read a streamed poll response, stopping once a job status marker appears.
+
+    Status pages are abandoned as soon as the marker is seen; finished jobs
+    carry no marker and are read in full for XML parsing.
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    body = ""
+    for chunk in response.iter_content(chunk_size=POLL_CHUNK_SIZE):
+        # Re-scan a short overlap so a marker split across chunks is still found.
+        scan_from = max(0, len(body) - _STATUS_OVERLAP)
+        body += decoder.decode(chunk)
+        match = _STATUS_RE.search(body, scan_from)
+        if match:
+            return match.group(1), body
+    body += decoder.decode(b"", final=True)
+    return _job_state(body), body
 
 
-def _get_text(element, tag: str) -> str:
-    node = element.find(tag)
-    if node is None or node.text is None:
-        return ""
-    return node.text
+def _job_state(text: str) -> str | None:
+    match = _STATUS_RE.search(text)
+    return match.group(1) if match else None
+
@@ -7,15 +7,23 @@ score, Doench 2016 on-target score, and off-target prediction.
 from __future__ import annotations
 
 import csv
+import functools
 import io
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 API_URL = "http://crispor.tefor.net/crispor.py"
 TIMEOUT = 30  # seconds (CRISPOR can be slow)
+AVAILABILITY_TTL = 600  # seconds to reuse an is_available() verdict
+DEFAULT_MAX_CONCURRENCY = 4  # parallel CRISPOR requests in score_existing_guides
 
 # Common species → CRISPOR genome build
 GENOME_BUILDS = {
@@ -27,7 +35,33 @@ GENOME_BUILDS = {
     "c. elegans": "ce11",
 }
 
-
+# CRISPOR TSV columns read by _parse_response, in unpacking order
+_RESPONSE_COLUMNS = (
+    "guideSeq",
+    "pam",
+    "position",
+    "mitSpecScore",
+    "doench2016Score",
+    "morenoMateosScore",
+    "offtargetCount",
+)
+
+# (expires_at, available) from the last is_available() probe
+_availability: tuple[float, bool] | None = None
+
+# Pooled keep-alive session shared by all CRISPOR calls.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=64)
 def genome_for_species(species: str) -> str:
     """Map a common species name to the CRISPOR genome build."""
     return GENOME_BUILDS.get(species.lower(), species)
@@ -53,7 +87,7 @@ def design_guides(
     genome = genome_for_species(species)
 
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             API_URL,
             params={
                 "seq": sequence,
@@ -81,7 +115,9 @@ def score_existing_guides(
 ) -> list[dict]:
     """Score a list of pre-designed guide sequences.
 
-    Submits each guide individually to CRISPOR for scoring.
+    Submits each guide to CRISPOR concurrently on a bounded thread pool.
+    The pool width comes from the ``CRISPOR_MAX_CONCURRENCY`` env var
+    (default 4) to stay within the server's rate limits.
 
     Args:
         guide_sequences: List of 20bp guide sequences (without PAM).
@@ -89,15 +125,24 @@ def score_existing_guides(
         pam: PAM sequence.
 
     Returns:
-        List of scoring result dicts per guide.
+        List of scoring result dicts per guide, in input order.
     """
+    if not guide_sequences:
+        return []
+
+    max_workers = min(_max_concurrency(), len(guide_sequences))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(design_guides, seq, species=species, pam=pam)
+            for seq in guide_sequences
+        ]
+
     results = []
-    for seq in guide_sequences:
+    for seq, future in zip(guide_sequences, futures):
         try:
-            guides = design_guides(seq, species=species, pam=pam)
             results.append({
                 "query_sequence": seq,
-                "guides": guides,
+                "guides": future.result(),
             })
         except Exception as e:
             logger.error("CRISPOR scoring failed for %s: %s", seq[:10], e)
@@ -109,29 +154,78 @@ def score_existing_guides(
     return results
 
 
-def is_available() -> bool:
-    """Check if the CRISPOR API is reachable."""
+def _max_concurrency() -> int:
     try:
-        resp = requests.get(API_URL, timeout=5)
-        return resp.status_code < 500
+        return max(1, int(os.getenv("CRISPOR_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENCY
+
+
+def is_available(use_cache: bool = True) -> bool:
+    """Check if the CRISPOR API is reachable.
+
+    The verdict is cached in-process for ``AVAILABILITY_TTL`` seconds so
+    repeated guards around CRISPOR usage do not re-probe the server.
+
+    Args:
+        use_cache: Set False to force a fresh probe.
+    """
+    global _availability
+    now = time.monotonic()
+    if use_cache and _availability is not None and _availability[0] > now:
+        return _availability[1]
+
+    try:
+        resp = _SESSION.get(API_URL, timeout=5)
+        available = resp.status_code < 500
     except requests.RequestException:
-        return False
+        available = False
+
+    _availability = (now + AVAILABILITY_TTL, available)
+    return available
+
+
+def bust_cache() -> None:
+    """Forget the cached ``is_available`` verdict."""
+    global _availability
+    _availability = None
 
 
 def _parse_response(text: str) -> list[dict]:
-    """Parse CRISPOR tab-delimited response into guide dicts."""
+    """Parse CRISPOR tab-delimited response into guide dicts.
+
+    Column positions are resolved once from the header, so rows are read as
+    plain lists rather than building an intermediate dict per row.
+    """
     guides = []
     try:
-        reader = csv.DictReader(io.StringIO(text), delimiter="\t")
+        reader = csv.reader(io.StringIO(text), delimiter="\t")
+        header = next(reader, None)
+        if not header:
+            return guides
+        width = len(header)
+        index = {name: i for i, name in enumerate(header)}
+        # Matches DictReader: absent columns read as "" (the sentinel cell
+        # appended to every row), cells missing from short rows as None.
+        seq_i, pam_i, pos_i, mit_i, doench_i, moreno_i, ot_i = (
+            index.get(name, -1) for name in _RESPONSE_COLUMNS
+        )
+        padding = [None] * width
+
         for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += padding[len(row):]
+            row.append("")
             guides.append({
-                "guide_sequence": row.get("guideSeq", ""),
-                "pam": row.get("pam", ""),
-                "position": row.get("position", ""),
-                "mit_specificity_score": _to_float(row.get("mitSpecScore")),
-                "doench2016_score": _to_float(row.get("doench2016Score")),
-                "moreno_mateos_score": _to_float(row.get("morenoMateosScore")),
-                "off_target_count": _to_int(row.get("offtargetCount")),
+                "guide_sequence": row[seq_i],
+                "pam": row[pam_i],
+                "position": row[pos_i],
+                "mit_specificity_score": _to_float(row[mit_i]),
+                "doench2016_score": _to_float(row[doench_i]),
+                "moreno_mateos_score": _to_float(row[moreno_i]),
+                "off_target_count": _to_int(row[ot_i]),
             })
     except Exception as e:
         logger.error("CRISPOR response parse error: %s", e)
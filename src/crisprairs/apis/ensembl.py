@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from crisprairs._json import loads
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://rest.ensembl.org"
 TIMEOUT = 10  # seconds
+SEQUENCE_PREVIEW_BP = 500
 
 # Common species → Ensembl species name
 SPECIES_MAP = {
@@ -22,6 +29,19 @@ SPECIES_MAP = {
     "c. elegans": "caenorhabditis_elegans",
 }
 
+# Pooled keep-alive session; callers typically issue several lookups per gene.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+_SESSION.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+atexit.register(_SESSION.close)
+
 
 def _get(endpoint: str, params: dict | None = None) -> Any | None:
     """Issue a GET request to the Ensembl REST API.
@@ -29,16 +49,16 @@ def _get(endpoint: str, params: dict | None = None) -> Any | None:
     Returns parsed JSON on success, None on failure.
     """
     url = f"{BASE_URL}{endpoint}"
-    headers = {"Content-Type": "application/json", "Accept": "application/json"}
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
+        resp = _SESSION.get(url, params=params, timeout=TIMEOUT)
         resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as e:
+        return loads(resp.content)
+    except (requests.RequestException, ValueError) as e:
         logger.error("Ensembl API error [%s]: %s", endpoint, e)
         return None
 
 
+@functools.lru_cache(maxsize=64)
 def resolve_species(species: str) -> str:
     """Resolve a common species name to the Ensembl species identifier."""
     return SPECIES_MAP.get(species.lower(), species.lower().replace(" ", "_"))
@@ -93,7 +113,8 @@ def get_sequence(gene_id: str, expand_bp: int = 0) -> dict | None:
         expand_bp: Number of bases to expand on each side.
 
     Returns:
-        Dict with id, seq_length, sequence_preview (first 500bp), description.
+        Dict with id, seq_length, sequence_preview (first
+        ``SEQUENCE_PREVIEW_BP`` bases), full_sequence, description.
     """
     params: dict[str, Any] = {"type": "genomic"}
     if expand_bp:
@@ -109,11 +130,18 @@ def get_sequence(gene_id: str, expand_bp: int = 0) -> dict | None:
         "id": data.get("id", gene_id),
         "description": data.get("desc", ""),
         "seq_length": len(seq),
-        "sequence_preview": seq[:500] + ("..." if len(seq) > 500 else ""),
+        "sequence_preview": _preview(seq),
         "full_sequence": seq,
     }
 
 
+def _preview(seq: str) -> str:
+    """Bounded preview of a sequence; short sequences are returned as-is."""
+    if len(seq) <= SEQUENCE_PREVIEW_BP:
+        return seq
+    return seq[:SEQUENCE_PREVIEW_BP] + "..."
+
+
 def list_transcripts(gene_id: str) -> list[dict]:
     """List transcript variants for a gene.
 
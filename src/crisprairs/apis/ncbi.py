@@ -1,19 +1,61 @@
-"""NCBI gene lookup via Biopython Bio.Entrez.
+"""NCBI gene lookup via the Datasets v2 and E-utilities REST APIs.
 
-Uses Biopython's Entrez module for structured access to NCBI E-utilities.
+Talks to api.ncbi.nlm.nih.gov and eutils.ncbi.nlm.nih.gov directly over a
+pooled keep-alive session.
 Requires NCBI_EMAIL env var for polite API usage.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
+import functools
+import io
+import itertools
+import json
 import logging
 import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from operator import itemgetter
+from pathlib import Path
+from urllib.parse import quote
 
 import dotenv
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from crisprairs._json import loads
+
+try:
+    from lxml.etree import iterparse
+except ImportError:  # pragma: no cover - depends on the environment
+    from xml.etree.ElementTree import iterparse
 
 dotenv.load_dotenv()
 logger = logging.getLogger(__name__)
 
+EUTILS_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+DATASETS_URL = "https://api.ncbi.nlm.nih.gov/datasets/v2"
+TIMEOUT = 10  # seconds
+MAX_SEARCH_WORKERS = 8  # concurrent fallback esearch calls in fetch_gene_info_batch
+SEARCH_HITS_PER_SYMBOL = 5  # batched esearch headroom for same-symbol hits
+MAX_BATCH_SIZE = 100  # symbols per fetch_gene_info_batch call in fetch_many
+REQUESTS_PER_SECOND = 3  # NCBI limit without an API key
+REQUESTS_PER_SECOND_WITH_KEY = 10
+GENE_CACHE_PATH = Path("~/.cache/crisprairs/ncbi_gene.json").expanduser()
+SEQUENCE_CACHE_PATH = Path("~/.cache/crisprairs/ncbi_sequences.sqlite3").expanduser()
+# Optional offline symbol index built by scripts/build_gene_index.py.
+GENE_INDEX_PATH = Path(
+    os.getenv("CRISPRAIRS_GENE_INDEX", "~/.cache/crisprairs/gene_index.sqlite3")
+).expanduser()
+GENE_INDEX_MMAP_BYTES = 256 * 1024 * 1024
+
 # Species name → NCBI taxonomy ID mapping
 SPECIES_TAXID = {
     "human": "9606",
@@ -24,20 +66,169 @@ SPECIES_TAXID = {
     "c. elegans": "6239",
 }
 
+# elink link names to prefer per sequence type in _extract_nuccore_ids
+_PREFERRED_LINKS = {
+    "genomic": ("gene_nuccore_refseqgenomic", "gene_nuccore_genomic"),
+    "rna": ("gene_nuccore_refseqrna", "gene_nuccore_rna"),
+}
 
-def _configure_entrez():
-    """Configure Biopython Entrez with email and optional API key."""
-    from Bio import Entrez
-
-    Entrez.email = os.getenv("NCBI_EMAIL", "anonymous@example.com")
+# Pooled keep-alive session: a gene lookup chains esearch, esummary, elink and
+# efetch against the same host. E-utilities reads are idempotent, so POSTs
+# (used to keep long ID lists out of the URL) are retried too. The pool blocks
+# when every connection is busy, so concurrent lookups wait for a warm
+# connection instead of opening (and then discarding) extra ones; with the
+# rate limiter in front that wait is never the bottleneck.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "crisprairs (+https://github.com/Tmmoore286/crispr-ai-research-suite)"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=MAX_SEARCH_WORKERS,
+        pool_block=True,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+        ),
+    ),
+)
+
+
+# Successful gene lookups keyed by "species|symbol"; loaded from and flushed
+# to GENE_CACHE_PATH so repeat lookups skip the network across processes.
+_gene_cache: dict[str, dict] | None = None
+_gene_cache_dirty = False
+_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _eutils_params() -> dict[str, str]:
+    """Identification params NCBI asks every E-utilities request to carry."""
+    params = {
+        "tool": "crisprairs",
+        "email": os.getenv("NCBI_EMAIL", "anonymous@example.com"),
+    }
     api_key = os.getenv("NCBI_API_KEY")
     if api_key:
-        Entrez.api_key = api_key
-    return Entrez
+        params["api_key"] = api_key
+    return params
+
+
+class _RateLimiter:
+    """Space calls at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            slot = max(time.monotonic(), self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+@functools.lru_cache(maxsize=1)
+def _rate_limiter() -> _RateLimiter:
+    if "api_key" in _eutils_params():
+        return _RateLimiter(REQUESTS_PER_SECOND_WITH_KEY)
+    return _RateLimiter(REQUESTS_PER_SECOND)
+
+
+def eutils_params() -> dict[str, str]:
+    """Identification params (tool, email, API key if set) for E-utilities calls.
+
+    Returns a fresh dict, so callers can merge into it.
+    """
+    return dict(_eutils_params())
+
+
+def eutils_rate_limiter() -> _RateLimiter:
+    """The limiter every E-utilities caller in the process shares.
+
+    Call its ``wait()`` before each request; the rate is 3/s, or 10/s when
+    ``NCBI_API_KEY`` is set.
+    """
+    return _rate_limiter()
+
+
+def _eutils(utility: str, **params) -> requests.Response:
+    """POST to one E-utility and return the successful response.
+
+    Calls from every thread share one rate limiter so concurrent lookups stay
+    within NCBI's per-second request allowance.
+    """
+    _rate_limiter().wait()
+    resp = _SESSION.post(
+        f"{EUTILS_URL}/{utility}.fcgi",
+        data={**_eutils_params(), **params},
+        timeout=TIMEOUT,
+    )
+    resp.raise_for_status()
+    return resp
+
+
+def _esearch(db: str, term: str, retmax: int = 20) -> list[str]:
+    data = loads(_eutils("esearch", db=db, term=term, retmax=retmax, retmode="json").content)
+    return data.get("esearchresult", {}).get("idlist", [])
+
+
+def _esummary(db: str, ids: list[str]) -> dict:
+    data = loads(_eutils("esummary", db=db, id=",".join(ids), retmode="json").content)
+    return data.get("result", {})
+
+
+def _elink(dbfrom: str, db: str, ids: list[str]) -> Iterator[tuple[str, str, str]]:
+    """Run elink and stream ``(source ID, link name, linked ID)`` triples.
+
+    IDs are sent as repeated ``id`` params so each source gets its own link
+    set; a comma-joined list would make NCBI merge them into one. The request
+    is made eagerly, the XML is parsed as the iterator is consumed.
+    """
+    content = _eutils("elink", dbfrom=dbfrom, db=db, id=list(ids)).content
+    return _iter_links(content)
+
+
+def _iter_links(xml: bytes) -> Iterator[tuple[str, str, str]]:
+    """Stream links out of elink XML, clearing each link set once consumed.
+
+    Link names are lowercased. Triples for one source ID are contiguous. Only
+    end events are parsed: an ``Id`` seen after a ``LinkName`` belongs to that
+    link set, and the first one before it is the source ID.
+    """
+    source_id = ""
+    link_name: str | None = None
+    for _, elem in iterparse(io.BytesIO(xml), events=("end",)):
+        tag = elem.tag
+        if tag == "Id":
+            text = (elem.text or "").strip()
+            if link_name is not None:
+                if text:
+                    yield source_id, link_name, text
+            elif not source_id:
+                source_id = text
+        elif tag == "LinkName":
+            link_name = (elem.text or "").lower()
+        elif tag == "LinkSetDb":
+            link_name = None
+            elem.clear()
+        elif tag == "LinkSet":
+            source_id = ""
+            link_name = None
+            elem.clear()
+
+
+def _efetch(db: str, ids: list[str], rettype: str, retmode: str = "text") -> str:
+    return _eutils("efetch", db=db, id=",".join(ids), rettype=rettype, retmode=retmode).text
 
 
 def fetch_gene_info(gene_symbol: str, species: str = "human") -> dict | None:
-    """Look up gene information from NCBI via Biopython Entrez.
+    """Look up gene information from NCBI E-utilities.
 
     Args:
         gene_symbol: Gene symbol (e.g. "TP53", "BRCA1").
@@ -47,53 +238,389 @@ def fetch_gene_info(gene_symbol: str, species: str = "human") -> dict | None:
         Dict with gene_id, symbol, full_name, chromosome, organism,
         aliases, summary, genomic_info. None on failure.
     """
+    return fetch_gene_info_batch([gene_symbol], species=species)[0]
+
+
+def fetch_gene_info_batch(gene_symbols: list[str], species: str = "human") -> list[dict | None]:
+    """Look up several genes while sharing one esummary round-trip.
+
+    Symbols already in the gene cache are served from it, then symbols in the
+    offline gene index, if one has been built. The rest go to one
+    NCBI Datasets gene-report request; anything it does not resolve uses one
+    OR-joined esearch plus one comma-joined esummary, then a per-symbol
+    esearch for names that are not official symbols. Successful records are
+    added to the cache.
+
+    Args:
+        gene_symbols: Gene symbols to resolve.
+        species: Common species name applied to every symbol.
+
+    Returns:
+        List aligned with ``gene_symbols``; each entry is the same dict
+        ``fetch_gene_info`` returns, or None when not found or on failure.
+    """
+    if not gene_symbols:
+        return []
+    species = species.lower()
+    keys = [_gene_cache_key(symbol, species) for symbol in gene_symbols]
+
+    with _cache_lock:
+        cache = _load_gene_cache()
+        records = [cache.get(key) for key in keys]
+    pending = list(dict.fromkeys(s for s, rec in zip(gene_symbols, records) if rec is None))
+
+    if pending:
+        # Index records lack summary and genomic_info, so they are served but
+        # never written to the gene cache, which would keep them forever.
+        taxid = _taxid(species)
+        fetched: dict[str, dict | None] = (
+            _fetch_gene_info_index(pending, taxid) if taxid else {}
+        )
+        remaining = [symbol for symbol in pending if symbol not in fetched]
+        if remaining:
+            network = dict(zip(remaining, _fetch_gene_info_uncached(remaining, species)))
+            _store_gene_records(
+                {_gene_cache_key(s, species): rec for s, rec in network.items() if rec}
+            )
+            fetched.update(network)
+        records = [rec or fetched.get(s) for s, rec in zip(gene_symbols, records)]
+
+    # Copies, so callers mutating a result cannot corrupt the cache.
+    return [copy.deepcopy(rec) if rec else None for rec in records]
+
+
+def fetch_many(
+    gene_symbols: list[str], species: str = "human", max_workers: int = 4
+) -> list[dict | None]:
+    """Look up a large symbol list as concurrent batches of ``MAX_BATCH_SIZE``.
+
+    Returns a list aligned with ``gene_symbols``, like ``fetch_gene_info_batch``;
+    a batch that raises is logged and yields None for each of its symbols.
+    """
+    batches = [
+        gene_symbols[i:i + MAX_BATCH_SIZE] for i in range(0, len(gene_symbols), MAX_BATCH_SIZE)
+    ]
+    if not batches:
+        return []
+
+    results: list[dict | None] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+        futures = [pool.submit(fetch_gene_info_batch, batch, species) for batch in batches]
+        for batch, future in zip(batches, futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                logger.error("NCBI batch lookup failed for %s: %s", ", ".join(batch), e)
+                results.extend([None] * len(batch))
+    return results
+
+
+def clear_cache() -> None:
+    """Drop cached gene records, in memory and on disk."""
+    global _gene_cache, _gene_cache_dirty
+    with _cache_lock:
+        _gene_cache = {}
+        _gene_cache_dirty = False
+        GENE_CACHE_PATH.unlink(missing_ok=True)
+        SEQUENCE_CACHE_PATH.unlink(missing_ok=True)
+        _init_sequence_db.cache_clear()
+
+
+def _fetch_gene_info_uncached(gene_symbols: list[str], species: str) -> list[dict | None]:
+    """Resolve symbols via NCBI Datasets, then E-utilities.
+
+    Datasets answers a whole batch in one GET. Symbols it does not return
+    (aliases, unknown species, errors) go through the E-utilities path, which
+    is also used for everything when ``CRISPRAIRS_USE_ENTREZ=1``.
+    """
+    taxid = _taxid(species)
+    found: dict[str, dict] = {}
+    if taxid and os.getenv("CRISPRAIRS_USE_ENTREZ") != "1":
+        found.update(_fetch_gene_info_datasets(gene_symbols, taxid))
+
+    remaining = [symbol for symbol in gene_symbols if symbol not in found]
+    if remaining:
+        found.update(
+            (symbol, record)
+            for symbol, record in zip(remaining, _fetch_gene_info_eutils(remaining, species))
+            if record
+        )
+    return [found.get(symbol) for symbol in gene_symbols]
+
+
+@functools.lru_cache(maxsize=1)
+def _gene_index() -> sqlite3.Connection | None:
+    """Open the offline gene index read-only, or return None if it is absent."""
+    if not GENE_INDEX_PATH.is_file():
+        return None
     try:
-        Entrez = _configure_entrez()
-
-        taxid = SPECIES_TAXID.get(species.lower(), "")
-        query = f"{gene_symbol}[Gene Name]"
-        if taxid:
-            query += f" AND {taxid}[Taxonomy ID]"
-
-        # Search for gene ID
-        with Entrez.esearch(db="gene", term=query, retmax=1) as handle:
-            search_results = Entrez.read(handle)
-
-        id_list = search_results.get("IdList", [])
-        if not id_list:
-            logger.warning("No NCBI gene found for %s (%s)", gene_symbol, species)
-            return None
-
-        gene_id = id_list[0]
-
-        # Fetch gene summary
-        with Entrez.esummary(db="gene", id=gene_id, retmode="json") as handle:
-            import json
-            summary_data = json.loads(handle.read())
-
-        result = summary_data.get("result", {}).get(str(gene_id), {})
-
-        return {
-            "gene_id": gene_id,
-            "symbol": result.get("name", gene_symbol),
-            "full_name": result.get("description", ""),
-            "chromosome": result.get("chromosome", ""),
-            "organism": result.get("organism", {}).get("scientificname", species),
-            "aliases": result.get("otheraliases", ""),
-            "summary": result.get("summary", ""),
-            "genomic_info": result.get("genomicinfo", []),
-        }
-
-    except ImportError:
-        logger.error("Biopython is required: pip install biopython")
+        conn = sqlite3.connect(
+            f"{GENE_INDEX_PATH.as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.execute(f"PRAGMA mmap_size={GENE_INDEX_MMAP_BYTES}")
+    except sqlite3.Error as e:
+        logger.warning("NCBI gene index unavailable: %s", e)
         return None
+    return conn
+
+
+def _fetch_gene_info_index(gene_symbols: list[str], taxid: str) -> dict[str, dict]:
+    """Look symbols up in the offline gene index.
+
+    Matching is case-insensitive, but a symbol with the exact requested case
+    wins over case variants (Drosophila and C. elegans have genes whose
+    symbols differ only in case). Index records carry no RefSeq summary or
+    genomic coordinates, so those fields are empty.
+    """
+    conn = _gene_index()
+    if conn is None:
+        return {}
+    placeholders = ", ".join("?" * len(gene_symbols))
+    try:
+        rows = conn.execute(
+            "SELECT symbol, gene_id, description, chromosome, synonyms, organism "
+            f"FROM gene WHERE tax_id = ? AND symbol COLLATE NOCASE IN ({placeholders}) "
+            "ORDER BY symbol",
+            (taxid, *gene_symbols),
+        ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning("NCBI gene index lookup failed: %s", e)
+        return {}
+
+    exact = {row[0]: row for row in rows}
+    folded: dict[str, tuple] = {}
+    for row in rows:
+        folded.setdefault(row[0].upper(), row)
+    found: dict[str, dict] = {}
+    for symbol in gene_symbols:
+        row = exact.get(symbol) or folded.get(symbol.upper())
+        if row:
+            found[symbol] = {
+                "gene_id": row[1],
+                "symbol": row[0],
+                "full_name": row[2],
+                "chromosome": row[3],
+                "organism": row[5],
+                "aliases": row[4],
+                "summary": "",
+                "genomic_info": [],
+            }
+    return found
+
+
+def _fetch_gene_info_datasets(gene_symbols: list[str], taxid: str) -> dict[str, dict]:
+    """Look symbols up with one Datasets v2 gene report request."""
+    symbols = ",".join(quote(symbol, safe="") for symbol in gene_symbols)
+    headers = {}
+    api_key = _eutils_params().get("api_key")
+    if api_key:
+        headers["api-key"] = api_key
+
+    _rate_limiter().wait()
+    try:
+        resp = _SESSION.get(
+            f"{DATASETS_URL}/gene/symbol/{symbols}/taxon/{taxid}",
+            headers=headers,
+            timeout=TIMEOUT,
+        )
+        if resp.status_code == 404:
+            return {}
+        resp.raise_for_status()
+        reports = loads(resp.content).get("reports", [])
+    except Exception as e:
+        logger.warning("NCBI Datasets lookup failed, using E-utilities: %s", e)
+        return {}
+
+    wanted = {symbol.upper(): symbol for symbol in gene_symbols}
+    found: dict[str, dict] = {}
+    for report in reports:
+        # A malformed report is skipped; its symbols fall back to E-utilities.
+        try:
+            gene = report.get("gene") or {}
+            for query in report.get("query") or [gene.get("symbol", "")]:
+                symbol = wanted.get(str(query).upper())
+                if symbol and symbol not in found and gene.get("gene_id"):
+                    found[symbol] = _datasets_gene_record(gene, symbol)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Skipping malformed NCBI Datasets gene report: %r", e)
+    return found
+
+
+def _datasets_gene_record(gene: dict, gene_symbol: str) -> dict:
+    """Map a Datasets gene report onto the ``_gene_record`` shape."""
+    summaries = gene.get("summary") or []
+    genomic_info = []
+    for genomic_range in gene.get("genomic_ranges") or []:
+        for span in genomic_range.get("range") or []:
+            start, stop = int(span["begin"]) - 1, int(span["end"]) - 1
+            if span.get("orientation") == "minus":
+                start, stop = stop, start
+            genomic_info.append({
+                "chraccver": genomic_range.get("accession_version", ""),
+                "chrstart": start,
+                "chrstop": stop,
+            })
+    return {
+        "gene_id": str(gene["gene_id"]),
+        "symbol": gene.get("symbol", gene_symbol),
+        "full_name": gene.get("description", ""),
+        "chromosome": ", ".join(gene.get("chromosomes") or []),
+        "organism": gene.get("taxname", ""),
+        "aliases": ", ".join(gene.get("synonyms") or []),
+        "summary": summaries[0].get("description", "") if summaries else "",
+        "genomic_info": genomic_info,
+    }
+
+
+def _fetch_gene_info_eutils(gene_symbols: list[str], species: str) -> list[dict | None]:
+    missing: list[dict | None] = [None] * len(gene_symbols)
+    taxid = _taxid(species)
+
+    try:
+        candidate_ids = _esearch(
+            "gene",
+            _gene_query(gene_symbols, taxid),
+            retmax=len(gene_symbols) * SEARCH_HITS_PER_SYMBOL,
+        )
+        summaries = _esummary("gene", candidate_ids) if candidate_ids else {}
+    except Exception as e:
+        logger.error("NCBI E-utilities error for %s: %s", ", ".join(gene_symbols), e)
+        return missing
+
+    gene_ids = _match_symbols(gene_symbols, candidate_ids, summaries)
+
+    # Aliases and other non-official names keep the old top-hit behaviour.
+    unmatched = [symbol for symbol in gene_symbols if symbol not in gene_ids]
+    if unmatched and len(gene_symbols) == 1:
+        # The batched query was already the single-symbol query.
+        if candidate_ids:
+            gene_ids[gene_symbols[0]] = candidate_ids[0]
+        else:
+            logger.warning("No NCBI gene found for %s (%s)", gene_symbols[0], species)
+    elif unmatched:
+        workers = min(MAX_SEARCH_WORKERS, len(unmatched))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            found = pool.map(lambda symbol: _search_gene_id(symbol, taxid, species), unmatched)
+            gene_ids.update((s, gid) for s, gid in zip(unmatched, found) if gid)
+
+        extra_ids = list(dict.fromkeys(g for g in gene_ids.values() if g not in summaries))
+        if extra_ids:
+            try:
+                summaries.update(_esummary("gene", extra_ids))
+            except Exception as e:
+                logger.error("NCBI E-utilities error for %s: %s", ", ".join(unmatched), e)
+
+    records: list[dict | None] = []
+    for symbol in gene_symbols:
+        gene_id = gene_ids.get(symbol)
+        if gene_id and gene_id in summaries:
+            records.append(_gene_record(gene_id, summaries[gene_id], symbol, species))
+        else:
+            records.append(None)
+    return records
+
+
+def _gene_query(gene_symbols: list[str], taxid: str) -> str:
+    query = " OR ".join(f"{symbol}[Gene Name]" for symbol in gene_symbols)
+    if len(gene_symbols) > 1:
+        query = f"({query})"
+    if taxid:
+        query += f" AND {taxid}[Taxonomy ID]"
+    return query
+
+
+def _match_symbols(
+    gene_symbols: list[str], candidate_ids: list[str], summaries: dict
+) -> dict[str, str]:
+    """Map each symbol to the best-ranked candidate whose official name matches."""
+    by_name: dict[str, str] = {}
+    for gene_id in candidate_ids:
+        summary = summaries.get(gene_id)
+        if isinstance(summary, dict) and summary.get("name"):
+            by_name.setdefault(summary["name"].upper(), gene_id)
+    return {
+        symbol: by_name[symbol.upper()] for symbol in gene_symbols if symbol.upper() in by_name
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _taxid(species: str) -> str:
+    return SPECIES_TAXID.get(species.lower(), "")
+
+
+def _gene_cache_key(gene_symbol: str, species: str) -> str:
+    return f"{species}|{gene_symbol}"
+
+
+def _load_gene_cache() -> dict[str, dict]:
+    """Return the in-memory gene cache, reading it from disk on first use."""
+    global _gene_cache
+    if _gene_cache is None:
+        try:
+            data = loads(GENE_CACHE_PATH.read_bytes())
+        except (OSError, ValueError):
+            data = {}
+        _gene_cache = data if isinstance(data, dict) else {}
+    return _gene_cache
+
+
+def _store_gene_records(records: dict[str, dict]) -> None:
+    global _gene_cache_dirty
+    if not records:
+        return
+    with _cache_lock:
+        _load_gene_cache().update(records)
+        _gene_cache_dirty = True
+
+
+@atexit.register
+def _flush_gene_cache() -> None:
+    global _gene_cache_dirty
+    with _cache_lock:
+        if not _gene_cache_dirty or _gene_cache is None:
+            return
+        try:
+            GENE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            GENE_CACHE_PATH.write_text(json.dumps(_gene_cache), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not write NCBI gene cache: %s", e)
+            return
+        _gene_cache_dirty = False
+
+
+def _search_gene_id(gene_symbol: str, taxid: str, species: str) -> str | None:
+    """Resolve one gene symbol to its top NCBI Gene ID via esearch."""
+    query = f"{gene_symbol}[Gene Name]"
+    if taxid:
+        query += f" AND {taxid}[Taxonomy ID]"
+
+    try:
+        id_list = _esearch("gene", query, retmax=1)
     except Exception as e:
-        logger.error("NCBI Entrez error for %s: %s", gene_symbol, e)
+        logger.error("NCBI E-utilities error for %s: %s", gene_symbol, e)
+        return None
+
+    if not id_list:
+        logger.warning("No NCBI gene found for %s (%s)", gene_symbol, species)
         return None
+    return id_list[0]
+
+
+def _gene_record(gene_id: str, result: dict, gene_symbol: str, species: str) -> dict:
+    return {
+        "gene_id": gene_id,
+        "symbol": result.get("name", gene_symbol),
+        "full_name": result.get("description", ""),
+        "chromosome": result.get("chromosome", ""),
+        "organism": result.get("organism", {}).get("scientificname", species),
+        "aliases": result.get("otheraliases", ""),
+        "summary": result.get("summary", ""),
+        "genomic_info": result.get("genomicinfo", []),
+    }
 
 
 def fetch_gene_sequence(gene_id: str, seq_type: str = "genomic") -> str | None:
-    """Fetch nucleotide sequence for a gene via Entrez efetch.
+    """Fetch nucleotide sequence for a gene via E-utilities elink + efetch.
 
     Args:
         gene_id: NCBI Gene ID.
@@ -102,63 +629,135 @@ def fetch_gene_sequence(gene_id: str, seq_type: str = "genomic") -> str | None:
     Returns:
         Sequence string or None on failure.
     """
-    try:
-        Entrez = _configure_entrez()
+    return fetch_gene_sequence_batch([gene_id], seq_type=seq_type)[0]
 
-        with Entrez.elink(dbfrom="gene", db="nuccore", id=gene_id) as handle:
-            link_data = Entrez.read(handle)
 
-        nuccore_ids = _extract_nuccore_ids(link_data, seq_type=seq_type)
-        if not nuccore_ids:
-            logger.warning("No linked nuccore records found for gene %s", gene_id)
-            return None
+def fetch_gene_sequence_batch(gene_ids: list[str], seq_type: str = "genomic") -> list[str | None]:
+    """Fetch sequences for several genes with one elink and one efetch.
 
-        with Entrez.efetch(
-            db="nuccore", id=nuccore_ids[0], rettype="fasta", retmode="text"
-        ) as handle:
-            from Bio import SeqIO
-            record = SeqIO.read(handle, "fasta")
-            return str(record.seq)
+    Args:
+        gene_ids: NCBI Gene IDs.
+        seq_type: Sequence type applied to every gene.
 
-    except ImportError:
-        logger.error("Biopython is required: pip install biopython")
-        return None
+    Returns:
+        List aligned with ``gene_ids``; each entry is a sequence string or
+        None when no linked record was found or on failure.
+    """
+    keys = [f"{gene_id}|{seq_type.lower()}" for gene_id in gene_ids]
+    sequences = {key: _cached_sequence(key) for key in dict.fromkeys(keys)}
+    pending = list(dict.fromkeys(g for g, k in zip(gene_ids, keys) if sequences[k] is None))
+
+    if pending:
+        fetched = _fetch_sequences_uncached(pending, seq_type)
+        for gene_id, sequence in fetched.items():
+            key = f"{gene_id}|{seq_type.lower()}"
+            sequences[key] = sequence
+            _store_sequence(key, sequence)
+
+    return [sequences[key] for key in keys]
+
+
+def _fetch_sequences_uncached(gene_ids: list[str], seq_type: str) -> dict[str, str]:
+    label = ", ".join(gene_ids)
+    nuccore_for: dict[str, str] = {}
+    try:
+        links = _elink("gene", "nuccore", gene_ids)
+        for source_id, group in itertools.groupby(links, key=itemgetter(0)):
+            nuccore_ids = _extract_nuccore_ids(
+                ((name, linked_id) for _, name, linked_id in group), seq_type=seq_type
+            )
+            if nuccore_ids:
+                nuccore_for[source_id] = nuccore_ids[0]
     except Exception as e:
-        logger.error("NCBI sequence fetch error for %s: %s", gene_id, e)
+        logger.error("NCBI sequence fetch error for %s: %s", label, e)
+        return {}
+
+    for gene_id in gene_ids:
+        if gene_id not in nuccore_for:
+            logger.warning("No linked nuccore records found for gene %s", gene_id)
+    if not nuccore_for:
+        return {}
+
+    nuccore_ids = list(dict.fromkeys(nuccore_for.values()))
+    try:
+        records = _fasta_records(_efetch("nuccore", nuccore_ids, rettype="fasta"))
+    except Exception as e:
+        logger.error("NCBI sequence fetch error for %s: %s", label, e)
+        return {}
+    if len(records) != len(nuccore_ids):
+        logger.error(
+            "NCBI returned %d FASTA records for %d requested (%s)",
+            len(records), len(nuccore_ids), label,
+        )
+        return {}
+
+    by_nuccore = dict(zip(nuccore_ids, records))
+    return {gene_id: by_nuccore[nid] for gene_id, nid in nuccore_for.items() if by_nuccore[nid]}
+
+
+def _fasta_records(text: str) -> list[str]:
+    """Return the sequence of each record in a FASTA document, in order."""
+    records: list[list[str]] = []
+    for line in text.splitlines():
+        if line.startswith(">"):
+            records.append([])
+        elif records:
+            records[-1].append(line.strip())
+    return ["".join(lines) for lines in records]
+
+
+@functools.lru_cache(maxsize=8)
+def _init_sequence_db(path: Path) -> None:
+    """Create the sequence cache schema once per path, not on every lookup."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(path)) as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sequences (key TEXT PRIMARY KEY, seq TEXT NOT NULL)"
+        )
+
+
+def _sequence_db() -> sqlite3.Connection:
+    _init_sequence_db(SEQUENCE_CACHE_PATH)
+    return sqlite3.connect(SEQUENCE_CACHE_PATH)
+
+
+def _cached_sequence(key: str) -> str | None:
+    try:
+        with closing(_sequence_db()) as conn:
+            row = conn.execute("SELECT seq FROM sequences WHERE key = ?", (key,)).fetchone()
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("NCBI sequence cache unavailable: %s", e)
         return None
+    return row[0] if row else None
 
 
-def _extract_nuccore_ids(link_data, seq_type: str = "genomic") -> list[str]:
-    """Extract nuccore IDs from Entrez.elink results."""
-    preferred = {
-        "genomic": ("gene_nuccore_refseqgenomic", "gene_nuccore_genomic"),
-        "rna": ("gene_nuccore_refseqrna", "gene_nuccore_rna"),
-    }
-    wanted = preferred.get(seq_type.lower(), ())
+def _store_sequence(key: str, sequence: str) -> None:
+    try:
+        with closing(_sequence_db()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO sequences VALUES (?, ?)", (key, sequence))
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("Could not write NCBI sequence cache: %s", e)
+
+
+def _extract_nuccore_ids(
+    links: Iterable[tuple[str, str]], seq_type: str = "genomic"
+) -> list[str]:
+    """Pick nuccore IDs from ``(lowercased link name, ID)`` pairs.
+
+    IDs from the link names preferred for ``seq_type`` win; any linked ID is
+    the fallback.
+    """
+    wanted = _PREFERRED_LINKS.get(seq_type.lower(), ())
 
     selected = []
     fallback = []
+    for name, linked_id in links:
+        fallback.append(linked_id)
+        if wanted and any(key in name for key in wanted):
+            selected.append(linked_id)
 
-    for entry in link_data or []:
-        for db in entry.get("LinkSetDb", []):
-            name = str(db.get("LinkName", "")).lower()
-            ids = [str(link.get("Id")) for link in db.get("Link", []) if link.get("Id")]
-            if not ids:
-                continue
-            fallback.extend(ids)
-            if wanted and any(key in name for key in wanted):
-                selected.extend(ids)
-
-    if selected:
-        return _dedupe_preserve_order(selected)
-    return _dedupe_preserve_order(fallback)
+    return _dedupe_preserve_order(selected or fallback)
 
 
 def _dedupe_preserve_order(items: list[str]) -> list[str]:
-    seen = set()
-    out = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            out.append(item)
-    return out
+    return list(dict.fromkeys(items))
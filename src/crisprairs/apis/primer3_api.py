@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
+from types import ModuleType
 
 logger = logging.getLogger(__name__)
 
@@ -21,21 +22,19 @@ DEFAULT_PARAMS = {
 }
 
 
-@dataclass(frozen=True)
-class _TargetSpec:
-    template: str
-    start: int
-    length: int
+@functools.lru_cache(maxsize=1)
+def _primer3() -> ModuleType | None:
+    """Import `primer3` once, returning None when it is not installed."""
+    try:
+        import primer3
+    except ImportError:
+        return None
+    return primer3
 
 
 def check_available() -> bool:
     """True when `primer3` can be imported."""
-    try:
-        import primer3  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
+    return _primer3() is not None
 
 
 def design_primers(
@@ -45,24 +44,16 @@ def design_primers(
     num_return: int = 3,
 ) -> list[dict]:
     """Return primer candidate dictionaries from Primer3 output."""
-    if not check_available():
+    primer3 = _primer3()
+    if primer3 is None:
         logger.warning("primer3-py not installed. Install with: pip install primer3-py")
         return []
 
-    import primer3
-
-    target = _TargetSpec(
-        template=target_sequence,
-        start=target_start,
-        length=target_length,
-    )
-
     seq_args = {
-        "SEQUENCE_TEMPLATE": target.template,
-        "SEQUENCE_TARGET": [target.start, target.length],
+        "SEQUENCE_TEMPLATE": target_sequence,
+        "SEQUENCE_TARGET": [target_start, target_length],
     }
-    global_args = dict(DEFAULT_PARAMS)
-    global_args["PRIMER_NUM_RETURN"] = num_return
+    global_args = {**DEFAULT_PARAMS, "PRIMER_NUM_RETURN": num_return}
 
     try:
         raw = primer3.design_primers(seq_args, global_args)
@@ -78,16 +69,33 @@ def _parse_primer3_result(raw: dict) -> list[dict]:
     output = []
 
     for idx in range(total):
-        output.append(
-            {
-                "forward_seq": raw.get(f"PRIMER_LEFT_{idx}_SEQUENCE", ""),
-                "forward_tm": round(float(raw.get(f"PRIMER_LEFT_{idx}_TM", 0) or 0), 1),
-                "forward_gc": round(float(raw.get(f"PRIMER_LEFT_{idx}_GC_PERCENT", 0) or 0), 1),
-                "reverse_seq": raw.get(f"PRIMER_RIGHT_{idx}_SEQUENCE", ""),
-                "reverse_tm": round(float(raw.get(f"PRIMER_RIGHT_{idx}_TM", 0) or 0), 1),
-                "reverse_gc": round(float(raw.get(f"PRIMER_RIGHT_{idx}_GC_PERCENT", 0) or 0), 1),
-                "product_size": int(raw.get(f"PRIMER_PAIR_{idx}_PRODUCT_SIZE", 0) or 0),
-            }
-        )
+        pair = {}
+        for out_key, template, convert in _PRIMER_FIELDS:
+            pair[out_key] = convert(raw.get(template.format(idx)))
+        output.append(pair)
 
     return output
+
+
+def _as_sequence(value) -> str:
+    return "" if value is None else value
+
+
+def _round1(value) -> float:
+    return round(float(value or 0), 1)
+
+
+def _as_int(value) -> int:
+    return int(value or 0)
+
+
+# (output key, Primer3 result key template, converter) per primer-pair field
+_PRIMER_FIELDS = (
+    ("forward_seq", "PRIMER_LEFT_{}_SEQUENCE", _as_sequence),
+    ("forward_tm", "PRIMER_LEFT_{}_TM", _round1),
+    ("forward_gc", "PRIMER_LEFT_{}_GC_PERCENT", _round1),
+    ("reverse_seq", "PRIMER_RIGHT_{}_SEQUENCE", _as_sequence),
+    ("reverse_tm", "PRIMER_RIGHT_{}_TM", _round1),
+    ("reverse_gc", "PRIMER_RIGHT_{}_GC_PERCENT", _round1),
+    ("product_size", "PRIMER_PAIR_{}_PRODUCT_SIZE", _as_int),
+)
@@ -5,16 +5,21 @@ Launch with: python -m crisprairs.app
 
 from __future__ import annotations
 
+import atexit
+import io
 import logging
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import gradio as gr
 
+from crisprairs._json import dumps, loads
 from crisprairs.engine.context import SessionContext
 from crisprairs.engine.runner import PipelineRunner
-from crisprairs.engine.workflow import Router, StepResult
+from crisprairs.engine.workflow import Router, StepResult, WorkflowStep
 from crisprairs.rpw.audit import AuditLog
 from crisprairs.rpw.feedback import FeedbackCollector
 from crisprairs.rpw.protocols import ProtocolGenerator
@@ -28,20 +33,11 @@ EXPORTS_DIR = Path("exports")
 # Router setup — register all workflow modalities
 # ---------------------------------------------------------------------------
 
-def _build_router() -> Router:
-    from crisprairs.workflows.activation_repression import (
-        ActRepEntry,
-        ActRepGuideDesign,
-        ActRepSystemSelect,
-        ActRepTarget,
-    )
+# Each factory imports only the workflow modules its modality needs; the
+# router calls it the first time that modality is started.
+
+def _knockout_steps() -> list[WorkflowStep]:
     from crisprairs.workflows.automation import AutomationStep
-    from crisprairs.workflows.base_editing import (
-        BaseEditingEntry,
-        BaseEditingGuideDesign,
-        BaseEditingSystemSelect,
-        BaseEditingTarget,
-    )
     from crisprairs.workflows.delivery import DeliveryEntry, DeliverySelect
     from crisprairs.workflows.evidence import EvidenceRiskStep, EvidenceScanStep
     from crisprairs.workflows.knockout import (
@@ -49,77 +45,124 @@ def _build_router() -> Router:
         KnockoutGuideSelection,
         KnockoutTargetInput,
     )
-    from crisprairs.workflows.off_target import (
-        OffTargetEntry,
-        OffTargetInput,
-        OffTargetReport,
-        OffTargetScoring,
-    )
-    from crisprairs.workflows.prime_editing import (
-        PrimeEditingEntry,
-        PrimeEditingGuideDesign,
-        PrimeEditingSystemSelect,
-        PrimeEditingTarget,
-    )
-    from crisprairs.workflows.troubleshoot import (
-        TroubleshootAdvise,
-        TroubleshootDiagnose,
-        TroubleshootEntry,
-    )
     from crisprairs.workflows.validation import (
         BlastCheckStep,
         PrimerDesignStep,
         ValidationEntry,
     )
 
-    router = Router()
-
-    router.register("knockout", [
+    return [
         KnockoutTargetInput(), EvidenceScanStep(), KnockoutGuideDesign(), KnockoutGuideSelection(),
         DeliveryEntry(), DeliverySelect(),
         ValidationEntry(), PrimerDesignStep(), BlastCheckStep(),
         EvidenceRiskStep(),
         AutomationStep(),
-    ])
+    ]
+
+
+def _base_editing_steps() -> list[WorkflowStep]:
+    from crisprairs.workflows.base_editing import (
+        BaseEditingEntry,
+        BaseEditingGuideDesign,
+        BaseEditingSystemSelect,
+        BaseEditingTarget,
+    )
+    from crisprairs.workflows.delivery import DeliveryEntry, DeliverySelect
+    from crisprairs.workflows.evidence import EvidenceRiskStep, EvidenceScanStep
+    from crisprairs.workflows.validation import (
+        BlastCheckStep,
+        PrimerDesignStep,
+        ValidationEntry,
+    )
 
-    router.register("base_editing", [
+    return [
         BaseEditingEntry(), BaseEditingSystemSelect(), BaseEditingTarget(),
         EvidenceScanStep(),
         BaseEditingGuideDesign(),
         DeliveryEntry(), DeliverySelect(),
         ValidationEntry(), PrimerDesignStep(), BlastCheckStep(), EvidenceRiskStep(),
-    ])
+    ]
+
+
+def _prime_editing_steps() -> list[WorkflowStep]:
+    from crisprairs.workflows.delivery import DeliveryEntry, DeliverySelect
+    from crisprairs.workflows.evidence import EvidenceRiskStep, EvidenceScanStep
+    from crisprairs.workflows.prime_editing import (
+        PrimeEditingEntry,
+        PrimeEditingGuideDesign,
+        PrimeEditingSystemSelect,
+        PrimeEditingTarget,
+    )
+    from crisprairs.workflows.validation import (
+        BlastCheckStep,
+        PrimerDesignStep,
+        ValidationEntry,
+    )
 
-    router.register("prime_editing", [
+    return [
         PrimeEditingEntry(), PrimeEditingSystemSelect(), PrimeEditingTarget(),
         EvidenceScanStep(),
         PrimeEditingGuideDesign(),
         DeliveryEntry(), DeliverySelect(),
         ValidationEntry(), PrimerDesignStep(), BlastCheckStep(), EvidenceRiskStep(),
-    ])
+    ]
 
-    router.register("activation", [
-        ActRepEntry(), ActRepSystemSelect(), ActRepTarget(), EvidenceScanStep(),
-        ActRepGuideDesign(),
-        DeliveryEntry(), DeliverySelect(), EvidenceRiskStep(),
-    ])
 
-    router.register("repression", [
+def _activation_repression_steps() -> list[WorkflowStep]:
+    from crisprairs.workflows.activation_repression import (
+        ActRepEntry,
+        ActRepGuideDesign,
+        ActRepSystemSelect,
+        ActRepTarget,
+    )
+    from crisprairs.workflows.delivery import DeliveryEntry, DeliverySelect
+    from crisprairs.workflows.evidence import EvidenceRiskStep, EvidenceScanStep
+
+    return [
         ActRepEntry(), ActRepSystemSelect(), ActRepTarget(), EvidenceScanStep(),
         ActRepGuideDesign(),
         DeliveryEntry(), DeliverySelect(), EvidenceRiskStep(),
-    ])
+    ]
+
 
-    router.register("off_target", [
+def _off_target_steps() -> list[WorkflowStep]:
+    from crisprairs.workflows.evidence import EvidenceRiskStep, EvidenceScanStep
+    from crisprairs.workflows.off_target import (
+        OffTargetEntry,
+        OffTargetInput,
+        OffTargetReport,
+        OffTargetScoring,
+    )
+
+    return [
         OffTargetEntry(), OffTargetInput(), EvidenceScanStep(), OffTargetScoring(),
         OffTargetReport(), EvidenceRiskStep(),
-    ])
+    ]
 
-    router.register("troubleshoot", [
+
+def _troubleshoot_steps() -> list[WorkflowStep]:
+    from crisprairs.workflows.evidence import EvidenceRiskStep, EvidenceScanStep
+    from crisprairs.workflows.troubleshoot import (
+        TroubleshootAdvise,
+        TroubleshootDiagnose,
+        TroubleshootEntry,
+    )
+
+    return [
         TroubleshootEntry(), EvidenceScanStep(), TroubleshootDiagnose(), TroubleshootAdvise(),
         EvidenceRiskStep(),
-    ])
+    ]
+
 
+def _build_router() -> Router:
+    router = Router()
+    router.register("knockout", _knockout_steps)
+    router.register("base_editing", _base_editing_steps)
+    router.register("prime_editing", _prime_editing_steps)
+    router.register("activation", _activation_repression_steps)
+    router.register("repression", _activation_repression_steps)
+    router.register("off_target", _off_target_steps)
+    router.register("troubleshoot", _troubleshoot_steps)
     return router
 
 
@@ -157,6 +200,8 @@ I can help you design and optimize CRISPR experiments. Choose a workflow to get
 Type a number or workflow name to begin.
 """
 
+UNRECOGNIZED_WORKFLOW_MESSAGE = "I didn't recognize that workflow. " + WELCOME_MESSAGE
+
 MODALITY_MAP = {
     "1": "knockout",
     "2": "base_editing",
@@ -234,6 +279,15 @@ def _normalize_history(history) -> list[dict[str, str]]:
     return normalized
 
 
+def _write_message(buf: io.StringIO, message: str) -> None:
+    """Append a step message to the reply buffer, skipping empty ones."""
+    if not message:
+        return
+    if buf.tell():
+        buf.write("\n\n")
+    buf.write(message)
+
+
 def _append_prompt_if_distinct(reply: str, prompt: str | None) -> str:
     """Append a step prompt unless it already exists in the reply text."""
     clean_prompt = (prompt or "").strip()
@@ -281,7 +335,7 @@ def chat_respond(message: str, history: list, state: dict | None):
             history.append({"role": "user", "content": message})
             history.append({
                 "role": "assistant",
-                "content": "I didn't recognize that workflow. " + WELCOME_MESSAGE,
+                "content": UNRECOGNIZED_WORKFLOW_MESSAGE,
             })
             return history, state
 
@@ -298,13 +352,13 @@ def chat_respond(message: str, history: list, state: dict | None):
         )
 
         # Collect all auto-advance messages
-        messages = [output.message]
+        buf = io.StringIO()
+        _write_message(buf, output.message)
         while output.result == StepResult.CONTINUE:
             output = runner.advance(ctx)
-            if output.message:
-                messages.append(output.message)
+            _write_message(buf, output.message)
 
-        reply = "\n\n".join(m for m in messages if m)
+        reply = buf.getvalue()
 
         if output.result == StepResult.WAIT_FOR_INPUT and runner.current_step:
             reply = _append_prompt_if_distinct(reply, runner.current_step.prompt_message)
@@ -332,18 +386,18 @@ def chat_respond(message: str, history: list, state: dict | None):
         history.append({"role": "assistant", "content": f"An error occurred: {e}"})
         return history, state
 
-    messages = [output.message]
+    buf = io.StringIO()
+    _write_message(buf, output.message)
 
     # Auto-advance through CONTINUE steps
     while output.result == StepResult.CONTINUE and not runner.is_done:
         try:
             output = runner.advance(ctx)
-            if output.message:
-                messages.append(output.message)
+            _write_message(buf, output.message)
         except Exception:
             break
 
-    reply = "\n\n".join(m for m in messages if m)
+    reply = buf.getvalue()
 
     if output.result == StepResult.WAIT_FOR_INPUT and runner.current_step:
         reply = _append_prompt_if_distinct(reply, runner.current_step.prompt_message)
@@ -361,18 +415,62 @@ def chat_respond(message: str, history: list, state: dict | None):
     return history, state
 
 
+# Session saves run on one background thread so a chat turn does not wait on
+# disk I/O. Only the newest snapshot per session is kept: a queued save that
+# has since been superseded finds nothing left to write.
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-writer")
+_PENDING: dict[str, bytes] = {}
+_PENDING_LOCK = threading.Lock()
+_WRITE_LOCK = threading.Lock()
+
+
 def _save_state(state, history):
-    """Persist session state to disk."""
+    """Queue a snapshot of session state to be persisted in the background.
+
+    The snapshot is JSON-encoded here, on the caller's thread: ``to_dict``
+    shares nested values such as literature hits with the live context, which
+    later steps keep mutating while the writer runs.
+    """
     try:
+        session_id = state["session_id"]
         ctx = state["ctx"]
-        SessionManager.save(
-            state["session_id"],
-            chat_history=history,
-            workflow_state=ctx.modality,
-            context_dict=ctx.to_dict(),
-        )
+        snapshot = dumps([history, ctx.modality, ctx.to_dict()])
     except Exception as e:
         logger.error("Session save error: %s", e)
+        return
+    with _PENDING_LOCK:
+        _PENDING[session_id] = snapshot
+    _WRITER.submit(_flush_session, session_id)
+
+
+def _flush_session(session_id):
+    """Write the latest queued snapshot for one session, if any."""
+    with _WRITE_LOCK:
+        with _PENDING_LOCK:
+            snapshot = _PENDING.pop(session_id, None)
+        if snapshot is None:
+            return
+        try:
+            history, workflow_state, context_dict = loads(snapshot)
+            SessionManager.save(
+                session_id,
+                chat_history=history,
+                workflow_state=workflow_state,
+                context_dict=context_dict,
+            )
+        except Exception as e:
+            logger.error("Session save error: %s", e)
+
+
+@atexit.register
+def _flush_all():
+    """Write every queued snapshot; also waits out a save already in progress."""
+    with _PENDING_LOCK:
+        session_ids = list(_PENDING)
+    for session_id in session_ids:
+        _flush_session(session_id)
+    with _WRITE_LOCK:
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -391,6 +489,7 @@ def export_session(state):
     """Export the full session as Markdown."""
     if state is None:
         return "No active session."
+    _flush_session(state["session_id"])
     return SessionManager.export_markdown(state["session_id"])
 
 
@@ -6,12 +6,13 @@ that holds all state accumulated during a pipeline run.
 
 from __future__ import annotations
 
+import functools
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class GuideRNA:
     """A single guide RNA candidate."""
 
@@ -25,7 +26,7 @@ class GuideRNA:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryInfo:
     """Delivery method selection results."""
 
@@ -36,7 +37,7 @@ class DeliveryInfo:
     alternatives: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimerPair:
     """A pair of validation primers."""
 
@@ -48,7 +49,7 @@ class PrimerPair:
     blast_status: str = ""  # "specific", "non-specific", "pending", "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionContext:
     """Typed, mutable session state shared across all pipeline steps.
 
@@ -109,8 +110,16 @@ class SessionContext:
     extra: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize to a plain dict for JSON persistence."""
-        return asdict(self)
+        """Serialize to a plain dict for JSON persistence.
+
+        Nested GuideRNA/DeliveryInfo/PrimerPair records become dicts and
+        container fields are copied one level deep, so this is cheaper than
+        ``asdict``. It is not an independent snapshot: values inside those
+        containers (chat turns, literature hits, result dicts) are the
+        context's own objects. Encode the result before another thread reads
+        it while the session keeps running.
+        """
+        return _record_to_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SessionContext:
@@ -135,6 +144,36 @@ class SessionContext:
             ]
 
         # Filter to known fields only
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _known_fields(cls)
         filtered = {k: v for k, v in data.items() if k in known}
         return cls(**filtered)
+
+
+_NESTED_RECORDS = (GuideRNA, DeliveryInfo, PrimerPair)
+
+
+@functools.cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+@functools.cache
+def _known_fields(cls: type) -> frozenset[str]:
+    return frozenset(_field_names(cls))
+
+
+def _record_to_dict(record: Any) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for name in _field_names(type(record)):
+        value = getattr(record, name)
+        if isinstance(value, list):
+            value = [
+                _record_to_dict(item) if isinstance(item, _NESTED_RECORDS) else item
+                for item in value
+            ]
+        elif isinstance(value, dict):
+            value = dict(value)
+        elif isinstance(value, _NESTED_RECORDS):
+            value = _record_to_dict(value)
+        out[name] = value
+    return out
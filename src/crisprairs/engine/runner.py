@@ -7,6 +7,7 @@ collecting user input when needed, handling branching, and tracking state.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from .workflow import Router, StepResult, WorkflowStep
@@ -43,11 +44,18 @@ class PipelineRunner:
 
     def __init__(self, router: Router) -> None:
         self._router = router
-        self._steps: list[WorkflowStep] = []
+        self._steps: Sequence[WorkflowStep] = ()
         self._cursor: int = 0
+        self._first_input: int = 0
         self._done: bool = False
         self._waiting: bool = False
         self._current_modality: str = ""
+        self._handlers = {
+            StepResult.CONTINUE: self._on_continue,
+            StepResult.DONE: self._on_done,
+            StepResult.BRANCH: self._on_branch,
+            StepResult.WAIT_FOR_INPUT: self._on_wait,
+        }
 
     @property
     def is_done(self) -> bool:
@@ -89,6 +97,7 @@ class PipelineRunner:
             The StepOutput from the first step (or a prompt message if input needed).
         """
         self._steps = self._router.get(modality)
+        self._first_input = self._router.first_input_index(modality)
         self._cursor = 0
         self._done = False
         self._waiting = False
@@ -142,54 +151,73 @@ class PipelineRunner:
         step = self._steps[self._cursor]
         logger.info("User input received for step: %s", step.name)
         output = step.execute(ctx, user_input=user_input)
-        return self._handle_output(ctx, output)
+        handled = self._handle_output(ctx, output)
+        if handled is not None:
+            return handled
+        return self._run_current(ctx)
 
     def _run_current(self, ctx: SessionContext) -> StepOutput:
-        """Execute the current step, handling input-needed pauses."""
-        step = self._steps[self._cursor]
-        logger.info("Executing step %d/%d: %s", self._cursor + 1, len(self._steps), step.name)
+        """Execute steps from the cursor until one pauses, finishes or branches.
 
-        if step.needs_input:
-            self._waiting = True
-            from .workflow import StepOutput
-            return StepOutput(
-                result=StepResult.WAIT_FOR_INPUT,
-                message=step.prompt_message,
-            )
-
-        output = step.execute(ctx)
-        return self._handle_output(ctx, output)
-
-    def _handle_output(self, ctx: SessionContext, output: StepOutput) -> StepOutput:
-        """Process a step's output and determine next action."""
-        if output.result == StepResult.DONE:
-            # If this is the last step, the pipeline is done.
-            # Otherwise, treat DONE as "this step is finished" and advance.
-            if self._cursor >= len(self._steps) - 1:
-                self._done = True
-                logger.info("Pipeline done.")
-                return output
-            # Not the last step — auto-advance like CONTINUE
-            self._cursor += 1
-            return self._run_current(ctx)
-
-        if output.result == StepResult.BRANCH:
-            if not output.branch_to:
-                raise ValueError("StepOutput with BRANCH result must set branch_to.")
-            logger.info("Branching to modality: %s", output.branch_to)
-            return self.start(output.branch_to, ctx)
-
-        if output.result == StepResult.WAIT_FOR_INPUT:
-            self._waiting = True
+        Auto-advancing steps are run in a loop rather than by recursion, so a
+        long run of non-input steps does not grow the call stack.
+        """
+        while True:
+            step = self._steps[self._cursor]
+            logger.info("Executing step %d/%d: %s", self._cursor + 1, len(self._steps), step.name)
+
+            # Steps before the router's precomputed first input step never
+            # need input, so the property is only consulted from there on.
+            if self._cursor >= self._first_input and step.needs_input:
+                self._waiting = True
+                from .workflow import StepOutput
+                return StepOutput(
+                    result=StepResult.WAIT_FOR_INPUT,
+                    message=step.prompt_message,
+                )
+
+            output = step.execute(ctx)
+            handled = self._handle_output(ctx, output)
+            if handled is not None:
+                return handled
+
+    def _handle_output(self, ctx: SessionContext, output: StepOutput) -> StepOutput | None:
+        """Process a step's output and determine next action.
+
+        Returns the output to hand back to the caller, or None when the cursor
+        has moved on and the next step should run.
+        """
+        handler = self._handlers.get(output.result)
+        if handler is None:
             return output
+        return handler(ctx, output)
 
-        # CONTINUE — auto-advance
-        if output.result == StepResult.CONTINUE:
-            self._cursor += 1
-            if self._cursor >= len(self._steps):
-                self._done = True
-                output.result = StepResult.DONE
-                return output
-            return self._run_current(ctx)
+    def _on_done(self, ctx: SessionContext, output: StepOutput) -> StepOutput | None:
+        # If this is the last step, the pipeline is done.
+        # Otherwise, treat DONE as "this step is finished" and advance.
+        if self._cursor >= len(self._steps) - 1:
+            self._done = True
+            logger.info("Pipeline done.")
+            return output
+        # Not the last step — auto-advance like CONTINUE
+        self._cursor += 1
+        return None
+
+    def _on_branch(self, ctx: SessionContext, output: StepOutput) -> StepOutput:
+        if not output.branch_to:
+            raise ValueError("StepOutput with BRANCH result must set branch_to.")
+        logger.info("Branching to modality: %s", output.branch_to)
+        return self.start(output.branch_to, ctx)
 
+    def _on_wait(self, ctx: SessionContext, output: StepOutput) -> StepOutput:
+        self._waiting = True
         return output
+
+    def _on_continue(self, ctx: SessionContext, output: StepOutput) -> StepOutput | None:
+        # CONTINUE — auto-advance
+        self._cursor += 1
+        if self._cursor >= len(self._steps):
+            self._done = True
+            output.result = StepResult.DONE
+            return output
+        return None
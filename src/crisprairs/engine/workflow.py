@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import enum
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -46,6 +47,11 @@ class WorkflowStep(ABC):
 
     Subclasses implement ``execute()`` which receives the session context
     and (optionally) user input, and returns a ``StepOutput``.
+
+    Step instances are built once per router and shared by every session, so
+    they must not hold per-session state. Configuration fixed at construction
+    is fine; anything a run produces belongs on the ``SessionContext``
+    (``ctx.extra`` for anything workflow-specific).
     """
 
     @property
@@ -91,42 +97,82 @@ class Router:
 
         router = Router()
         router.register("knockout", [CasSelectionStep(), GuideDesignStep(), ...])
+        router.register("troubleshoot", _troubleshoot_steps)  # built on first get()
         steps = router.get("knockout")
     """
 
     def __init__(self) -> None:
-        self._routes: dict[str, list[WorkflowStep]] = {}
+        self._routes: dict[str, tuple[WorkflowStep, ...]] = {}
+        self._factories: dict[str, Callable[[], Sequence[WorkflowStep]]] = {}
+        self._first_input: dict[str, int] = {}
 
-    def register(self, modality: str, steps: list[WorkflowStep]) -> None:
+    def register(
+        self,
+        modality: str,
+        steps: Sequence[WorkflowStep] | Callable[[], Sequence[WorkflowStep]],
+    ) -> None:
         """Register a step sequence for a modality.
 
         Args:
             modality: Canonical name (e.g. "knockout", "base_editing").
-            steps: Ordered list of WorkflowStep instances.
+            steps: Ordered WorkflowStep instances, or a zero-argument factory
+                returning them. A factory is called on the first ``get()``
+                for the modality and its result is reused. Steps are stored
+                as a tuple, so the sequence cannot change after registration.
         """
-        self._routes[modality.lower()] = steps
-
-    def get(self, modality: str) -> list[WorkflowStep]:
+        key = modality.lower()
+        self._routes.pop(key, None)
+        self._factories.pop(key, None)
+        self._first_input.pop(key, None)
+        if callable(steps):
+            self._factories[key] = steps
+        else:
+            self._set_route(key, steps)
+
+    def get(self, modality: str) -> Sequence[WorkflowStep]:
         """Retrieve the step sequence for a modality.
 
         Args:
             modality: Canonical name.
 
         Returns:
-            List of WorkflowStep instances.
+            Tuple of WorkflowStep instances.
 
         Raises:
             KeyError: If the modality is not registered.
         """
         key = modality.lower()
-        if key not in self._routes:
-            raise KeyError(
-                f"Unknown modality '{modality}'. "
-                f"Available: {', '.join(sorted(self._routes))}"
-            )
-        return self._routes[key]
+        if key in self._routes:
+            return self._routes[key]
+        if key in self._factories:
+            # The factory stays registered so a concurrent first get() also
+            # succeeds; at worst the steps are built twice.
+            return self._set_route(key, self._factories[key]())
+        raise KeyError(
+            f"Unknown modality '{modality}'. "
+            f"Available: {', '.join(self.modalities)}"
+        )
+
+    def first_input_index(self, modality: str) -> int:
+        """Index of the first step that needs input, or the step count if none do.
+
+        Computed once per step sequence, so runners can skip the
+        ``needs_input`` check for the auto-advancing steps before it.
+        """
+        key = modality.lower()
+        if key not in self._first_input:
+            self.get(key)
+        return self._first_input[key]
+
+    def _set_route(self, key: str, steps: Sequence[WorkflowStep]) -> tuple[WorkflowStep, ...]:
+        route = tuple(steps)
+        self._first_input[key] = next(
+            (i for i, step in enumerate(route) if step.needs_input), len(route)
+        )
+        self._routes[key] = route
+        return route
 
     @property
     def modalities(self) -> list[str]:
         """List all registered modality names."""
-        return sorted(self._routes.keys())
+        return sorted({*self._routes, *self._factories})
@@ -0,0 +1,229 @@
+"""Shared HTTP session and response cache for the literature clients."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+from crisprairs._json import dumps, loads
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path("~/.cache/crisprairs/literature.sqlite3").expanduser()
+CACHE_TTL = 6 * 60 * 60  # seconds; PubMed, PubTator and iCite data change slowly
+
+
+@functools.lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """Pooled keep-alive session, built on the first network request.
+
+    A literature scan makes several calls to the same few NCBI/NIH hosts, so
+    reusing connections saves a TLS handshake per call. ``requests`` is
+    imported here rather than at module load, so pipelines that never reach
+    a literature fetch do not pay for it. The endpoints are all read-only,
+    so POSTs are retried too; 429/503 retries honour Retry-After. The pool
+    blocks when every connection is busy, so concurrent scans wait for a
+    warm connection instead of opening and then discarding extra ones.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["User-Agent"] = (
+        "crisprairs (+https://github.com/Tmmoore286/crispr-ai-research-suite)"
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            pool_block=True,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "POST"}),
+            ),
+        ),
+    )
+    return session
+
+
+_local = threading.local()
+
+
+def get_json(
+    url: str,
+    params: dict[str, Any],
+    timeout: float,
+    *,
+    cache_bypass: bool = False,
+    throttle: Callable[[], None] | None = None,
+    identity: dict[str, str] | None = None,
+    cache: bool = True,
+):
+    """GET a JSON document, serving it from the disk cache while fresh.
+
+    ``cache_bypass`` skips the cached copy and refreshes it. ``cache=False``
+    neither reads nor writes the whole-response cache, for callers that
+    cache per-ID records with ``store_records`` instead. ``throttle`` is
+    called before each network request (not for cache hits). ``identity``
+    params (tool, email, API key) are sent with the request but left out of
+    the cache key, so keys are not stored in the cache and rotating them
+    keeps cached responses valid. Bodies are decoded with
+    ``crisprairs._json.loads`` (orjson when installed) and cached as
+    received. ``requests`` errors (``OSError`` subclasses) and ``ValueError``
+    for malformed JSON propagate; failures are not cached.
+    """
+    return _cached_json(
+        "GET", url, params, timeout, cache_bypass or not cache, throttle, identity, cache
+    )
+
+
+def post_json(
+    url: str,
+    data: dict[str, Any],
+    timeout: float,
+    *,
+    cache_bypass: bool = False,
+    throttle: Callable[[], None] | None = None,
+    identity: dict[str, str] | None = None,
+    cache: bool = True,
+):
+    """POST form ``data`` and return the JSON reply, cached like ``get_json``.
+
+    For read-only endpoints such as esummary whose ID lists can outgrow a URL.
+    """
+    return _cached_json(
+        "POST", url, data, timeout, cache_bypass or not cache, throttle, identity, cache
+    )
+
+
+def cached_records(namespace: str, ids: list[str]) -> dict[str, Any]:
+    """Return the fresh per-ID records saved by ``store_records``, keyed by ID.
+
+    Lets clients that batch IDs into one request fetch only the IDs no
+    earlier request has covered, whatever else that request asked for.
+    """
+    keys = {f"{namespace}:{record_id}": record_id for record_id in ids}
+    if not keys:
+        return {}
+    try:
+        with closing(_cache_db()) as conn:
+            rows = conn.execute(
+                "SELECT key, body FROM responses WHERE fetched_at > ? "
+                f"AND key IN ({', '.join('?' * len(keys))})",
+                (time.time() - CACHE_TTL, *keys),
+            ).fetchall()
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Literature cache unavailable: %s", exc)
+        return {}
+    return {keys[key]: loads(body) for key, body in rows}
+
+
+def store_records(namespace: str, records: dict[str, Any]) -> None:
+    """Cache one JSON record per ID for ``cached_records``."""
+    if not records:
+        return
+    now = time.time()
+    try:
+        with closing(_cache_db()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                [(f"{namespace}:{rid}", dumps(rec), now) for rid, rec in records.items()],
+            )
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Could not write literature cache: %s", exc)
+
+
+def served_from_cache() -> bool:
+    """True when the last request made for this thread used the cache."""
+    return getattr(_local, "from_cache", False)
+
+
+def _set_served_from_cache(from_cache: bool) -> None:
+    _local.from_cache = from_cache
+
+
+def _cached_json(
+    method: str,
+    url: str,
+    fields: dict[str, Any],
+    timeout: float,
+    bypass: bool,
+    throttle: Callable[[], None] | None,
+    identity: dict[str, str] | None = None,
+    store: bool = True,
+):
+    key = f"{url}?{urlencode(sorted(fields.items()))}"
+    if method != "GET":
+        key = f"{method} {key}"
+    body = None if bypass else _cached_body(key)
+    _set_served_from_cache(body is not None)
+    if body is not None:
+        return loads(body)
+
+    if throttle is not None:
+        throttle()
+    if identity:
+        fields = {**fields, **identity}
+    if method == "GET":
+        response = _session().get(url, params=fields, timeout=timeout)
+    else:
+        response = _session().post(url, data=fields, timeout=timeout)
+    response.raise_for_status()
+    payload = loads(response.content)
+    if store:
+        _store_body(key, response.content)
+    return payload
+
+
+@functools.lru_cache(maxsize=8)
+def _init_cache_db(path: Path) -> None:
+    """Create the response cache schema once per path, not on every lookup."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(path)) as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL)"
+        )
+
+
+def _cache_db() -> sqlite3.Connection:
+    _init_cache_db(CACHE_PATH)
+    return sqlite3.connect(CACHE_PATH)
+
+
+def _cached_body(key: str) -> bytes | None:
+    try:
+        with closing(_cache_db()) as conn:
+            row = conn.execute(
+                "SELECT body FROM responses WHERE key = ? AND fetched_at > ?",
+                (key, time.time() - CACHE_TTL),
+            ).fetchone()
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Literature cache unavailable: %s", exc)
+        return None
+    return row[0] if row else None
+
+
+def _store_body(key: str, body: bytes) -> None:
+    try:
+        with closing(_cache_db()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, body, time.time())
+            )
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Could not write literature cache: %s", exc)
@@ -5,51 +5,71 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import requests
+from crisprairs.literature._http import cached_records, get_json, store_records
 
 logger = logging.getLogger(__name__)
 
 ICITE_API_URL = "https://icite.od.nih.gov/api/pubs"
 TIMEOUT = 10
+MAX_PMIDS_PER_REQUEST = 200  # iCite takes up to 1000; smaller batches keep GET URLs short
+CACHE_NAMESPACE = "icite"  # per-PMID keys in the literature response cache
 
 
-def fetch_icite_metrics(pmids: list[str]) -> dict[str, dict[str, Any]]:
-    """Fetch iCite metrics keyed by PMID."""
+def fetch_icite_metrics(
+    pmids: list[str], cache_bypass: bool = False
+) -> dict[str, dict[str, Any]]:
+    """Fetch iCite metrics keyed by PMID.
+
+    Metrics are cached per PMID, so only PMIDs missing from the cache are
+    requested, in as few comma-joined batches as iCite accepts. On a
+    request error the metrics gathered so far are returned.
+    """
     clean_pmids = [str(p) for p in pmids if str(p).strip()]
     if not clean_pmids:
         return {}
 
-    try:
-        response = requests.get(
-            ICITE_API_URL,
-            params={"pmids": ",".join(clean_pmids)},
-            timeout=TIMEOUT,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
-        logger.error("iCite request error: %s", exc)
-        return {}
-    except ValueError as exc:
-        logger.error("iCite JSON parse error: %s", exc)
-        return {}
+    out = {} if cache_bypass else cached_records(CACHE_NAMESPACE, clean_pmids)
+    missing = list(dict.fromkeys(pmid for pmid in clean_pmids if pmid not in out))
+
+    for start in range(0, len(missing), MAX_PMIDS_PER_REQUEST):
+        batch = missing[start : start + MAX_PMIDS_PER_REQUEST]
+        try:
+            payload = get_json(
+                ICITE_API_URL,
+                {"pmids": ",".join(batch)},
+                TIMEOUT,
+                cache=False,
+            )
+        except OSError as exc:  # requests errors subclass OSError
+            logger.error("iCite request error: %s", exc)
+            return out
+        except ValueError as exc:
+            logger.error("iCite JSON parse error: %s", exc)
+            return out
 
+        fetched = _parse_icite(payload)
+        store_records(CACHE_NAMESPACE, fetched)
+        out.update(fetched)
+    return out
+
+
+def _parse_icite(payload) -> dict[str, dict[str, Any]]:
     rows = payload.get("data") if isinstance(payload, dict) else payload
     if not isinstance(rows, list):
         return {}
 
-    out: dict[str, dict[str, Any]] = {}
+    fetched: dict[str, dict[str, Any]] = {}
     for row in rows:
         pmid = str(row.get("pmid", "")).strip()
         if not pmid:
             continue
-        out[pmid] = {
+        fetched[pmid] = {
             "rcr": _to_float(row.get("relative_citation_ratio") or row.get("rcr")),
             "apt": _to_float(row.get("apt")),
             "citations": _to_int(row.get("citation_count")),
             "year": _to_int(row.get("year")),
         }
-    return out
+    return fetched
 
 
 def _to_float(value) -> float | None:
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from collections import OrderedDict
+import threading
+from collections.abc import Callable
+from concurrent import futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
-import requests
+from crisprairs.literature._http import (
+    _set_served_from_cache,
+    cached_records,
+    get_json,
+    post_json,
+    store_records,
+)
 
 logger = logging.getLogger(__name__)
 
 EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 TIMEOUT = 10
+CACHE_NAMESPACE = "esummary"  # per-PMID keys in the literature response cache
 
 _MODALITY_TERMS = {
     "knockout": "gene knockout",
@@ -24,90 +36,219 @@ _MODALITY_TERMS = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _CtxView:
+    """Cleaned snapshot of the context fields a literature scan reads.
+
+    Built once per scan and accepted wherever a context is, so helpers
+    called with it skip the getattr/str/strip work. Being frozen, it also
+    keys the query cache.
+    """
+
+    target_gene: str = ""
+    species: str = ""
+    modality: str = ""
+    troubleshoot_issue: str = ""
+
+    @classmethod
+    def of(cls, ctx) -> _CtxView:
+        if isinstance(ctx, cls):
+            return ctx
+        return cls(
+            _clean(ctx, "target_gene"),
+            _clean(ctx, "species"),
+            _clean(ctx, "modality").lower(),
+            _clean(ctx, "troubleshoot_issue").replace("_", " "),
+        )
+
+
+def _clean(ctx, name: str) -> str:
+    return str(getattr(ctx, name, "") or "").strip()
+
+
 def build_query_from_context(ctx) -> str:
     """Build a focused PubMed query from session context."""
+    return _build_query(_CtxView.of(ctx))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_query(view: _CtxView) -> str:
     terms: list[str] = ["CRISPR"]
+    if view.target_gene:
+        terms.append(view.target_gene)
+    if view.species:
+        terms.append(view.species)
+    if view.modality in _MODALITY_TERMS:
+        terms.append(_MODALITY_TERMS[view.modality])
+    if view.troubleshoot_issue:
+        terms.append(view.troubleshoot_issue)
 
-    target_gene = str(getattr(ctx, "target_gene", "") or "").strip()
-    species = str(getattr(ctx, "species", "") or "").strip()
-    modality = str(getattr(ctx, "modality", "") or "").strip().lower()
-    issue = str(getattr(ctx, "troubleshoot_issue", "") or "").strip().replace("_", " ")
+    return " AND ".join(f"({term})" for term in dict.fromkeys(terms) if term)
 
-    if target_gene:
-        terms.append(target_gene)
-    if species:
-        terms.append(species)
-    if modality in _MODALITY_TERMS:
-        terms.append(_MODALITY_TERMS[modality])
-    if issue:
-        terms.append(issue)
 
-    unique_terms = list(OrderedDict((term, None) for term in terms).keys())
-    return " AND ".join(f"({term})" for term in unique_terms if term)
+def _eutils_identity() -> tuple[dict[str, str], Callable[[], None]]:
+    """Identification params and throttle shared with ``crisprairs.apis.ncbi``.
 
+    NCBI's allowance is per client, so PubMed calls wait on the gene lookups'
+    rate limiter. Imported on first use to keep ``requests`` off the import path.
+    """
+    from crisprairs.apis import ncbi
 
-def search_ids(query: str, retmax: int = 12, sort: str = "relevance") -> list[str]:
+    return ncbi.eutils_params(), ncbi.eutils_rate_limiter().wait
+
+
+def search_ids(
+    query: str, retmax: int = 12, sort: str = "relevance", cache_bypass: bool = False
+) -> list[str]:
     """Search PubMed and return PMID list."""
     if not query.strip():
         return []
 
+    identity, throttle = _eutils_identity()
     try:
-        response = requests.get(
+        payload = get_json(
             f"{EUTILS_BASE}/esearch.fcgi",
-            params={
+            {
                 "db": "pubmed",
                 "term": query,
                 "retmode": "json",
                 "retmax": retmax,
                 "sort": sort,
             },
-            timeout=TIMEOUT,
+            TIMEOUT,
+            cache_bypass=cache_bypass,
+            throttle=throttle,
+            identity=identity,
         )
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
+    except (OSError, ValueError) as exc:  # requests errors subclass OSError
         logger.error("PubMed esearch error: %s", exc)
         return []
 
     return [str(i) for i in payload.get("esearchresult", {}).get("idlist", [])]
 
 
-def fetch_summaries(pmids: list[str]) -> list[dict[str, Any]]:
-    """Fetch summary metadata for PMIDs."""
+class _SummaryBatcher:
+    """Merge esummary lookups that arrive during an in-flight POST.
+
+    With nothing in flight, a caller POSTs its PMIDs at once. Callers that
+    arrive while a POST is under way queue up for the next one: the first of
+    them waits for the current POST to finish, then fetches every PMID queued
+    meanwhile, and the others block on its shared result.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: Future | None = None  # result of the POST under way
+        self._pmids: dict[str, None] | None = None  # queued for the next POST
+        self._next: Future | None = None  # result of the next POST
+
+    def fetch(self, pmids: list[str]) -> dict[str, Any]:
+        """Return esummary rows keyed by PMID, covering at least ``pmids``."""
+        with self._lock:
+            previous = self._in_flight
+            if previous is None:
+                result = self._in_flight = Future()
+            elif self._next is not None:
+                self._pmids.update(dict.fromkeys(pmids))
+                queued = self._next
+            else:
+                self._pmids = dict.fromkeys(pmids)
+                result = self._next = Future()
+                queued = None
+        if previous is None:
+            batch = pmids
+        elif queued is not None:
+            return queued.result()
+        else:
+            futures.wait([previous])
+            with self._lock:
+                batch = list(self._pmids)
+                self._pmids = self._next = None
+
+        try:
+            rows = _esummary(batch)
+        except BaseException as exc:
+            self._finish()
+            result.set_exception(exc)
+            raise
+        self._finish()
+        result.set_result(rows)
+        return rows
+
+    def _finish(self) -> None:
+        # The queued batch, if any, becomes the POST in flight before its
+        # leader wakes; callers keep joining it until the leader takes it.
+        with self._lock:
+            self._in_flight = self._next
+
+
+_summary_batcher = _SummaryBatcher()
+
+
+def _esummary(pmids: list[str]) -> dict[str, Any]:
+    """POST one esummary request and cache its titled rows per PMID.
+
+    The reply is not cached whole: a batch mixes PMIDs from several scans,
+    so its key would rarely recur.
+    """
+    identity, throttle = _eutils_identity()
+    payload = post_json(
+        f"{EUTILS_BASE}/esummary.fcgi",
+        {"db": "pubmed", "id": ",".join(pmids), "retmode": "json"},
+        TIMEOUT,
+        throttle=throttle,
+        identity=identity,
+        cache=False,
+    )
+    result = payload.get("result", {})
+    store_records(
+        CACHE_NAMESPACE,
+        {uid: row for uid in pmids if (row := result.get(uid)) and row.get("title")},
+    )
+    return result
+
+
+def fetch_summaries(pmids: list[str], cache_bypass: bool = False) -> list[dict[str, Any]]:
+    """Fetch summary metadata for PMIDs.
+
+    Summaries are cached per PMID, so only PMIDs missing from the cache are
+    requested. IDs are POSTed, so long lists never hit URL length limits.
+    Lookups that arrive while another is in flight share the next request
+    unless ``cache_bypass`` forces a fresh, unshared fetch.
+    """
     if not pmids:
         return []
 
+    deduped = list(dict.fromkeys(str(pmid) for pmid in pmids))
     try:
-        response = requests.get(
-            f"{EUTILS_BASE}/esummary.fcgi",
-            params={
-                "db": "pubmed",
-                "id": ",".join(pmids),
-                "retmode": "json",
-            },
-            timeout=TIMEOUT,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
+        result = {} if cache_bypass else cached_records(CACHE_NAMESPACE, deduped)
+        missing = [pmid for pmid in deduped if pmid not in result]
+        if missing:
+            result.update(_esummary(missing) if cache_bypass else _summary_batcher.fetch(missing))
+    except (OSError, ValueError) as exc:  # requests errors subclass OSError
         logger.error("PubMed esummary error: %s", exc)
         return []
-
-    result = payload.get("result", {})
-    ids = [str(uid) for uid in result.get("uids", [])]
+    _set_served_from_cache(not missing)
 
     hits: list[dict[str, Any]] = []
-    for uid in ids:
-        row = result.get(uid, {})
-        if not row:
+    # Bound once: the loop body runs per PMID.
+    lookup = result.get
+    append = hits.append
+    for uid in deduped:
+        row = lookup(uid)
+        # Untitled rows (including esummary's per-ID error stubs) carry
+        # nothing to rank or review, so drop them before enrichment.
+        title = row.get("title") if row else None
+        if not title:
             continue
-        authors = [a.get("name", "") for a in row.get("authors", []) if a.get("name")]
-        hits.append(
+        field = row.get
+        authors = [name for a in field("authors", []) if (name := a.get("name"))]
+        append(
             {
                 "pmid": uid,
-                "title": row.get("title", ""),
-                "journal": row.get("fulljournalname") or row.get("source", ""),
-                "pubdate": row.get("pubdate", ""),
+                "title": title,
+                "journal": field("fulljournalname") or field("source") or "",
+                "pubdate": field("pubdate", ""),
                 "authors": authors[:5],
                 "url": f"https://pubmed.ncbi.nlm.nih.gov/{uid}/",
                 "source": "pubmed",
@@ -116,19 +257,26 @@ def fetch_summaries(pmids: list[str]) -> list[dict[str, Any]]:
     return hits
 
 
-def fetch_pubmed_hits(query: str, retmax: int = 8) -> list[dict[str, Any]]:
-    """Fetch a blend of relevant and recent PubMed papers."""
-    relevant = search_ids(query, retmax=retmax, sort="relevance")
-    recent = search_ids(query, retmax=retmax, sort="date")
+def search_pubmed_ids(query: str, retmax: int = 8, cache_bypass: bool = False) -> list[str]:
+    """Return up to ``retmax`` PMIDs blending relevant and recent papers.
 
-    merged: list[str] = []
-    seen: set[str] = set()
-    for pmid in relevant + recent:
-        if pmid in seen:
-            continue
-        seen.add(pmid)
-        merged.append(pmid)
-        if len(merged) >= retmax:
-            break
+    The relevance and date searches are independent, so they run side by side.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        relevant = pool.submit(
+            search_ids, query, retmax=retmax, sort="relevance", cache_bypass=cache_bypass
+        )
+        recent = pool.submit(
+            search_ids, query, retmax=retmax, sort="date", cache_bypass=cache_bypass
+        )
+        ranked = relevant.result() + recent.result()
+
+    return list(dict.fromkeys(ranked))[:retmax]
 
-    return fetch_summaries(merged)
+
+def fetch_pubmed_hits(
+    query: str, retmax: int = 8, cache_bypass: bool = False
+) -> list[dict[str, Any]]:
+    """Fetch a blend of relevant and recent PubMed papers."""
+    pmids = search_pubmed_ids(query, retmax=retmax, cache_bypass=cache_bypass)
+    return fetch_summaries(pmids, cache_bypass=cache_bypass)
@@ -3,38 +3,53 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
 
-import requests
+from crisprairs.literature._http import cached_records, get_json, store_records
 
 logger = logging.getLogger(__name__)
 
 PUBTATOR_API = "https://www.ncbi.nlm.nih.gov/research/pubtator3-api/publications/export/biocjson"
 TIMEOUT = 15
+MAX_PMIDS_PER_REQUEST = 100  # PubTator3 export limit
+CACHE_NAMESPACE = "pubtator"  # per-PMID keys in the literature response cache
 
 
-def fetch_entity_annotations(pmids: list[str]) -> dict[str, dict[str, list[str]]]:
-    """Fetch PubTator annotations for PMIDs grouped by entity type."""
+def fetch_entity_annotations(
+    pmids: list[str], cache_bypass: bool = False
+) -> dict[str, dict[str, list[str]]]:
+    """Fetch PubTator annotations for PMIDs grouped by entity type.
+
+    Annotations are cached per PMID, so only PMIDs missing from the cache
+    are requested, in as few comma-joined batches as PubTator accepts. On a
+    request error the annotations gathered so far are returned.
+    """
     clean_pmids = [str(p) for p in pmids if str(p).strip()]
     if not clean_pmids:
         return {}
 
-    try:
-        response = requests.get(
-            PUBTATOR_API,
-            params={"pmids": ",".join(clean_pmids)},
-            timeout=TIMEOUT,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
-        logger.error("PubTator request error: %s", exc)
-        return {}
-    except ValueError as exc:
-        logger.error("PubTator JSON parse error: %s", exc)
-        return {}
+    out = {} if cache_bypass else cached_records(CACHE_NAMESPACE, clean_pmids)
+    missing = list(dict.fromkeys(pmid for pmid in clean_pmids if pmid not in out))
+
+    for start in range(0, len(missing), MAX_PMIDS_PER_REQUEST):
+        batch = missing[start : start + MAX_PMIDS_PER_REQUEST]
+        try:
+            payload = get_json(
+                PUBTATOR_API,
+                {"pmids": ",".join(batch)},
+                TIMEOUT,
+                cache=False,
+            )
+        except OSError as exc:  # requests errors subclass OSError
+            logger.error("PubTator request error: %s", exc)
+            return out
+        except ValueError as exc:
+            logger.error("PubTator JSON parse error: %s", exc)
+            return out
 
-    return _parse_pubtator_bioc(payload)
+        fetched = _parse_pubtator_bioc(payload)
+        store_records(CACHE_NAMESPACE, fetched)
+        out.update(fetched)
+    return out
 
 
 def _parse_pubtator_bioc(payload) -> dict[str, dict[str, list[str]]]:
@@ -45,15 +60,20 @@ def _parse_pubtator_bioc(payload) -> dict[str, dict[str, list[str]]]:
         pmid = str(doc.get("id", "")).strip()
         if not pmid:
             continue
-        bucket: dict[str, set[str]] = defaultdict(set)
+        # Plain lists per type; duplicates are dropped once per type at the end,
+        # and single-mention types (the common case) skip the set and sort.
+        bucket: dict[str, list[str]] = {}
+        texts_for = bucket.setdefault
 
         for passage in doc.get("passages", []):
             for annotation in passage.get("annotations", []):
-                text = str(annotation.get("text", "")).strip()
-                ann_type = str(annotation.get("infons", {}).get("type", "")).strip()
-                if not text or not ann_type:
+                field = annotation.get
+                text = str(field("text", "")).strip()
+                if not text:
                     continue
-                bucket[ann_type].add(text)
+                ann_type = str(field("infons", {}).get("type", "")).strip()
+                if ann_type:
+                    texts_for(ann_type, []).append(text)
 
-        output[pmid] = {k: sorted(v) for k, v in bucket.items()}
+        output[pmid] = {k: v if len(v) == 1 else sorted(set(v)) for k, v in bucket.items()}
     return output
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from math import log1p
 from typing import Any
 
+from crisprairs.literature._http import CACHE_TTL, served_from_cache
 from crisprairs.literature.icite import fetch_icite_metrics
-from crisprairs.literature.pubmed import build_query_from_context, fetch_pubmed_hits
+from crisprairs.literature.pubmed import (
+    _CtxView,
+    build_query_from_context,
+    fetch_summaries,
+    search_pubmed_ids,
+)
 from crisprairs.literature.pubtator import fetch_entity_annotations
 
 RISK_TERMS = (
@@ -22,11 +29,21 @@ RISK_TERMS = (
     "low efficiency",
     "poor efficiency",
 )
+# One pass per title. The lookahead reports matches that overlap, so
+# "genotoxicity" still yields both "genotoxic" and "toxicity".
+_RISK_RE = re.compile("(?=(" + "|".join(re.escape(term) for term in RISK_TERMS) + "))")
+_RISK_TERMS_SORTED = tuple(sorted(RISK_TERMS))  # reported order, so no per-hit sort
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
 
+def run_literature_scan(ctx, max_hits: int = 8, cache_bypass: bool = False) -> dict[str, Any]:
+    """Run a PubMed-based evidence scan for the current context.
 
-def run_literature_scan(ctx, max_hits: int = 8) -> dict[str, Any]:
-    """Run a PubMed-based evidence scan for the current context."""
-    query = build_query_from_context(ctx)
+    Responses are cached on disk for ``CACHE_TTL`` seconds; ``cache_bypass``
+    forces fresh requests.
+    """
+    view = _CtxView.of(ctx)
+    query = build_query_from_context(view)
     scan = {
         "query": query,
         "retrieved_at": datetime.now(timezone.utc).isoformat(),
@@ -39,20 +56,50 @@ def run_literature_scan(ctx, max_hits: int = 8) -> dict[str, Any]:
         scan["notes"] = ["Not enough context to build a literature query."]
         return scan
 
-    hits = fetch_pubmed_hits(query, retmax=max_hits)
-    hits = enrich_hits_with_pubtator(hits)
-    hits = enrich_hits_with_icite(hits)
+    # PubTator and iCite only need the PMIDs, so they run alongside esummary
+    # instead of waiting for it.
+    pmids = search_pubmed_ids(query, retmax=max_hits, cache_bypass=cache_bypass)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        summaries = pool.submit(_fetch_summaries_with_origin, pmids, cache_bypass)
+        annotations = pool.submit(fetch_entity_annotations, pmids, cache_bypass=cache_bypass)
+        metrics = pool.submit(fetch_icite_metrics, pmids, cache_bypass=cache_bypass)
+        hits, from_cache = summaries.result()
+        _merge_enrichment(hits, annotations.result(), metrics.result())
     hits = sort_hits_by_priority(hits)
     scan["hits"] = hits
-    scan["notes"] = build_gap_notes(ctx, hits)
+    scan["notes"] = build_gap_notes(view, hits)
+    if hits and from_cache:
+        scan["notes"].append(
+            f"PubMed results were served from a local cache up to {CACHE_TTL // 3600}h old."
+        )
     return scan
 
 
+def _fetch_summaries_with_origin(
+    pmids: list[str], cache_bypass: bool
+) -> tuple[list[dict[str, Any]], bool]:
+    hits = fetch_summaries(pmids, cache_bypass=cache_bypass)
+    return hits, served_from_cache()
+
+
+def _merge_enrichment(
+    hits: list[dict[str, Any]],
+    annotations: dict[str, dict[str, list[str]]],
+    metrics: dict[str, dict[str, Any]],
+) -> None:
+    """Apply both enrichments in one pass; same result as the two ``enrich_*`` calls."""
+    now_year = _current_year()
+    for hit in hits:
+        pmid = str(hit.get("pmid", "")).strip()
+        hit["entities"] = annotations.get(pmid, {})
+        hit["icite"] = metrics.get(pmid, {})
+        hit["priority_score"] = compute_priority_score(hit, now_year)
+
+
 def build_gap_notes(ctx, hits: list[dict[str, Any]]) -> list[str]:
     """Generate concise 'what may be missing' notes."""
+    view = _CtxView.of(ctx)
     notes: list[str] = []
-    modality = str(getattr(ctx, "modality", "") or "")
-    species = str(getattr(ctx, "species", "") or "")
 
     if not hits:
         notes.append("No PubMed hits returned for the current query.")
@@ -61,10 +108,10 @@ def build_gap_notes(ctx, hits: list[dict[str, Any]]) -> list[str]:
     if len(hits) < 3:
         notes.append("Low hit count; broaden search terms or include synonyms.")
 
-    if not species:
+    if not view.species:
         notes.append("Species not set; evidence may include mixed model systems.")
 
-    if modality in {"off_target", "base_editing", "prime_editing"}:
+    if view.modality in {"off_target", "base_editing", "prime_editing"}:
         notes.append("Review newest papers for modality-specific risk profiles.")
 
     if not any(hit.get("icite") for hit in hits):
@@ -73,39 +120,47 @@ def build_gap_notes(ctx, hits: list[dict[str, Any]]) -> list[str]:
     return notes
 
 
-def enrich_hits_with_pubtator(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Attach PubTator entity annotations to each hit."""
+def enrich_hits_with_pubtator(
+    hits: list[dict[str, Any]],
+    annotations: dict[str, dict[str, list[str]]] | None = None,
+) -> list[dict[str, Any]]:
+    """Attach PubTator entity annotations to each hit.
+
+    Hits are updated in place and the same list is returned.
+    ``annotations`` may be prefetched by PMID; otherwise they are fetched here.
+    """
     if not hits:
         return []
-    pmids = [str(hit.get("pmid", "")).strip() for hit in hits if hit.get("pmid")]
-    annotations = fetch_entity_annotations(pmids)
+    if annotations is None:
+        pmids = [str(hit.get("pmid", "")).strip() for hit in hits if hit.get("pmid")]
+        annotations = fetch_entity_annotations(pmids)
 
-    enriched: list[dict[str, Any]] = []
     for hit in hits:
-        row = dict(hit)
-        pmid = str(row.get("pmid", "")).strip()
-        row["entities"] = annotations.get(pmid, {})
-        enriched.append(row)
-    return enriched
+        hit["entities"] = annotations.get(str(hit.get("pmid", "")).strip(), {})
+    return hits
+
 
+def enrich_hits_with_icite(
+    hits: list[dict[str, Any]],
+    metrics: dict[str, dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Attach iCite triage metrics and computed priority score.
 
-def enrich_hits_with_icite(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Attach iCite triage metrics and computed priority score."""
+    Hits are updated in place and the same list is returned.
+    ``metrics`` may be prefetched by PMID; otherwise they are fetched here.
+    """
     if not hits:
         return []
 
-    pmids = [str(hit.get("pmid", "")).strip() for hit in hits if hit.get("pmid")]
-    metrics = fetch_icite_metrics(pmids)
+    if metrics is None:
+        pmids = [str(hit.get("pmid", "")).strip() for hit in hits if hit.get("pmid")]
+        metrics = fetch_icite_metrics(pmids)
 
-    enriched: list[dict[str, Any]] = []
+    now_year = _current_year()
     for hit in hits:
-        row = dict(hit)
-        pmid = str(row.get("pmid", "")).strip()
-        i_metrics = metrics.get(pmid, {})
-        row["icite"] = i_metrics
-        row["priority_score"] = compute_priority_score(row)
-        enriched.append(row)
-    return enriched
+        hit["icite"] = metrics.get(str(hit.get("pmid", "")).strip(), {})
+        hit["priority_score"] = compute_priority_score(hit, now_year)
+    return hits
 
 
 def sort_hits_by_priority(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -117,48 +172,61 @@ def sort_hits_by_priority(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
     )
 
 
-def compute_priority_score(hit: dict[str, Any]) -> float:
-    """Compute triage score from iCite metrics and recency."""
+def compute_priority_score(hit: dict[str, Any], now_year: int | None = None) -> float:
+    """Compute triage score from iCite metrics and recency.
+
+    Pass ``now_year`` when scoring a batch so the clock is read once.
+    """
     icite = hit.get("icite", {}) or {}
     rcr = float(icite.get("rcr") or 0.0)
     apt = float(icite.get("apt") or 0.0)
     citations = int(icite.get("citations") or 0)
 
     pub_year = _extract_year(str(hit.get("pubdate", "") or ""))
-    now_year = datetime.now(timezone.utc).year
+    if now_year is None:
+        now_year = _current_year()
     age = max(now_year - pub_year, 0) if pub_year else 10
     recency_bonus = max(0.0, (8 - age) * 0.25)
 
     return round((rcr * 1.4) + (apt * 0.9) + log1p(citations) + recency_bonus, 3)
 
 
+def _current_year() -> int:
+    return datetime.now(timezone.utc).year
+
+
 def _extract_year(pubdate: str) -> int | None:
-    match = re.search(r"\b(19|20)\d{2}\b", pubdate)
-    if not match:
-        return None
-    try:
-        return int(match.group(0))
-    except ValueError:
-        return None
+    match = _YEAR_RE.search(pubdate)
+    return int(match.group(0)) if match else None
 
 
 def run_evidence_risk_review(ctx) -> dict[str, Any]:
-    """Run a final risk-oriented evidence pass before workflow completion."""
-    hits = [dict(h) for h in (ctx.literature_hits or [])]
+    """Run a final risk-oriented evidence pass before workflow completion.
+
+    Each hit in ``ctx.literature_hits`` gets its ``risk_terms`` set in place;
+    the review's ``hits`` is that same list.
+    """
+    hits = ctx.literature_hits or []
     risks: list[str] = []
     flagged = 0
 
-    target_gene = str(getattr(ctx, "target_gene", "") or "").lower().strip()
+    target_gene = _CtxView.of(ctx).target_gene.lower()
 
+    # One pass: each title is lowercased once and checked for risk terms and
+    # the target gene, and PubTator gene entities are noted along the way.
+    gene_mentioned = has_gene_entity = False
+    find_risks = _RISK_RE.findall
     for hit in hits:
-        title = str(hit.get("title", ""))
-        lowered = title.lower()
-        risk_terms = sorted(term for term in RISK_TERMS if term in lowered)
+        title = str(hit.get("title", "")).lower()
+        found = find_risks(title)
+        risk_terms = [term for term in _RISK_TERMS_SORTED if term in found] if found else []
         if risk_terms:
             flagged += 1
-            hit["risk_terms"] = risk_terms
-        else:
-            hit["risk_terms"] = []
+        hit["risk_terms"] = risk_terms
+        if target_gene and not gene_mentioned:
+            gene_mentioned = target_gene in title
+        if not has_gene_entity:
+            has_gene_entity = bool(hit.get("entities", {}).get("Gene"))
 
     if not hits:
         risks.append("No literature evidence available; manual review recommended.")
@@ -168,12 +236,12 @@ def run_evidence_risk_review(ctx) -> dict[str, Any]:
                 f"{flagged} paper(s) include cautionary language "
                 "(toxicity/off-target/genomic risk)."
             )
-        if target_gene and not any(target_gene in str(h.get("title", "")).lower() for h in hits):
+        if target_gene and not gene_mentioned:
             risks.append(
                 "No top hits explicitly mention the target gene; "
                 "expand synonyms and related pathway terms."
             )
-        if not any(h.get("entities", {}).get("Gene") for h in hits):
+        if not has_gene_entity:
             risks.append(
                 "PubTator did not return gene entities in top hits; "
                 "review search specificity."
@@ -8,6 +8,9 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Match ```json ... ``` or ``` ... ```
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+
 
 def extract_json(text: str) -> dict:
     """Extract a JSON object from LLM response text.
@@ -28,21 +31,23 @@ def extract_json(text: str) -> dict:
     """
     text = text.strip()
 
-    # Try direct parse first
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    # Try a direct parse only when the reply could be bare JSON; fenced or
+    # prose replies would just raise.
+    if text.startswith(("{", "[")):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
 
     # Strip markdown code fences
-    stripped = _strip_code_fences(text)
+    stripped = _strip_code_fences(text) if "```" in text else text
     if stripped != text:
         try:
             return json.loads(stripped)
         except json.JSONDecodeError:
             pass
 
-    # Find JSON object in the text using brace matching
+    # Find the first JSON object embedded in the text
     result = _find_json_object(text)
     if result is not None:
         return result
@@ -52,55 +57,50 @@ def extract_json(text: str) -> dict:
 
 def _strip_code_fences(text: str) -> str:
     """Remove markdown code fences from text."""
-    # Match ```json ... ``` or ``` ... ```
-    pattern = r"```(?:json)?\s*\n?(.*?)\n?\s*```"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _FENCE_RE.search(text)
     if match:
         return match.group(1).strip()
     return text
 
 
-def _find_json_object(text: str) -> dict | None:
-    """Find the first valid JSON object in text using brace matching."""
-    start = text.find("{")
-    if start == -1:
-        return None
+_DECODER = json.JSONDecoder()
 
-    depth = 0
-    in_string = False
-    escape_next = False
 
-    for i in range(start, len(text)):
-        c = text[i]
+def parse_leading_object(text: str) -> dict | None:
+    """Decode the JSON object a reply opens with, once it is complete.
 
-        if escape_next:
-            escape_next = False
-            continue
+    The object may sit inside a leading code fence. Returns None when the
+    reply does not open with an object or the object is not closed yet, so
+    a streamed reply can be parsed as soon as its object ends. A result is
+    the same object ``extract_json`` would return for the full reply.
+    """
+    body = text.lstrip()
+    if body.startswith("```"):
+        _, newline, body = body.partition("\n")
+        if not newline:
+            return None
+        body = body.lstrip()
+    if not body.startswith("{"):
+        return None
+    try:
+        obj, _ = _DECODER.raw_decode(body)
+    except json.JSONDecodeError:
+        return None
+    return obj
 
-        if c == "\\":
-            escape_next = True
-            continue
 
-        if c == '"':
-            in_string = not in_string
-            continue
+def _find_json_object(text: str) -> dict | None:
+    """Find the first valid JSON object in text.
 
-        if in_string:
+    Tries a decode at each ``{`` in turn; ``raw_decode`` stops at the end of
+    the object, so trailing prose is ignored and the scan stays in C.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
             continue
-
-        if c == "{":
-            depth += 1
-        elif c == "}":
-            depth -= 1
-            if depth == 0:
-                candidate = text[start : i + 1]
-                try:
-                    return json.loads(candidate)
-                except json.JSONDecodeError:
-                    # Try next opening brace
-                    next_start = text.find("{", start + 1)
-                    if next_start != -1:
-                        return _find_json_object(text[next_start:])
-                    return None
-
+        return obj
     return None
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import copy
+import functools
+import hashlib
+import json
 import logging
 import os
+import re
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 import dotenv
 
+from crisprairs.llm.parser import extract_json, parse_leading_object
+from crisprairs.safety.privacy import contains_identifiable_sequences
+
 dotenv.load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -26,8 +40,6 @@ class _ModelRequest:
 
 
 def _ensure_privacy_safe(payload: Any) -> None:
-    from crisprairs.safety.privacy import contains_identifiable_sequences
-
     if contains_identifiable_sequences(str(payload)):
         raise IdentifiableGeneError(
             "Request may contain identifiable genomic data. "
@@ -50,17 +62,150 @@ def _normalize_messages(request: Any) -> list[dict[str, str]]:
     return [{"role": "user", "content": str(request)}]
 
 
-def _parse_json_response(text: str) -> dict:
-    from crisprairs.llm.parser import extract_json
+DEFAULT_MAX_CONCURRENCY = 8  # in-flight requests for ChatProvider.achat_many
+# Opt-in reuse of parsed replies for repeated requests: same backend and
+# settings, messages equal up to runs of whitespace (see _cache_key). Off by
+# default since sampling is not deterministic.
+LLM_CACHE_ENABLED = os.getenv("CRISPRAIRS_LLM_CACHE", "").strip() == "1"
+LLM_CACHE_SIZE = 1024
+
+_response_cache: OrderedDict[str, dict] = OrderedDict()
+_response_cache_lock = threading.Lock()
+# Whether the last backend call in this thread or task was a cache hit, so
+# ChatProvider can audit hits apart from real model calls.
+_served_from_cache: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "served_from_cache", default=False
+)
+
+
+def _cache_key(backend: type, kwargs: dict[str, Any]) -> str:
+    """Key a request by backend, settings and whitespace-normalized messages.
+
+    Runs of whitespace are collapsed so a re-typed answer with different
+    spacing still hits. Case is kept: gene symbols differ by case across
+    species (TP53 vs Trp53).
+    """
+    normalized = {
+        **kwargs,
+        "messages": [
+            {**msg, "content": " ".join(str(msg.get("content", "")).split())}
+            for msg in kwargs.get("messages", [])
+        ],
+    }
+    if "system" in kwargs:
+        normalized["system"] = " ".join(str(kwargs["system"]).split())
+    payload = json.dumps(normalized, sort_keys=True, default=str).encode("utf-8")
+    return f"{backend.__name__}:{hashlib.sha256(payload).hexdigest()}"
+
+
+def _request_key(backend: type, kwargs: dict[str, Any]) -> str | None:
+    """Cache key for a request, or None without hashing when caching is off."""
+    return _cache_key(backend, kwargs) if LLM_CACHE_ENABLED else None
+
+
+def _cached_response(key: str | None) -> dict | None:
+    """Return a copy of the cached reply for ``key``, if caching is on."""
+    _served_from_cache.set(False)
+    if key is None:
+        return None
+    with _response_cache_lock:
+        result = _response_cache.get(key)
+        if result is None:
+            return None
+        _response_cache.move_to_end(key)
+    _served_from_cache.set(True)
+    return copy.deepcopy(result)
+
+
+def _store_response(key: str | None, result: dict) -> None:
+    if key is None:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = copy.deepcopy(result)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > LLM_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
 
+def _parse_json_response(text: str) -> dict:
     logger.info(text)
     return extract_json(text)
 
 
+_STRUCTURAL_RE = re.compile(r'[{}"\\]')  # characters that move _StreamedReply's brace depth
+
+
+class _StreamedReply:
+    """Accumulate a streamed reply and parse it as soon as its JSON object closes.
+
+    Brace depth is tracked incrementally, skipping braces inside JSON strings,
+    so the reply is parsed only when a top-level object closes rather than on
+    every delta containing ``}``. If that parse fails the reply does not open
+    with an object, and parsing waits for ``finish``.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape_at: int | None = None  # index in the next scanned piece
+        self._gave_up = False
+
+    def feed(self, piece: str | None) -> dict | None:
+        """Add one text delta; return the reply's object once it is complete."""
+        if not piece:
+            return None
+        self._parts.append(piece)
+        if self._gave_up or not self._closes_object(piece):
+            return None
+        text = "".join(self._parts)
+        result = parse_leading_object(text)
+        if result is None:
+            self._gave_up = True
+        else:
+            logger.info(text)
+        return result
+
+    def _closes_object(self, piece: str) -> bool:
+        """Advance the brace tracker over ``piece``; True if depth returned to 0."""
+        closed = False
+        escape_at, self._escape_at = self._escape_at, None
+        for match in _STRUCTURAL_RE.finditer(piece):
+            char, pos = match.group(), match.start()
+            if self._in_string:
+                if pos == escape_at:
+                    continue
+                if char == "\\":
+                    escape_at = pos + 1
+                    if escape_at == len(piece):
+                        self._escape_at = 0
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                closed = closed or not self._depth
+        return closed
+
+    def finish(self) -> dict:
+        """Parse the whole reply once the stream has ended."""
+        return _parse_json_response("".join(self._parts))
+
+
+def _delta_text(chunk) -> str | None:
+    return chunk.choices[0].delta.content if chunk.choices else None
+
+
 class OpenAIChat:
     """OpenAI chat-completions adapter."""
 
     _client = None
+    # Async clients hold connections bound to the loop that opened them, so
+    # each event loop gets its own; entries go away with their loop.
+    _async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     @classmethod
     def _get_client(cls):
@@ -72,6 +217,18 @@ class OpenAIChat:
             )
         return cls._client
 
+    @classmethod
+    def _get_async_client(cls):
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get(loop)
+        if client is None:
+            import openai
+
+            client = cls._async_clients[loop] = openai.AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_KEY"),
+            )
+        return client
+
     @classmethod
     def _model_for(cls, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> str:
         if use_gpt4_turbo:
@@ -81,7 +238,7 @@ class OpenAIChat:
         return "gpt-3.5-turbo"
 
     @classmethod
-    def chat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
+    def _create_kwargs(cls, request, use_gpt4: bool, use_gpt4_turbo: bool) -> dict[str, Any]:
         req = _ModelRequest(
             request=request,
             use_gpt4=use_gpt4,
@@ -89,20 +246,63 @@ class OpenAIChat:
         )
         _ensure_privacy_safe(req.request)
 
-        messages = _normalize_messages(req.request)
-        response = cls._get_client().chat.completions.create(
-            model=cls._model_for(req.use_gpt4, req.use_gpt4_turbo),
-            messages=messages,
-            temperature=0.2,
-        )
-        text = response.choices[0].message.content
-        return _parse_json_response(text)
+        return {
+            "model": cls._model_for(req.use_gpt4, req.use_gpt4_turbo),
+            "messages": _normalize_messages(req.request),
+            "temperature": 0.2,
+        }
+
+    @classmethod
+    def chat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
+        kwargs = cls._create_kwargs(request, use_gpt4, use_gpt4_turbo)
+        key = _request_key(cls, kwargs)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
+        # Streamed so a reply that opens with a JSON object is parsed, and the
+        # connection released, as soon as the object closes.
+        stream = cls._get_client().chat.completions.create(**kwargs, stream=True)
+        reply = _StreamedReply()
+        try:
+            for chunk in stream:
+                result = reply.feed(_delta_text(chunk))
+                if result is not None:
+                    break
+            else:
+                result = reply.finish()
+        finally:
+            stream.close()
+        _store_response(key, result)
+        return result
+
+    @classmethod
+    async def achat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
+        """Async ``chat`` on a shared ``AsyncOpenAI`` client."""
+        kwargs = cls._create_kwargs(request, use_gpt4, use_gpt4_turbo)
+        key = _request_key(cls, kwargs)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
+        stream = await cls._get_async_client().chat.completions.create(**kwargs, stream=True)
+        reply = _StreamedReply()
+        try:
+            async for chunk in stream:
+                result = reply.feed(_delta_text(chunk))
+                if result is not None:
+                    break
+            else:
+                result = reply.finish()
+        finally:
+            await stream.close()
+        _store_response(key, result)
+        return result
 
 
 class AnthropicChat:
     """Anthropic messages API adapter."""
 
     _client = None
+    _async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     @classmethod
     def _get_client(cls):
@@ -112,6 +312,18 @@ class AnthropicChat:
             cls._client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
         return cls._client
 
+    @classmethod
+    def _get_async_client(cls):
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get(loop)
+        if client is None:
+            import anthropic
+
+            client = cls._async_clients[loop] = anthropic.AsyncAnthropic(
+                api_key=os.getenv("ANTHROPIC_API_KEY")
+            )
+        return client
+
     @classmethod
     def _model_for(cls, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> str:
         default_model = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-6-20250514")
@@ -120,7 +332,7 @@ class AnthropicChat:
         return default_model
 
     @classmethod
-    def chat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
+    def _create_kwargs(cls, request, use_gpt4: bool, use_gpt4_turbo: bool) -> dict[str, Any]:
         req = _ModelRequest(
             request=request,
             use_gpt4=use_gpt4,
@@ -144,10 +356,32 @@ class AnthropicChat:
         }
         if system_text:
             kwargs["system"] = system_text
+        return kwargs
 
+    @classmethod
+    def chat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
+        kwargs = cls._create_kwargs(request, use_gpt4, use_gpt4_turbo)
+        key = _request_key(cls, kwargs)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
         response = cls._get_client().messages.create(**kwargs)
-        text = response.content[0].text
-        return _parse_json_response(text)
+        result = _parse_json_response(response.content[0].text)
+        _store_response(key, result)
+        return result
+
+    @classmethod
+    async def achat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
+        """Async ``chat`` on a shared ``AsyncAnthropic`` client."""
+        kwargs = cls._create_kwargs(request, use_gpt4, use_gpt4_turbo)
+        key = _request_key(cls, kwargs)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
+        response = await cls._get_async_client().messages.create(**kwargs)
+        result = _parse_json_response(response.content[0].text)
+        _store_response(key, result)
+        return result
 
 
 class ChatProvider:
@@ -172,7 +406,7 @@ class ChatProvider:
     @classmethod
     def chat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
         backend = cls._backend()
-        started = time.time()
+        started = time.monotonic_ns()
 
         try:
             result = backend.chat(
@@ -180,28 +414,85 @@ class ChatProvider:
                 use_gpt4=use_gpt4,
                 use_gpt4_turbo=use_gpt4_turbo,
             )
-            _log_audit(
-                "llm_call",
-                provider=cls.provider_name(),
-                model=cls.model_name(),
-                latency_ms=int((time.time() - started) * 1000),
+            cls._log_call(
+                "llm_cache_hit" if _served_from_cache.get() else "llm_call", started
             )
             return result
         except Exception:
-            _log_audit(
-                "llm_call_error",
-                provider=cls.provider_name(),
-                model=cls.model_name(),
-                latency_ms=int((time.time() - started) * 1000),
+            cls._log_call("llm_call_error", started)
+            raise
+
+    @classmethod
+    async def achat(cls, request, use_gpt4: bool = True, use_gpt4_turbo: bool = False) -> dict:
+        """Async ``chat``; audited the same way."""
+        backend = cls._backend()
+        started = time.monotonic_ns()
+
+        try:
+            result = await backend.achat(
+                request,
+                use_gpt4=use_gpt4,
+                use_gpt4_turbo=use_gpt4_turbo,
+            )
+            cls._log_call(
+                "llm_cache_hit" if _served_from_cache.get() else "llm_call", started
             )
+            return result
+        except Exception:
+            cls._log_call("llm_call_error", started)
             raise
 
+    @classmethod
+    async def achat_many(
+        cls,
+        requests: Iterable[Any],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        use_gpt4: bool = True,
+        use_gpt4_turbo: bool = False,
+    ) -> list[dict]:
+        """Run independent prompts concurrently, at most ``max_concurrency`` at once.
+
+        Results are in request order; as with ``asyncio.gather``, the first
+        failure is raised immediately.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(request) -> dict:
+            async with semaphore:
+                return await cls.achat(request, use_gpt4=use_gpt4, use_gpt4_turbo=use_gpt4_turbo)
+
+        return list(await asyncio.gather(*(one(request) for request in requests)))
+
+    @classmethod
+    def _log_call(cls, event: str, started: int) -> None:
+        """Audit one call; ``started`` is a ``time.monotonic_ns()`` reading."""
+        _log_audit(
+            event,
+            provider=cls.provider_name(),
+            model=cls.model_name(),
+            latency_ms=(time.monotonic_ns() - started) // 1_000_000,
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _audit_log():
+    # Imported on first use: crisprairs.rpw pulls in every workflow helper.
+    from crisprairs.rpw.audit import AuditLog
+
+    return AuditLog
+
 
 def _log_audit(event: str, **kwargs) -> None:
     """Best-effort audit logging."""
     try:
-        from crisprairs.rpw.audit import AuditLog
-
-        AuditLog.log_event(event, **kwargs)
+        _audit_log().log_event(event, **kwargs)
     except Exception:
         pass
+
+
+__all__ = [
+    "AnthropicChat",
+    "ChatProvider",
+    "IdentifiableGeneError",
+    "OpenAIChat",
+]
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from crisprairs._json import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 SESSIONS_DIR = Path("sessions")
@@ -50,8 +51,7 @@ class SessionManager:
             payload["context"] = _json_safe_context(context_dict)
 
         try:
-            with open(cls._file_path(session_id), "w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2, default=str)
+            cls._file_path(session_id).write_bytes(dumps(payload, indent=True))
         except Exception as exc:
             logger.error("Session save error: %s", exc)
 
@@ -62,8 +62,7 @@ class SessionManager:
         if not path.exists():
             return None
         try:
-            with open(path, "r", encoding="utf-8") as handle:
-                return json.load(handle)
+            return loads(path.read_bytes())
         except Exception as exc:
             logger.error("Session load error: %s", exc)
             return None
@@ -155,8 +154,7 @@ class SessionManager:
     @staticmethod
     def _load_or_none(path: Path):
         try:
-            with open(path, "r", encoding="utf-8") as handle:
-                return json.load(handle)
+            return loads(path.read_bytes())
         except Exception:
             return None
 
@@ -169,7 +167,7 @@ def _json_safe_context(context_dict: dict[str, Any]) -> dict[str, Any]:
     safe: dict[str, Any] = {}
     for key, value in context_dict.items():
         try:
-            json.dumps(value, default=str)
+            dumps(value)
             safe[key] = value
         except (TypeError, ValueError):
             safe[key] = str(value)
@@ -1,6 +1,7 @@
 """Shared fixtures for CRISPR AI Research Suite tests."""
 
 import os
+import sys
 
 # Set dummy API keys before any imports that trigger client initialization
 os.environ.setdefault("OPENAI_API_KEY", "sk-test-dummy-key-for-unit-tests")
@@ -12,7 +13,7 @@ import pytest
 
 @pytest.fixture(autouse=True)
 def _isolate_data_dirs(tmp_path, monkeypatch):
-    """Redirect audit/, sessions/, experiments/ to temp dirs so tests don't pollute the repo."""
+    """Redirect data dirs and API caches to temp dirs so tests don't pollute the repo."""
     for dirname in ("audit", "sessions", "experiments"):
         d = tmp_path / dirname
         d.mkdir()
@@ -35,3 +36,34 @@ def _isolate_data_dirs(tmp_path, monkeypatch):
         monkeypatch.setattr(experiments_mod, "EXPERIMENTS_DIR", tmp_path / "experiments")
     except (ImportError, AttributeError):
         pass
+
+    try:
+        import crisprairs.literature._http as literature_http
+        monkeypatch.setattr(
+            literature_http, "CACHE_PATH", tmp_path / "cache" / "literature.sqlite3"
+        )
+    except (ImportError, AttributeError):
+        pass
+
+    try:
+        import crisprairs.apis.ncbi as ncbi_mod
+        monkeypatch.setattr(ncbi_mod, "GENE_CACHE_PATH", tmp_path / "cache" / "ncbi_gene.json")
+        monkeypatch.setattr(
+            ncbi_mod, "SEQUENCE_CACHE_PATH", tmp_path / "cache" / "ncbi_sequences.sqlite3"
+        )
+        monkeypatch.setattr(
+            ncbi_mod, "GENE_INDEX_PATH", tmp_path / "cache" / "gene_index.sqlite3"
+        )
+        ncbi_mod._gene_index.cache_clear()
+        monkeypatch.setattr(ncbi_mod, "_gene_cache", None)
+        monkeypatch.setattr(ncbi_mod, "_gene_cache_dirty", False)
+    except (ImportError, AttributeError):
+        pass
+
+    yield
+
+    # Session saves from the app are written in the background; finish them
+    # while the data dirs above are still redirected.
+    app_mod = sys.modules.get("crisprairs.app")
+    if app_mod is not None:
+        app_mod._flush_all()
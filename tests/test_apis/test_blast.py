@@ -4,7 +4,9 @@ from unittest.mock import MagicMock, patch
 
 from crisprairs.apis.blast import (
     ORGANISM_MAP,
+    _job_state,
     _parse_blast_xml,
+    _read_poll_body,
     check_primer_specificity,
     poll_results,
     submit_blast,
@@ -34,20 +36,28 @@ MOCK_BLAST_XML = """<?xml version="1.0"?>
 </BlastOutput>"""
 
 
+def _streamed(text):
+    """Mock a streamed requests.Response yielding ``text`` in 64-byte chunks."""
+    raw = text.encode()
+    resp = MagicMock(encoding="utf-8")
+    resp.iter_content.return_value = iter([raw[i : i + 64] for i in range(0, len(raw), 64)])
+    return resp
+
+
 class TestSubmitBlast:
     def test_returns_rid(self):
         mock_resp = MagicMock()
         mock_resp.text = "RID = ABC12345\nRTOE = 30"
         mock_resp.raise_for_status = MagicMock()
 
-        with patch("crisprairs.apis.blast.requests.post", return_value=mock_resp):
+        with patch("crisprairs.apis.blast._SESSION.post", return_value=mock_resp):
             rid = submit_blast("ATCGATCGATCGATCGATCG")
 
         assert rid == "ABC12345"
 
     def test_returns_none_on_failure(self):
         import requests
-        with patch("crisprairs.apis.blast.requests.post", side_effect=requests.ConnectionError):
+        with patch("crisprairs.apis.blast._SESSION.post", side_effect=requests.ConnectionError):
             rid = submit_blast("ATCG")
         assert rid is None
 
@@ -56,7 +66,7 @@ class TestSubmitBlast:
         mock_resp.text = "RID = XYZ789\nRTOE = 30"
         mock_resp.raise_for_status = MagicMock()
 
-        with patch("crisprairs.apis.blast.requests.post", return_value=mock_resp) as mock_post:
+        with patch("crisprairs.apis.blast._SESSION.post", return_value=mock_resp) as mock_post:
             submit_blast("ATCG", organism="human")
             call_data = mock_post.call_args[1]["data"]
             assert "Homo sapiens" in call_data.get("ENTREZ_QUERY", "")
@@ -64,26 +74,50 @@ class TestSubmitBlast:
 
 class TestPollResults:
     def test_returns_hits_when_ready(self):
-        mock_resp = MagicMock()
-        mock_resp.text = MOCK_BLAST_XML
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _streamed(MOCK_BLAST_XML)
 
-        with patch("crisprairs.apis.blast.requests.get", return_value=mock_resp):
+        with patch("crisprairs.apis.blast._SESSION.get", return_value=mock_resp):
             hits = poll_results("ABC12345", max_wait=5)
 
         assert len(hits) == 1
         assert hits[0]["accession"] == "NM_000546"
 
     def test_returns_empty_on_failure(self):
-        mock_resp = MagicMock()
-        mock_resp.text = "Status=FAILED"
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _streamed("Status=FAILED")
 
-        with patch("crisprairs.apis.blast.requests.get", return_value=mock_resp):
+        with patch("crisprairs.apis.blast._SESSION.get", return_value=mock_resp):
             hits = poll_results("FAIL_RID", max_wait=5)
 
         assert hits == []
 
+    def test_backs_off_between_waiting_polls(self):
+        responses = [_streamed("Status=WAITING") for _ in range(3)] + [_streamed(MOCK_BLAST_XML)]
+
+        with patch("crisprairs.apis.blast._SESSION.get", side_effect=responses):
+            with patch("crisprairs.apis.blast.time.sleep") as mock_sleep:
+                hits = poll_results("ABC12345", max_wait=60, poll_interval=2)
+
+        assert len(hits) == 1
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [1.0, 1.5, 2]
+
+
+class TestReadPollBody:
+    def test_stops_at_status_marker_split_across_chunks(self):
+        chunks = iter([b"<html>Status=WAI", b"TING</html>", b"x" * 100, b"never read"])
+        resp = MagicMock(encoding="utf-8")
+        resp.iter_content.return_value = chunks
+
+        state, _ = _read_poll_body(resp)
+
+        assert state == "WAITING"
+        assert next(chunks) == b"x" * 100
+
+    def test_reads_finished_payload_in_full(self):
+        state, body = _read_poll_body(_streamed(MOCK_BLAST_XML))
+        assert state is None
+        assert body == MOCK_BLAST_XML
+
 
 class TestCheckPrimerSpecificity:
     def test_specific_primers(self):
@@ -111,6 +145,22 @@ class TestCheckPrimerSpecificity:
             result = check_primer_specificity("ATCG", "GCTA")
         assert result["specific"] is False
 
+    def test_partial_submission_still_polls_other_primer(self):
+        def fake_submit(sequence, organism=None):
+            return "FWD_RID" if sequence == "ATCG" else None
+
+        with patch("crisprairs.apis.blast.submit_blast", side_effect=fake_submit):
+            with patch(
+                "crisprairs.apis.blast.poll_results",
+                return_value=[{"accession": "NM_000546"}],
+            ) as mock_poll:
+                result = check_primer_specificity("ATCG", "GCTA")
+
+        mock_poll.assert_called_once_with("FWD_RID")
+        assert result["forward_hits"] == 1
+        assert result["reverse_hits"] == 0
+        assert result["specific"] is False
+
 
 class TestParseBlastXml:
     def test_parses_hits(self):
@@ -122,6 +172,34 @@ class TestParseBlastXml:
     def test_invalid_xml(self):
         assert _parse_blast_xml("not xml") == []
 
+    def test_parses_multiple_hits_and_missing_hsp(self):
+        xml = """<?xml version="1.0"?>
+<BlastOutput><BlastOutput_iterations><Iteration><Iteration_hits>
+  <Hit><Hit_accession>A1</Hit_accession><Hit_def>first</Hit_def><Hit_len>10</Hit_len>
+    <Hit_hsps><Hsp><Hsp_identity>9</Hsp_identity><Hsp_evalue>0.5</Hsp_evalue></Hsp>
+    <Hsp><Hsp_identity>3</Hsp_identity></Hsp></Hit_hsps></Hit>
+  <Hit><Hit_accession>B2</Hit_accession><Hit_len>20</Hit_len></Hit>
+</Iteration_hits></Iteration></BlastOutput_iterations></BlastOutput>"""
+        hits = _parse_blast_xml(xml)
+        assert [h["accession"] for h in hits] == ["A1", "B2"]
+        assert hits[0]["identity"] == "9"
+        assert hits[0]["align_len"] == ""
+        assert hits[1]["title"] == ""
+        assert "identity" not in hits[1]
+
+    def test_truncated_xml(self):
+        assert _parse_blast_xml(MOCK_BLAST_XML[:200]) == []
+
+
+class TestJobState:
+    def test_detects_states(self):
+        assert _job_state("QBlastInfoBegin\n    Status=WAITING\n") == "WAITING"
+        assert _job_state("Status=FAILED") == "FAILED"
+        assert _job_state("Status=UNKNOWN") == "UNKNOWN"
+
+    def test_ready_payload_has_no_state(self):
+        assert _job_state(MOCK_BLAST_XML) is None
+
 
 class TestOrganismMap:
     def test_has_common_species(self):
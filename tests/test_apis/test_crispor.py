@@ -2,8 +2,11 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from crisprairs.apis.crispor import (
     _parse_response,
+    bust_cache,
     design_guides,
     genome_for_species,
     is_available,
@@ -35,7 +38,7 @@ class TestDesignGuides:
         mock_resp.text = MOCK_TSV
         mock_resp.raise_for_status = MagicMock()
 
-        with patch("crisprairs.apis.crispor.requests.get", return_value=mock_resp):
+        with patch("crisprairs.apis.crispor._SESSION.get", return_value=mock_resp):
             guides = design_guides("ATCG" * 50, species="human")
 
         assert len(guides) == 2
@@ -45,13 +48,13 @@ class TestDesignGuides:
 
     def test_returns_empty_on_timeout(self):
         import requests
-        with patch("crisprairs.apis.crispor.requests.get", side_effect=requests.Timeout):
+        with patch("crisprairs.apis.crispor._SESSION.get", side_effect=requests.Timeout):
             guides = design_guides("ATCG" * 50)
         assert guides == []
 
     def test_returns_empty_on_network_error(self):
         import requests
-        with patch("crisprairs.apis.crispor.requests.get", side_effect=requests.ConnectionError):
+        with patch("crisprairs.apis.crispor._SESSION.get", side_effect=requests.ConnectionError):
             guides = design_guides("ATCG" * 50)
         assert guides == []
 
@@ -62,25 +65,66 @@ class TestScoreExistingGuides:
         mock_resp.text = MOCK_TSV
         mock_resp.raise_for_status = MagicMock()
 
-        with patch("crisprairs.apis.crispor.requests.get", return_value=mock_resp):
+        with patch("crisprairs.apis.crispor._SESSION.get", return_value=mock_resp):
             results = score_existing_guides(["ATCG" * 5, "GCTA" * 5], species="human")
 
         assert len(results) == 2
         assert results[0]["query_sequence"] == "ATCG" * 5
 
+    def test_preserves_order_and_isolates_errors(self):
+        def fake_design(seq, species="human", pam="NGG"):
+            if seq.startswith("GCTA"):
+                raise RuntimeError("boom")
+            return [{"guide_sequence": seq}]
+
+        seqs = ["ATCG" * 5, "GCTA" * 5, "TTTT" * 5]
+        with patch("crisprairs.apis.crispor.design_guides", side_effect=fake_design):
+            results = score_existing_guides(seqs)
+
+        assert [r["query_sequence"] for r in results] == seqs
+        assert results[0]["guides"] == [{"guide_sequence": "ATCG" * 5}]
+        assert results[1]["error"] == "boom"
+        assert results[1]["guides"] == []
+
+    def test_empty_input(self):
+        assert score_existing_guides([]) == []
+
 
 class TestIsAvailable:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        bust_cache()
+        yield
+        bust_cache()
+
     def test_available(self):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        with patch("crisprairs.apis.crispor.requests.get", return_value=mock_resp):
+        with patch("crisprairs.apis.crispor._SESSION.get", return_value=mock_resp):
             assert is_available() is True
 
     def test_unavailable(self):
         import requests
-        with patch("crisprairs.apis.crispor.requests.get", side_effect=requests.ConnectionError):
+        with patch("crisprairs.apis.crispor._SESSION.get", side_effect=requests.ConnectionError):
             assert is_available() is False
 
+    def test_verdict_is_cached(self):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        with patch("crisprairs.apis.crispor._SESSION.get", return_value=mock_resp) as mock_get:
+            assert is_available() is True
+            assert is_available() is True
+        assert mock_get.call_count == 1
+
+    def test_use_cache_false_forces_probe(self):
+        import requests
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        with patch("crisprairs.apis.crispor._SESSION.get", return_value=mock_resp):
+            assert is_available() is True
+        with patch("crisprairs.apis.crispor._SESSION.get", side_effect=requests.ConnectionError):
+            assert is_available(use_cache=False) is False
+
 
 class TestParseResponse:
     def test_parses_tsv(self):
@@ -90,3 +134,18 @@ class TestParseResponse:
 
     def test_empty_response(self):
         assert _parse_response("") == []
+
+    def test_missing_columns_and_short_rows(self):
+        text = "guideSeq\tpam\tmitSpecScore\nATCG\tNGG\tNotEnsembl\nGGGG\n\n"
+        guides = _parse_response(text)
+        assert len(guides) == 2
+        assert guides[0]["position"] == ""
+        assert guides[0]["mit_specificity_score"] is None
+        assert guides[0]["off_target_count"] is None
+        assert guides[1]["guide_sequence"] == "GGGG"
+        assert guides[1]["pam"] is None
+        assert guides[1]["position"] == ""
+
+    def test_extra_cells_do_not_fill_missing_columns(self):
+        guides = _parse_response("guideSeq\tpam\nATCG\tNGG\textra\n")
+        assert guides[0]["position"] == ""
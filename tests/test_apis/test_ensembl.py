@@ -1,6 +1,6 @@
 """Tests for apis/ensembl.py — Ensembl REST API client."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from crisprairs.apis.ensembl import (
     find_orthologs,
@@ -80,6 +80,13 @@ class TestGetSequence:
         assert result["seq_length"] == 800
         assert len(result["sequence_preview"]) <= 503  # 500 + "..."
 
+    def test_short_sequence_preview_is_unchanged(self):
+        mock_data = {"id": "ENSG1", "desc": "", "seq": "ATCG"}
+        with patch("crisprairs.apis.ensembl._get", return_value=mock_data):
+            result = get_sequence("ENSG1")
+        assert result["sequence_preview"] == "ATCG"
+        assert result["full_sequence"] == "ATCG"
+
     def test_returns_none_on_failure(self):
         with patch("crisprairs.apis.ensembl._get", return_value=None):
             assert get_sequence("FAKE") is None
@@ -137,3 +144,32 @@ class TestFindOrthologs:
     def test_returns_empty_on_failure(self):
         with patch("crisprairs.apis.ensembl._get", return_value=None):
             assert find_orthologs("FAKE") == []
+
+
+class TestGet:
+    def test_uses_shared_session_with_json_headers(self):
+        from crisprairs.apis import ensembl
+
+        mock_resp = MagicMock()
+        mock_resp.content = b'{"ok": true}'
+        with patch.object(ensembl._SESSION, "get", return_value=mock_resp) as mock_get:
+            assert ensembl._get("/info/ping") == {"ok": True}
+
+        assert mock_get.call_args[0][0] == "https://rest.ensembl.org/info/ping"
+        assert ensembl._SESSION.headers["Accept"] == "application/json"
+
+    def test_returns_none_on_request_error(self):
+        import requests
+
+        from crisprairs.apis import ensembl
+
+        with patch.object(ensembl._SESSION, "get", side_effect=requests.ConnectionError):
+            assert ensembl._get("/info/ping") is None
+
+    def test_returns_none_on_malformed_json(self):
+        from crisprairs.apis import ensembl
+
+        mock_resp = MagicMock()
+        mock_resp.content = b"<html>gateway error</html>"
+        with patch.object(ensembl._SESSION, "get", return_value=mock_resp):
+            assert ensembl._get("/info/ping") is None
@@ -1,76 +1,118 @@
-"""Tests for apis/ncbi.py — NCBI Entrez gene lookup via Biopython."""
+"""Tests for apis/ncbi.py — NCBI gene lookup via Datasets and E-utilities."""
 
+import copy
 import json
-from io import StringIO
-from types import SimpleNamespace
+import sqlite3
+from contextlib import closing
 from unittest.mock import MagicMock, patch
 
-from crisprairs.apis.ncbi import SPECIES_TAXID, fetch_gene_info, fetch_gene_sequence
+import pytest
 
+from crisprairs.apis.ncbi import (
+    SPECIES_TAXID,
+    fetch_gene_info,
+    fetch_gene_info_batch,
+    fetch_gene_sequence,
+)
 
-class TestFetchGeneInfo:
-    def test_returns_gene_info(self):
-        mock_search = MagicMock()
-        mock_search.__enter__ = MagicMock(return_value=mock_search)
-        mock_search.__exit__ = MagicMock(return_value=False)
-
-        mock_summary = MagicMock()
-        summary_json = json.dumps({
-            "result": {
-                "7157": {
-                    "name": "TP53",
-                    "description": "tumor protein p53",
-                    "chromosome": "17",
-                    "organism": {"scientificname": "Homo sapiens"},
-                    "otheraliases": "p53, LFS1",
-                    "summary": "Tumor suppressor gene",
-                    "genomicinfo": [],
-                }
-            }
-        })
-        mock_summary.__enter__ = MagicMock(return_value=StringIO(summary_json))
-        mock_summary.__exit__ = MagicMock(return_value=False)
 
-        with patch("crisprairs.apis.ncbi._configure_entrez") as mock_entrez_fn:
-            mock_entrez = MagicMock()
-            mock_entrez.esearch.return_value = mock_search
-            mock_entrez.read.return_value = {"IdList": ["7157"]}
-            mock_entrez.esummary.return_value = mock_summary
-            mock_entrez_fn.return_value = mock_entrez
+@pytest.fixture(autouse=True)
+def _entrez_only(monkeypatch):
+    """Exercise the E-utilities path unless a test opts into Datasets."""
+    monkeypatch.setenv("CRISPRAIRS_USE_ENTREZ", "1")
 
-            result = fetch_gene_info("TP53", "human")
+
+def _response(content: bytes) -> MagicMock:
+    resp = MagicMock()
+    resp.content = content
+    resp.text = content.decode()
+    return resp
+
+
+class TestFetchGeneInfo:
+    @patch("crisprairs.apis.ncbi._esummary")
+    @patch("crisprairs.apis.ncbi._esearch", return_value=["7157"])
+    def test_returns_gene_info(self, mock_search, mock_summary):
+        mock_summary.return_value = {
+            "7157": {
+                "name": "TP53",
+                "description": "tumor protein p53",
+                "chromosome": "17",
+                "organism": {"scientificname": "Homo sapiens"},
+                "otheraliases": "p53, LFS1",
+                "summary": "Tumor suppressor gene",
+                "genomicinfo": [],
+            }
+        }
+        result = fetch_gene_info("TP53", "human")
 
         assert result is not None
         assert result["gene_id"] == "7157"
         assert result["symbol"] == "TP53"
         assert result["chromosome"] == "17"
+        assert mock_search.call_args[0][1] == "TP53[Gene Name] AND 9606[Taxonomy ID]"
+        assert mock_search.call_count == 1
 
-    def test_returns_none_when_not_found(self):
-        mock_search = MagicMock()
-        mock_search.__enter__ = MagicMock(return_value=mock_search)
-        mock_search.__exit__ = MagicMock(return_value=False)
-
-        with patch("crisprairs.apis.ncbi._configure_entrez") as mock_entrez_fn:
-            mock_entrez = MagicMock()
-            mock_entrez.esearch.return_value = mock_search
-            mock_entrez.read.return_value = {"IdList": []}
-            mock_entrez_fn.return_value = mock_entrez
-
-            result = fetch_gene_info("FAKEGENE", "human")
+    @patch("crisprairs.apis.ncbi._esummary")
+    @patch("crisprairs.apis.ncbi._esearch", return_value=[])
+    def test_returns_none_when_not_found(self, mock_search, mock_summary):
+        result = fetch_gene_info("FAKEGENE", "human")
 
         assert result is None
+        mock_summary.assert_not_called()
 
     def test_returns_none_on_error(self):
-        with patch("crisprairs.apis.ncbi._configure_entrez") as mock_entrez_fn:
-            mock_entrez = MagicMock()
-            mock_entrez.esearch.side_effect = Exception("Network error")
-            mock_entrez_fn.return_value = mock_entrez
-
+        with patch("crisprairs.apis.ncbi._esearch", side_effect=Exception("Network error")):
             result = fetch_gene_info("TP53", "human")
 
         assert result is None
 
 
+class TestFetchGeneInfoBatch:
+    @patch("crisprairs.apis.ncbi._esummary")
+    @patch("crisprairs.apis.ncbi._esearch")
+    def test_one_esearch_and_esummary_for_all_symbols(self, mock_search, mock_summary):
+        mock_search.return_value = ["672", "7157", "99999"]
+        mock_summary.return_value = {
+            "uids": ["672", "7157", "99999"],
+            "7157": {"name": "TP53", "chromosome": "17"},
+            "672": {"name": "BRCA1", "chromosome": "17"},
+            "99999": {"name": "TP53BP1", "chromosome": "15"},
+        }
+        results = fetch_gene_info_batch(["TP53", "BRCA1"], "human")
+
+        mock_search.assert_called_once_with(
+            "gene", "(TP53[Gene Name] OR BRCA1[Gene Name]) AND 9606[Taxonomy ID]", retmax=10
+        )
+        mock_summary.assert_called_once_with("gene", ["672", "7157", "99999"])
+        assert results[0]["gene_id"] == "7157"
+        assert results[1]["gene_id"] == "672"
+
+    @patch("crisprairs.apis.ncbi._esummary")
+    @patch("crisprairs.apis.ncbi._esearch")
+    def test_unmatched_symbols_fall_back_to_single_search(self, mock_search, mock_summary):
+        ids = {"p53": "7157"}
+
+        def fake_esearch(db, term, retmax):
+            if " OR " in term:
+                return ["672"]
+            symbol = term.split("[")[0]
+            return [ids[symbol]] if symbol in ids else []
+
+        mock_search.side_effect = fake_esearch
+        mock_summary.side_effect = [
+            {"672": {"name": "BRCA1"}},
+            {"7157": {"name": "TP53"}},
+        ]
+        results = fetch_gene_info_batch(["BRCA1", "p53", "FAKEGENE"], "human")
+
+        assert [r and r["gene_id"] for r in results] == ["672", "7157", None]
+        assert mock_summary.call_args_list[1][0] == ("gene", ["7157"])
+
+    def test_empty_input(self):
+        assert fetch_gene_info_batch([]) == []
+
+
 class TestSpeciesTaxid:
     def test_human_taxid(self):
         assert SPECIES_TAXID["human"] == "9606"
@@ -79,59 +121,363 @@ class TestSpeciesTaxid:
         assert SPECIES_TAXID["mouse"] == "10090"
 
 
+ELINK_XML = b"""<?xml version="1.0" encoding="UTF-8" ?>
+<eLinkResult>
+  <LinkSet>
+    <DbFrom>gene</DbFrom>
+    <IdList><Id>7157</Id></IdList>
+    <LinkSetDb>
+      <DbTo>nuccore</DbTo>
+      <LinkName>gene_nuccore</LinkName>
+      <Link><Id>111</Id></Link>
+    </LinkSetDb>
+    <LinkSetDb>
+      <DbTo>nuccore</DbTo>
+      <LinkName>gene_nuccore_refseqgenomic</LinkName>
+      <Link><Id>568815581</Id></Link>
+    </LinkSetDb>
+  </LinkSet>
+</eLinkResult>
+"""
+
+
 class TestFetchGeneSequence:
     def test_fetch_gene_sequence_resolves_nuccore_from_gene_id(self):
-        mock_elink = MagicMock()
-        mock_elink.__enter__ = MagicMock(return_value=mock_elink)
-        mock_elink.__exit__ = MagicMock(return_value=False)
-
-        mock_efetch = MagicMock()
-        mock_efetch.__enter__ = MagicMock(return_value=StringIO(">id\nATCGATCG"))
-        mock_efetch.__exit__ = MagicMock(return_value=False)
-
-        with patch("crisprairs.apis.ncbi._configure_entrez") as mock_entrez_fn:
-            mock_entrez = MagicMock()
-            mock_entrez.elink.return_value = mock_elink
-            mock_entrez.efetch.return_value = mock_efetch
-            mock_entrez.read.return_value = [
-                {
-                    "LinkSetDb": [
-                        {
-                            "LinkName": "gene_nuccore_refseqgenomic",
-                            "Link": [{"Id": "NC_000017.11"}],
-                        }
-                    ]
-                }
-            ]
-            mock_entrez_fn.return_value = mock_entrez
-
-            record = MagicMock()
-            record.seq = "ATCGATCG"
-            fake_seqio = SimpleNamespace(read=MagicMock(return_value=record))
-            fake_bio = SimpleNamespace(SeqIO=fake_seqio)
-            with patch.dict(
-                "sys.modules",
-                {"Bio": fake_bio, "Bio.SeqIO": fake_seqio},
-            ):
-                sequence = fetch_gene_sequence("7157")
+        from crisprairs.apis import ncbi
+
+        responses = {
+            "elink": _response(ELINK_XML),
+            "efetch": _response(b">NC_000017.11 chr17\nATCG\nATCG\n"),
+        }
+
+        def fake_post(url, data, timeout):
+            return responses[url.rsplit("/", 1)[1].split(".")[0]]
+
+        with patch.object(ncbi._SESSION, "post", side_effect=fake_post) as mock_post:
+            sequence = fetch_gene_sequence("7157")
 
         assert sequence == "ATCGATCG"
-        mock_entrez.efetch.assert_called_once_with(
-            db="nuccore", id="NC_000017.11", rettype="fasta", retmode="text"
+        efetch_data = mock_post.call_args_list[1].kwargs["data"]
+        assert efetch_data["id"] == "568815581"
+        assert efetch_data["rettype"] == "fasta"
+        assert efetch_data["email"] == "test@example.com"
+
+    @patch("crisprairs.apis.ncbi._efetch")
+    @patch("crisprairs.apis.ncbi._elink", return_value=iter([]))
+    def test_fetch_gene_sequence_returns_none_when_no_linked_sequence(
+        self, mock_elink, mock_efetch
+    ):
+        sequence = fetch_gene_sequence("7157")
+
+        assert sequence is None
+        mock_efetch.assert_not_called()
+
+
+class TestIterLinks:
+    def test_streams_links_per_source(self):
+        from crisprairs.apis.ncbi import _iter_links
+
+        xml = ELINK_XML.replace(
+            b"</eLinkResult>",
+            b"<LinkSet><IdList><Id>672</Id></IdList><LinkSetDb><LinkName>gene_nuccore"
+            b"</LinkName><Link><Id>5</Id></Link><Link><Id>6</Id></Link></LinkSetDb>"
+            b"</LinkSet></eLinkResult>",
         )
 
-    def test_fetch_gene_sequence_returns_none_when_no_linked_sequence(self):
-        mock_elink = MagicMock()
-        mock_elink.__enter__ = MagicMock(return_value=mock_elink)
-        mock_elink.__exit__ = MagicMock(return_value=False)
+        assert list(_iter_links(xml)) == [
+            ("7157", "gene_nuccore", "111"),
+            ("7157", "gene_nuccore_refseqgenomic", "568815581"),
+            ("672", "gene_nuccore", "5"),
+            ("672", "gene_nuccore", "6"),
+        ]
 
-        with patch("crisprairs.apis.ncbi._configure_entrez") as mock_entrez_fn:
-            mock_entrez = MagicMock()
-            mock_entrez.elink.return_value = mock_elink
-            mock_entrez.read.return_value = [{"LinkSetDb": []}]
-            mock_entrez_fn.return_value = mock_entrez
+    def test_prefers_requested_link_type(self):
+        from crisprairs.apis.ncbi import _extract_nuccore_ids
 
-            sequence = fetch_gene_sequence("7157")
+        links = [("gene_nuccore", "1"), ("gene_nuccore_refseqrna", "2"), ("gene_nuccore", "2")]
+        assert _extract_nuccore_ids(links, seq_type="rna") == ["2"]
+        assert _extract_nuccore_ids(links, seq_type="other") == ["1", "2"]
 
-        assert sequence is None
-        mock_entrez.efetch.assert_not_called()
+
+class TestFastaRecords:
+    def test_reads_records_in_order(self):
+        from crisprairs.apis.ncbi import _fasta_records
+
+        assert _fasta_records(">a\nAC\nGT\n>b\nTTTT\n") == ["ACGT", "TTTT"]
+
+    def test_empty_document(self):
+        from crisprairs.apis.ncbi import _fasta_records
+
+        assert _fasta_records("") == []
+
+
+class TestFetchGeneSequenceBatch:
+    @patch("crisprairs.apis.ncbi._efetch", return_value=">a\nAAAA\n>b\nCCCC\n")
+    @patch("crisprairs.apis.ncbi._elink")
+    def test_one_elink_and_efetch_for_all_genes(self, mock_elink, mock_efetch):
+        from crisprairs.apis.ncbi import fetch_gene_sequence_batch
+
+        mock_elink.return_value = iter([
+            ("1", "gene_nuccore", "10"),
+            ("3", "gene_nuccore", "30"),
+        ])
+        sequences = fetch_gene_sequence_batch(["1", "2", "3"])
+
+        assert sequences == ["AAAA", None, "CCCC"]
+        mock_elink.assert_called_once_with("gene", "nuccore", ["1", "2", "3"])
+        mock_efetch.assert_called_once_with("nuccore", ["10", "30"], rettype="fasta")
+
+    @patch("crisprairs.apis.ncbi._efetch", return_value=">a\nAAAA\n")
+    @patch("crisprairs.apis.ncbi._elink")
+    def test_record_count_mismatch_returns_none(self, mock_elink, mock_efetch):
+        from crisprairs.apis.ncbi import fetch_gene_sequence_batch
+
+        mock_elink.return_value = iter([
+            ("1", "gene_nuccore", "10"),
+            ("2", "gene_nuccore", "20"),
+        ])
+
+        assert fetch_gene_sequence_batch(["1", "2"]) == [None, None]
+
+
+class TestEutils:
+    def test_uses_shared_session_with_identification_params(self):
+        from crisprairs.apis import ncbi
+
+        with patch.object(ncbi._SESSION, "post", return_value=_response(b"{}")) as mock_post:
+            ncbi._eutils("einfo", db="gene")
+
+        url = mock_post.call_args[0][0]
+        data = mock_post.call_args.kwargs["data"]
+        assert url == "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/einfo.fcgi"
+        assert data["tool"] == "crisprairs"
+        assert data["db"] == "gene"
+
+
+class TestGeneCache:
+    @patch("crisprairs.apis.ncbi._esummary", return_value={"7157": {"name": "TP53"}})
+    @patch("crisprairs.apis.ncbi._esearch", return_value=["7157"])
+    def test_repeat_lookup_skips_network(self, mock_search, mock_summary):
+        first = fetch_gene_info("TP53", "Human")
+        first["symbol"] = "mutated"
+        second = fetch_gene_info("TP53", "human")
+
+        assert mock_search.call_count == 1
+        assert second["symbol"] == "TP53"
+
+    @patch("crisprairs.apis.ncbi._esummary", return_value={"7157": {"name": "TP53"}})
+    @patch("crisprairs.apis.ncbi._esearch", return_value=["7157"])
+    def test_cache_persists_across_processes(self, mock_search, mock_summary, monkeypatch):
+        from crisprairs.apis import ncbi
+
+        fetch_gene_info("TP53", "human")
+        ncbi._flush_gene_cache()
+        monkeypatch.setattr(ncbi, "_gene_cache", None)
+
+        assert fetch_gene_info("TP53", "human")["gene_id"] == "7157"
+        assert mock_search.call_count == 1
+        assert ncbi.GENE_CACHE_PATH.exists()
+
+    @patch("crisprairs.apis.ncbi._esearch", return_value=[])
+    def test_misses_are_not_cached(self, mock_search):
+        fetch_gene_info("FAKEGENE", "human")
+        fetch_gene_info("FAKEGENE", "human")
+
+        assert mock_search.call_count == 2
+
+    @patch("crisprairs.apis.ncbi._efetch", return_value=">x\nATCG\n")
+    @patch("crisprairs.apis.ncbi._elink")
+    def test_sequence_cached_by_gene_and_type(self, mock_elink, mock_efetch):
+        mock_elink.side_effect = lambda *args: iter([("7157", "gene_nuccore", "1")])
+
+        assert fetch_gene_sequence("7157") == "ATCG"
+        assert fetch_gene_sequence("7157") == "ATCG"
+        assert mock_efetch.call_count == 1
+
+    @patch("crisprairs.apis.ncbi._efetch", return_value=">x\nATCG\n")
+    @patch("crisprairs.apis.ncbi._elink")
+    def test_sequence_cache_usable_after_clear(self, mock_elink, mock_efetch):
+        from crisprairs.apis import ncbi
+
+        mock_elink.side_effect = lambda *args: iter([("7157", "gene_nuccore", "1")])
+
+        fetch_gene_sequence("7157")
+        ncbi.clear_cache()
+        fetch_gene_sequence("7157")
+        assert fetch_gene_sequence("7157") == "ATCG"
+        assert mock_efetch.call_count == 2
+
+
+class TestFetchMany:
+    @patch("crisprairs.apis.ncbi.MAX_BATCH_SIZE", 2)
+    @patch("crisprairs.apis.ncbi.fetch_gene_info_batch")
+    def test_splits_into_batches_and_keeps_order(self, mock_batch):
+        from crisprairs.apis.ncbi import fetch_many
+
+        def fake_batch(symbols, species):
+            if "BAD" in symbols:
+                raise RuntimeError("boom")
+            return [{"symbol": s} for s in symbols]
+
+        mock_batch.side_effect = fake_batch
+        results = fetch_many(["A", "B", "C", "BAD", "E"], "human")
+
+        assert [r and r["symbol"] for r in results] == ["A", "B", None, None, "E"]
+        assert mock_batch.call_count == 3
+
+    def test_empty_input(self):
+        from crisprairs.apis.ncbi import fetch_many
+
+        assert fetch_many([]) == []
+
+
+class TestRateLimiter:
+    @patch("crisprairs.apis.ncbi.time.sleep")
+    @patch("crisprairs.apis.ncbi.time.monotonic", return_value=100.0)
+    def test_spaces_calls_by_interval(self, mock_monotonic, mock_sleep):
+        from crisprairs.apis.ncbi import _RateLimiter
+
+        limiter = _RateLimiter(4)
+        for _ in range(3):
+            limiter.wait()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+
+
+DATASETS_REPORT = {
+    "reports": [
+        {
+            "query": ["TP53"],
+            "gene": {
+                "gene_id": "7157",
+                "symbol": "TP53",
+                "description": "tumor protein p53",
+                "taxname": "Homo sapiens",
+                "chromosomes": ["17"],
+                "synonyms": ["P53", "LFS1"],
+                "summary": [{"description": "Tumor suppressor gene"}],
+                "genomic_ranges": [
+                    {
+                        "accession_version": "NC_000017.11",
+                        "range": [{"begin": "7661779", "end": "7687546", "orientation": "minus"}],
+                    }
+                ],
+            },
+        }
+    ]
+}
+
+
+class TestDatasetsLookup:
+    @pytest.fixture(autouse=True)
+    def _use_datasets(self, monkeypatch):
+        monkeypatch.delenv("CRISPRAIRS_USE_ENTREZ", raising=False)
+
+    @patch("crisprairs.apis.ncbi._fetch_gene_info_eutils")
+    def test_single_get_maps_report(self, mock_eutils):
+        from crisprairs.apis import ncbi
+
+        resp = _response(json.dumps(DATASETS_REPORT).encode())
+        resp.status_code = 200
+        with patch.object(ncbi._SESSION, "get", return_value=resp) as mock_get:
+            result = fetch_gene_info("TP53", "human")
+
+        assert mock_get.call_args[0][0].endswith("/gene/symbol/TP53/taxon/9606")
+        mock_eutils.assert_not_called()
+        assert result["gene_id"] == "7157"
+        assert result["chromosome"] == "17"
+        assert result["aliases"] == "P53, LFS1"
+        assert result["summary"] == "Tumor suppressor gene"
+        assert result["genomic_info"][0]["chrstart"] == 7687545
+
+    @patch("crisprairs.apis.ncbi._fetch_gene_info_eutils", return_value=[{"gene_id": "7157"}])
+    def test_malformed_report_falls_back_to_eutils(self, mock_eutils):
+        from crisprairs.apis import ncbi
+
+        report = copy.deepcopy(DATASETS_REPORT)
+        del report["reports"][0]["gene"]["genomic_ranges"][0]["range"][0]["begin"]
+        resp = _response(json.dumps(report).encode())
+        resp.status_code = 200
+        with patch.object(ncbi._SESSION, "get", return_value=resp):
+            result = fetch_gene_info("TP53", "human")
+
+        mock_eutils.assert_called_once_with(["TP53"], "human")
+        assert result["gene_id"] == "7157"
+
+    @patch("crisprairs.apis.ncbi._fetch_gene_info_eutils", return_value=[{"gene_id": "672"}])
+    def test_unresolved_symbols_fall_back_to_eutils(self, mock_eutils):
+        from crisprairs.apis import ncbi
+
+        resp = MagicMock(status_code=404)
+        with patch.object(ncbi._SESSION, "get", return_value=resp):
+            result = fetch_gene_info("BRCA1", "human")
+
+        mock_eutils.assert_called_once_with(["BRCA1"], "human")
+        assert result["gene_id"] == "672"
+
+
+class TestGeneIndex:
+    @pytest.fixture
+    def gene_index(self):
+        from crisprairs.apis import ncbi
+
+        ncbi.GENE_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(ncbi.GENE_INDEX_PATH)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE gene (tax_id TEXT, symbol TEXT, gene_id TEXT, description TEXT, "
+                "chromosome TEXT, synonyms TEXT, organism TEXT, PRIMARY KEY (tax_id, symbol))"
+            )
+            conn.execute("CREATE INDEX gene_symbol_nocase ON gene (tax_id, symbol COLLATE NOCASE)")
+            conn.executemany(
+                "INSERT INTO gene VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("9606", "TP53", "7157", "tumor protein p53", "17", "P53, LFS1",
+                     "Homo sapiens"),
+                    ("7227", "H", "43156", "Hairless", "3R", "", "Drosophila melanogaster"),
+                    ("7227", "h", "38995", "hairy", "3L", "", "Drosophila melanogaster"),
+                ],
+            )
+        ncbi._gene_index.cache_clear()
+        yield
+        ncbi._gene_index.cache_clear()
+
+    @pytest.mark.usefixtures("gene_index")
+    @patch("crisprairs.apis.ncbi._fetch_gene_info_eutils")
+    def test_index_hit_skips_network(self, mock_eutils):
+        result = fetch_gene_info("tp53", "human")
+
+        mock_eutils.assert_not_called()
+        assert result["gene_id"] == "7157"
+        assert result["symbol"] == "TP53"
+        assert result["aliases"] == "P53, LFS1"
+        assert result["organism"] == "Homo sapiens"
+
+    @pytest.mark.usefixtures("gene_index")
+    def test_index_hit_is_not_cached(self):
+        from crisprairs.apis import ncbi
+
+        fetch_gene_info("TP53", "human")
+
+        assert ncbi._gene_cache_key("TP53", "human") not in ncbi._load_gene_cache()
+
+    @pytest.mark.usefixtures("gene_index")
+    @patch("crisprairs.apis.ncbi._fetch_gene_info_eutils", return_value=[{"gene_id": "672"}])
+    def test_index_miss_falls_back(self, mock_eutils):
+        result = fetch_gene_info("BRCA1", "human")
+
+        mock_eutils.assert_called_once_with(["BRCA1"], "human")
+        assert result["gene_id"] == "672"
+
+    @pytest.mark.usefixtures("gene_index")
+    def test_index_prefers_exact_case(self):
+        from crisprairs.apis import ncbi
+
+        found = ncbi._fetch_gene_info_index(["h", "H"], "7227")
+
+        assert found["h"]["full_name"] == "hairy"
+        assert found["H"]["full_name"] == "Hairless"
+
+    def test_missing_index_is_skipped(self):
+        from crisprairs.apis import ncbi
+
+        assert ncbi._fetch_gene_info_index(["TP53"], "9606") == {}
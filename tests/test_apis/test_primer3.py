@@ -1,6 +1,5 @@
 """Tests for apis/primer3_api.py — Primer3 wrapper."""
 
-import sys
 from unittest.mock import MagicMock, patch
 
 from crisprairs.apis.primer3_api import DEFAULT_PARAMS, check_available, design_primers
@@ -32,13 +31,11 @@ class TestDesignPrimers:
             "PRIMER_PAIR_1_PRODUCT_SIZE": 400,
         }
 
-        # Create a mock primer3 module and inject it into sys.modules
         mock_primer3 = MagicMock()
         mock_primer3.design_primers = MagicMock(return_value=mock_results)
 
-        with patch("crisprairs.apis.primer3_api.check_available", return_value=True):
-            with patch.dict(sys.modules, {"primer3": mock_primer3}):
-                pairs = design_primers("ATCG" * 100, 150, 23, num_return=2)
+        with patch("crisprairs.apis.primer3_api._primer3", return_value=mock_primer3):
+            pairs = design_primers("ATCG" * 100, 150, 23, num_return=2)
 
         assert len(pairs) == 2
         assert pairs[0]["forward_seq"] == "ATCGATCGATCGATCGATCG"
@@ -46,7 +43,7 @@ class TestDesignPrimers:
         assert pairs[1]["forward_tm"] == 61.2
 
     def test_returns_empty_when_not_installed(self):
-        with patch("crisprairs.apis.primer3_api.check_available", return_value=False):
+        with patch("crisprairs.apis.primer3_api._primer3", return_value=None):
             pairs = design_primers("ATCG" * 100, 150, 23)
         assert pairs == []
 
@@ -54,9 +51,8 @@ class TestDesignPrimers:
         mock_primer3 = MagicMock()
         mock_primer3.design_primers = MagicMock(side_effect=Exception("Primer3 error"))
 
-        with patch("crisprairs.apis.primer3_api.check_available", return_value=True):
-            with patch.dict(sys.modules, {"primer3": mock_primer3}):
-                pairs = design_primers("ATCG" * 100, 150, 23)
+        with patch("crisprairs.apis.primer3_api._primer3", return_value=mock_primer3):
+            pairs = design_primers("ATCG" * 100, 150, 23)
         assert pairs == []
 
 
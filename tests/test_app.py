@@ -24,6 +24,13 @@ from crisprairs.app import (
 
 
 class TestRouter:
+    def test_registered_steps_hold_no_instance_state(self):
+        # Steps are shared by every session; per-session state belongs on the context.
+        router = _build_router()
+        for modality in router.modalities:
+            for step in router.get(modality):
+                assert vars(step) == {}, f"{modality}: {step.name}"
+
     def test_build_router_has_modalities(self):
         router = _build_router()
         modalities = router.modalities
@@ -213,6 +220,66 @@ class TestExport:
         assert "hello" in text
 
 
+class TestSessionPersistence:
+    def test_only_latest_snapshot_is_written(self, tmp_path, monkeypatch):
+        import crisprairs.app as appmod
+        import crisprairs.rpw.sessions as smod
+
+        monkeypatch.setattr(smod, "SESSIONS_DIR", tmp_path)
+        state = _new_session_state()
+        session_id = state["session_id"]
+
+        with patch.object(appmod._WRITER, "submit") as mock_submit:
+            appmod._save_state(state, [{"role": "user", "content": "first"}])
+            appmod._save_state(state, [{"role": "user", "content": "second"}])
+            with patch.object(smod.SessionManager, "save") as mock_save:
+                appmod._flush_session(session_id)
+                appmod._flush_session(session_id)
+
+        assert mock_submit.call_count == 2
+        mock_save.assert_called_once()
+        assert mock_save.call_args.kwargs["chat_history"][0]["content"] == "second"
+
+    def test_snapshot_is_isolated_from_live_context(self, tmp_path, monkeypatch):
+        import crisprairs.app as appmod
+        import crisprairs.rpw.sessions as smod
+
+        monkeypatch.setattr(smod, "SESSIONS_DIR", tmp_path)
+        state = _new_session_state()
+        hit = {"pmid": "1", "title": "Cas9 screen"}
+        state["ctx"].literature_hits = [hit]
+
+        with patch.object(appmod._WRITER, "submit"):
+            appmod._save_state(state, [{"role": "user", "content": "scan"}])
+        hit["risk_terms"] = ["off-target"]
+        with patch.object(smod.SessionManager, "save") as mock_save:
+            appmod._flush_session(state["session_id"])
+
+        saved_hit = mock_save.call_args.kwargs["context_dict"]["literature_hits"][0]
+        assert "risk_terms" not in saved_hit
+
+    def test_malformed_state_is_logged_not_raised(self):
+        import crisprairs.app as appmod
+
+        with patch.object(appmod._WRITER, "submit") as mock_submit:
+            appmod._save_state({"ctx": _new_session_state()["ctx"]}, [])
+
+        mock_submit.assert_not_called()
+
+    def test_export_session_flushes_pending_save(self, tmp_path, monkeypatch):
+        import crisprairs.app as appmod
+        import crisprairs.rpw.sessions as smod
+
+        monkeypatch.setattr(smod, "SESSIONS_DIR", tmp_path)
+        state = _new_session_state()
+
+        with patch.object(appmod._WRITER, "submit"):
+            appmod._save_state(state, [{"role": "user", "content": "queued turn"}])
+            markdown = export_session(state)
+
+        assert "queued turn" in markdown
+
+
 class TestNewSession:
     def test_new_session_resets(self, tmp_path, monkeypatch):
         import crisprairs.rpw.audit as amod
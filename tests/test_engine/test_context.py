@@ -1,5 +1,7 @@
 """Tests for engine/context.py — SessionContext, GuideRNA, DeliveryInfo, PrimerPair."""
 
+import pytest
+
 from crisprairs.engine.context import (
     DeliveryInfo,
     GuideRNA,
@@ -86,6 +88,21 @@ class TestSessionContext:
         assert isinstance(d["delivery"], dict)
         assert isinstance(d["guides"], list)
 
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+
+        ctx = SessionContext(session_id="abc", target_gene="TP53")
+        ctx.guides.append(GuideRNA(sequence="ATCG", metadata={"rank": 1}))
+        ctx.primers.append(PrimerPair(forward="AAA", reverse="TTT"))
+        ctx.delivery.method = "AAV"
+        ctx.chat_history.append(("hi", "hello"))
+        ctx.extra["note"] = {"k": "v"}
+
+        d = ctx.to_dict()
+        assert d == asdict(ctx)
+        assert d["guides"] is not ctx.guides
+        assert d["extra"] is not ctx.extra
+
     def test_from_dict_roundtrip(self):
         original = SessionContext(
             session_id="test-rt",
@@ -125,3 +142,8 @@ class TestSessionContext:
         ctx.chat_history.append(("user msg", "bot msg"))
         assert len(ctx.chat_history) == 1
         assert ctx.chat_history[0] == ("user msg", "bot msg")
+
+    def test_unknown_attribute_rejected(self):
+        ctx = SessionContext()
+        with pytest.raises(AttributeError):
+            ctx.not_a_field = "x"
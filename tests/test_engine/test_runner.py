@@ -205,3 +205,14 @@ class TestPipelineRunnerAllAutoSteps:
         runner.start("test", ctx)
         assert runner.is_done is True
         assert ctx.extra.get("step_a") is True
+
+    def test_long_auto_pipeline_does_not_recurse(self):
+        import sys
+
+        router = Router()
+        router.register("test", [StepA()] * (sys.getrecursionlimit() + 100))
+        runner = PipelineRunner(router)
+
+        output = runner.start("test", SessionContext())
+        assert runner.is_done is True
+        assert output.result == StepResult.DONE
@@ -126,7 +126,7 @@ class TestRouter:
         router = Router()
         steps = [AutoStep(), DoneStep()]
         router.register("knockout", steps)
-        assert router.get("knockout") == steps
+        assert router.get("knockout") == tuple(steps)
 
     def test_case_insensitive(self):
         router = Router()
@@ -151,3 +151,33 @@ class TestRouter:
         router.register("prime_editing", [AutoStep()])
         with pytest.raises(KeyError, match="knockout"):
             router.get("nonexistent")
+
+    def test_factory_is_built_once_on_first_get(self):
+        router = Router()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return [AutoStep()]
+
+        router.register("knockout", factory)
+        assert router.modalities == ["knockout"]
+        assert calls == []
+
+        first = router.get("Knockout")
+        assert router.get("knockout") is first
+        assert calls == [1]
+
+    def test_reregister_replaces_factory(self):
+        router = Router()
+        router.register("knockout", lambda: [AutoStep()])
+        steps = [DoneStep()]
+        router.register("knockout", steps)
+        assert router.get("knockout") == tuple(steps)
+
+    def test_first_input_index(self):
+        router = Router()
+        router.register("knockout", [AutoStep(), AutoStep(), InputStep(), AutoStep()])
+        router.register("auto", lambda: [AutoStep(), DoneStep()])
+        assert router.first_input_index("knockout") == 2
+        assert router.first_input_index("auto") == 2
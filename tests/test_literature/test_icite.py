@@ -1,7 +1,9 @@
 """Tests for literature/icite.py."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+from crisprairs.literature import _http
 from crisprairs.literature.icite import fetch_icite_metrics
 
 
@@ -9,7 +11,7 @@ class TestFetchICiteMetrics:
     def test_parses_metrics(self):
         mock_resp = MagicMock()
         mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "data": [
                 {
                     "pmid": "123",
@@ -19,21 +21,50 @@ class TestFetchICiteMetrics:
                     "year": 2024,
                 }
             ]
-        }
+        }).encode()
 
-        with patch("crisprairs.literature.icite.requests.get", return_value=mock_resp):
+        with patch.object(_http._session(), "get", return_value=mock_resp):
             metrics = fetch_icite_metrics(["123"])
 
         assert metrics["123"]["rcr"] == 2.1
         assert metrics["123"]["apt"] == 0.45
         assert metrics["123"]["citations"] == 23
 
+    def test_caches_per_pmid_records_only(self):
+        import sqlite3
+        from contextlib import closing
+
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({"data": [{"pmid": "123", "rcr": 1.0}]}).encode()
+
+        with patch.object(_http._session(), "get", return_value=mock_resp):
+            fetch_icite_metrics(["123"])
+
+        with closing(sqlite3.connect(_http.CACHE_PATH)) as conn:
+            keys = [row[0] for row in conn.execute("SELECT key FROM responses")]
+        assert keys == ["icite:123"]
+
     def test_handles_request_error(self):
         import requests
 
-        with patch(
-            "crisprairs.literature.icite.requests.get",
+        with patch.object(
+            _http._session(),
+            "get",
             side_effect=requests.RequestException("boom"),
         ):
             metrics = fetch_icite_metrics(["123"])
         assert metrics == {}
+
+    def test_requests_only_uncached_pmids(self):
+        def icite_reply(url, params, timeout):
+            resp = MagicMock()
+            rows = [{"pmid": p, "citation_count": 1} for p in params["pmids"].split(",")]
+            resp.content = json.dumps({"data": rows}).encode()
+            return resp
+
+        with patch.object(_http._session(), "get", side_effect=icite_reply) as mock_get:
+            fetch_icite_metrics(["1", "2"])
+            metrics = fetch_icite_metrics(["2", "3"])
+
+        assert set(metrics) == {"2", "3"}
+        assert mock_get.call_args.kwargs["params"]["pmids"] == "3"
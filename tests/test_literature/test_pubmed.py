@@ -1,9 +1,12 @@
 """Tests for literature/pubmed.py."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 from crisprairs.engine.context import SessionContext
+from crisprairs.literature import _http
 from crisprairs.literature.pubmed import (
+    _CtxView,
     build_query_from_context,
     fetch_pubmed_hits,
     fetch_summaries,
@@ -29,23 +32,57 @@ class TestBuildQueryFromContext:
         query = build_query_from_context(ctx)
         assert "low efficiency" in query
 
+    def test_accepts_prebuilt_context_view(self):
+        ctx = SessionContext(target_gene=" TP53 ", modality="Knockout")
+        view = _CtxView.of(ctx)
+        assert _CtxView.of(view) is view
+        assert (view.target_gene, view.modality) == ("TP53", "knockout")
+        assert build_query_from_context(view) == build_query_from_context(ctx)
+
 
 class TestSearchIds:
     def test_returns_id_list(self):
         mock_resp = MagicMock()
         mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {"esearchresult": {"idlist": ["1", "2", "3"]}}
+        mock_resp.content = json.dumps({"esearchresult": {"idlist": ["1", "2", "3"]}}).encode()
 
-        with patch("crisprairs.literature.pubmed.requests.get", return_value=mock_resp):
+        with patch.object(_http._session(), "get", return_value=mock_resp):
             ids = search_ids("CRISPR AND TP53")
 
         assert ids == ["1", "2", "3"]
 
+    def test_network_calls_share_ncbi_rate_limiter(self):
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({"esearchresult": {"idlist": ["1"]}}).encode()
+        limiter = MagicMock()
+
+        with patch.object(_http._session(), "get", return_value=mock_resp), patch(
+            "crisprairs.apis.ncbi.eutils_rate_limiter", return_value=limiter
+        ):
+            search_ids("CRISPR AND KRAS")
+            search_ids("CRISPR AND KRAS")  # second call is a cache hit
+
+        limiter.wait.assert_called_once()
+
+    def test_identity_params_sent_but_not_cached(self):
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({"esearchresult": {"idlist": ["1"]}}).encode()
+        identity = {"tool": "crisprairs", "api_key": "secret"}
+
+        with patch.object(_http._session(), "get", return_value=mock_resp) as mock_get, patch(
+            "crisprairs.literature.pubmed._eutils_identity", return_value=(identity, None)
+        ):
+            search_ids("CRISPR AND MYC")
+
+        assert mock_get.call_args.kwargs["params"]["api_key"] == "secret"
+        assert b"secret" not in _http.CACHE_PATH.read_bytes()
+
     def test_handles_request_error(self):
         import requests
 
-        with patch(
-            "crisprairs.literature.pubmed.requests.get",
+        with patch.object(
+            _http._session(),
+            "get",
             side_effect=requests.RequestException("boom"),
         ):
             ids = search_ids("CRISPR")
@@ -56,7 +93,7 @@ class TestFetchSummaries:
     def test_parses_summary_rows(self):
         mock_resp = MagicMock()
         mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = json.dumps({
             "result": {
                 "uids": ["123"],
                 "123": {
@@ -66,22 +103,101 @@ class TestFetchSummaries:
                     "authors": [{"name": "Smith J"}, {"name": "Lee A"}],
                 },
             }
-        }
+        }).encode()
 
-        with patch("crisprairs.literature.pubmed.requests.get", return_value=mock_resp):
+        with patch.object(
+            _http._session(), "post", return_value=mock_resp
+        ) as mock_post:
             hits = fetch_summaries(["123"])
 
         assert len(hits) == 1
         assert hits[0]["pmid"] == "123"
         assert "CRISPR editing" in hits[0]["title"]
         assert hits[0]["url"].endswith("/123/")
+        assert mock_post.call_args.kwargs["data"]["id"] == "123"
+
+    def test_skips_rows_without_title(self):
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({
+            "result": {
+                "uids": ["1", "2"],
+                "1": {"title": "Kept"},
+                "2": {"uid": "2", "error": "cannot get document summary"},
+            }
+        }).encode()
+
+        with patch.object(_http._session(), "post", return_value=mock_resp):
+            hits = fetch_summaries(["1", "2"])
+
+        assert [hit["pmid"] for hit in hits] == ["1"]
+
+    def test_overlapping_lookups_request_only_uncached_pmids(self):
+        def reply(uids):
+            resp = MagicMock()
+            resp.content = json.dumps(
+                {"result": {"uids": uids, **{uid: {"title": f"T{uid}"} for uid in uids}}}
+            ).encode()
+            return resp
+
+        with patch.object(
+            _http._session(), "post", side_effect=[reply(["1", "2"]), reply(["3"])]
+        ) as mock_post:
+            fetch_summaries(["1", "2"])
+            hits = fetch_summaries(["2", "3"])
+            cached = fetch_summaries(["3", "1"])
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.kwargs["data"]["id"] == "3"
+        assert [hit["title"] for hit in hits] == ["T2", "T3"]
+        assert [hit["title"] for hit in cached] == ["T3", "T1"]
+        assert _http.served_from_cache() is True
+
+    def test_lookups_during_a_post_share_the_next_one(self):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from crisprairs.literature import pubmed
+
+        release = threading.Event()
+
+        def post(url, data, timeout):
+            if data["id"] == "1":
+                release.wait(5)
+            uids = data["id"].split(",")
+            resp = MagicMock()
+            resp.content = json.dumps(
+                {"result": {"uids": uids, **{uid: {"title": f"T{uid}"} for uid in uids}}}
+            ).encode()
+            return resp
+
+        batcher = pubmed._SummaryBatcher()
+        with patch.object(
+            _http._session(), "post", side_effect=post
+        ) as mock_post, patch.object(pubmed, "_summary_batcher", batcher):
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                first = pool.submit(fetch_summaries, ["1"])
+                while mock_post.call_count == 0:
+                    time.sleep(0.01)
+                second = pool.submit(fetch_summaries, ["2"])
+                third = pool.submit(fetch_summaries, ["3"])
+                while set(batcher._pmids or ()) != {"2", "3"}:
+                    time.sleep(0.01)
+                release.set()
+                hits = first.result() + second.result() + third.result()
+
+        assert mock_post.call_args_list[0].kwargs["data"]["id"] == "1"
+        assert mock_post.call_count == 2
+        assert set(mock_post.call_args.kwargs["data"]["id"].split(",")) == {"2", "3"}
+        assert [hit["title"] for hit in hits] == ["T1", "T2", "T3"]
 
 
 class TestFetchPubMedHits:
     def test_blends_recent_and_relevant(self):
+        ranked = {"relevance": ["1", "2", "3"], "date": ["3", "4", "5"]}
         with patch(
             "crisprairs.literature.pubmed.search_ids",
-            side_effect=[["1", "2", "3"], ["3", "4", "5"]],
+            side_effect=lambda query, **kwargs: ranked[kwargs["sort"]],
         ):
             with patch(
                 "crisprairs.literature.pubmed.fetch_summaries",
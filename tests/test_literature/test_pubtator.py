@@ -1,7 +1,9 @@
 """Tests for literature/pubtator.py."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+from crisprairs.literature import _http
 from crisprairs.literature.pubtator import fetch_entity_annotations
 
 
@@ -9,7 +11,7 @@ class TestFetchEntityAnnotations:
     def test_parses_entities_by_type(self):
         mock_resp = MagicMock()
         mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = [
+        mock_resp.content = json.dumps([
             {
                 "id": "123",
                 "passages": [
@@ -21,9 +23,9 @@ class TestFetchEntityAnnotations:
                     }
                 ],
             }
-        ]
+        ]).encode()
 
-        with patch("crisprairs.literature.pubtator.requests.get", return_value=mock_resp):
+        with patch.object(_http._session(), "get", return_value=mock_resp):
             entities = fetch_entity_annotations(["123"])
 
         assert entities["123"]["Gene"] == ["TP53"]
@@ -32,9 +34,36 @@ class TestFetchEntityAnnotations:
     def test_returns_empty_on_request_error(self):
         import requests
 
-        with patch(
-            "crisprairs.literature.pubtator.requests.get",
+        with patch.object(
+            _http._session(),
+            "get",
             side_effect=requests.RequestException("boom"),
         ):
             entities = fetch_entity_annotations(["123"])
         assert entities == {}
+
+    def test_returns_empty_on_malformed_json(self):
+        mock_resp = MagicMock()
+        mock_resp.content = b"<html>Service unavailable</html>"
+
+        with patch.object(_http._session(), "get", return_value=mock_resp):
+            entities = fetch_entity_annotations(["123"])
+        assert entities == {}
+
+    def test_splits_large_pmid_lists_into_batches(self):
+        def pubtator_reply(url, params, timeout):
+            resp = MagicMock()
+            resp.content = json.dumps([
+                {"id": p, "passages": [{"annotations": [
+                    {"text": "TP53", "infons": {"type": "Gene"}},
+                ]}]}
+                for p in params["pmids"].split(",")
+            ]).encode()
+            return resp
+
+        pmids = [str(i) for i in range(1, 251)]
+        with patch.object(_http._session(), "get", side_effect=pubtator_reply) as mock_get:
+            entities = fetch_entity_annotations(pmids)
+
+        assert mock_get.call_count == 3
+        assert len(entities) == 250
@@ -1,6 +1,7 @@
 """Tests for literature/service.py."""
 
-from unittest.mock import patch
+import json
+from unittest.mock import MagicMock, patch
 
 from crisprairs.engine.context import SessionContext
 from crisprairs.literature.service import (
@@ -35,7 +36,10 @@ class TestRunLiteratureScan:
             return_value="(CRISPR) AND (TP53)",
         ):
             with patch(
-                "crisprairs.literature.service.fetch_pubmed_hits",
+                "crisprairs.literature.service.search_pubmed_ids",
+                return_value=["123"],
+            ), patch(
+                "crisprairs.literature.service.fetch_summaries",
                 return_value=[{"pmid": "123", "title": "Paper A"}],
             ):
                 with patch(
@@ -50,6 +54,8 @@ class TestRunLiteratureScan:
 
         assert scan["query"] == "(CRISPR) AND (TP53)"
         assert len(scan["hits"]) == 1
+        assert scan["hits"][0]["entities"] == {"Gene": ["TP53"]}
+        assert scan["hits"][0]["icite"]["rcr"] == 1.2
         assert "retrieved_at" in scan
 
     def test_handles_empty_query(self):
@@ -110,3 +116,54 @@ class TestEvidenceRiskReview:
         review = run_evidence_risk_review(ctx)
         assert review["papers_flagged"] == 1
         assert any("cautionary language" in risk for risk in review["risks"])
+
+    def test_reports_overlapping_risk_terms(self):
+        ctx = SessionContext()
+        ctx.literature_hits = [{"pmid": "1", "title": "Genotoxicity of Cas9 nickases"}]
+        review = run_evidence_risk_review(ctx)
+        assert review["hits"][0]["risk_terms"] == ["genotoxic", "toxicity"]
+
+
+class TestResponseCache:
+    def test_repeat_request_served_from_cache(self):
+        from crisprairs.literature import _http
+
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({"esearchresult": {"idlist": ["1"]}}).encode()
+        with patch.object(_http._session(), "get", return_value=mock_resp) as mock_get:
+            first = _http.get_json("https://example.org/esearch", {"term": "x"}, 5)
+            assert _http.served_from_cache() is False
+            second = _http.get_json("https://example.org/esearch", {"term": "x"}, 5)
+            assert _http.served_from_cache() is True
+
+        assert first == second
+        assert mock_get.call_count == 1
+
+    def test_cache_bypass_refetches(self):
+        from crisprairs.literature import _http
+
+        mock_resp = MagicMock()
+        mock_resp.content = json.dumps({"ok": 1}).encode()
+        with patch.object(_http._session(), "get", return_value=mock_resp) as mock_get:
+            _http.get_json("https://example.org/x", {}, 5)
+            _http.get_json("https://example.org/x", {}, 5, cache_bypass=True)
+
+        assert mock_get.call_count == 2
+
+    def test_scan_notes_cached_results(self):
+        ctx = SessionContext(target_gene="TP53", species="human", modality="knockout")
+        with patch(
+            "crisprairs.literature.service.search_pubmed_ids", return_value=["123"]
+        ), patch(
+            "crisprairs.literature.service.fetch_summaries",
+            return_value=[{"pmid": "123", "title": "Paper A"}],
+        ), patch(
+            "crisprairs.literature.service.served_from_cache", return_value=True
+        ), patch(
+            "crisprairs.literature.service.fetch_entity_annotations", return_value={}
+        ), patch(
+            "crisprairs.literature.service.fetch_icite_metrics", return_value={}
+        ):
+            scan = run_literature_scan(ctx)
+
+        assert any("local cache" in note for note in scan["notes"])
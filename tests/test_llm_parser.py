@@ -60,3 +60,12 @@ This is because RNP has lower off-target effects."""
         text = '{"first": true} and {"second": true}'
         result = extract_json(text)
         assert result.get("first") is True
+
+    def test_skips_unbalanced_brace_before_object(self):
+        text = 'Use {placeholder syntax here. Result: {"format": "RNP"} done'
+        result = extract_json(text)
+        assert result == {"format": "RNP"}
+
+    def test_bare_scalar_is_not_returned_as_object(self):
+        with pytest.raises(ValueError):
+            extract_json("42")
@@ -1,6 +1,8 @@
 """Tests for llm/provider.py — LLM provider adapter."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import weakref
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -12,13 +14,44 @@ from crisprairs.llm.provider import (
 )
 
 
+def _chunk(text):
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = text
+    return chunk
+
+
+class _Stream:
+    """Minimal stand-in for the OpenAI SDK's streamed response."""
+
+    def __init__(self, *pieces):
+        self.chunks = [_chunk(piece) for piece in pieces]
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class _AsyncStream(_Stream):
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
 class TestOpenAIChat:
     def test_chat_parses_json_response(self):
         mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"gene": "TP53"}'
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _Stream('{"gene": "TP53"}')
 
         with patch.object(OpenAIChat, "_get_client", return_value=mock_client):
             result = OpenAIChat.chat("What gene?")
@@ -27,10 +60,9 @@ class TestOpenAIChat:
 
     def test_chat_strips_markdown_fences(self):
         mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '```json\n{"gene": "BRCA1"}\n```'
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _Stream(
+            "```json\n", '{"gene": ', '"BRCA1"}', "\n```"
+        )
 
         with patch.object(OpenAIChat, "_get_client", return_value=mock_client):
             result = OpenAIChat.chat("What gene?")
@@ -42,6 +74,56 @@ class TestOpenAIChat:
         with pytest.raises(IdentifiableGeneError):
             OpenAIChat.chat(long_seq)
 
+    def test_chat_stops_reading_once_object_closes(self):
+        mock_client = MagicMock()
+        stream = _Stream('{"gene": ', '"TP53"}', "\nHope this helps!", " More prose.")
+        mock_client.chat.completions.create.return_value = stream
+
+        with patch.object(OpenAIChat, "_get_client", return_value=mock_client):
+            result = OpenAIChat.chat("What gene?")
+
+        assert result == {"gene": "TP53"}
+        assert stream.consumed == 2
+        assert stream.closed
+
+    def test_chat_falls_back_to_full_reply_for_prose(self):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = _Stream(
+            "Here you go: ", '{"gene": "TP53"}', " done"
+        )
+
+        with patch.object(OpenAIChat, "_get_client", return_value=mock_client):
+            result = OpenAIChat.chat("What gene?")
+
+        assert result == {"gene": "TP53"}
+
+    def test_achat_uses_async_client(self):
+        mock_client = MagicMock()
+        stream = _AsyncStream('{"gene": ', '"KRAS"}')
+        mock_client.chat.completions.create = AsyncMock(return_value=stream)
+
+        with patch.object(OpenAIChat, "_get_async_client", return_value=mock_client):
+            result = asyncio.run(OpenAIChat.achat("What gene?"))
+
+        assert result == {"gene": "KRAS"}
+        assert stream.closed
+
+    def test_async_client_is_per_event_loop(self):
+        fake_openai = MagicMock()
+        fake_openai.AsyncOpenAI.side_effect = lambda **_: MagicMock()
+
+        async def two_lookups():
+            return OpenAIChat._get_async_client(), OpenAIChat._get_async_client()
+
+        with patch.dict("sys.modules", {"openai": fake_openai}), patch.object(
+            OpenAIChat, "_async_clients", weakref.WeakKeyDictionary()
+        ):
+            first, again = asyncio.run(two_lookups())
+            second, _ = asyncio.run(two_lookups())
+
+        assert first is again
+        assert first is not second
+
     def test_model_selection_default(self):
         model = OpenAIChat._model_for(use_gpt4=True)
         assert "gpt-4" in model
@@ -51,6 +133,22 @@ class TestOpenAIChat:
         assert "turbo" in model.lower() or "gpt-4" in model
 
 
+class TestStreamedReply:
+    def test_parses_once_when_top_level_object_closes(self):
+        from crisprairs.llm import provider
+
+        reply = provider._StreamedReply()
+        pieces = ['{"a": {"b": 1}, ', '"s": "}{\\"}", ', '"c": [{}, {}]', "}", " trailing"]
+        with patch(
+            "crisprairs.llm.provider.parse_leading_object",
+            wraps=provider.parse_leading_object,
+        ) as mock_parse:
+            results = [reply.feed(piece) for piece in pieces]
+
+        assert results[3] == {"a": {"b": 1}, "s": '}{"}', "c": [{}, {}]}
+        assert mock_parse.call_count == 1
+
+
 class TestAnthropicChat:
     def test_chat_parses_json_response(self):
         mock_client = MagicMock()
@@ -129,3 +227,84 @@ class TestChatProvider:
                     ChatProvider.chat("test")
                 mock_audit.assert_called()
                 assert mock_audit.call_args[0][0] == "llm_call_error"
+
+    def test_achat_many_bounds_concurrency_and_keeps_order(self):
+        in_flight = peak = 0
+
+        async def fake_achat(request, use_gpt4=True, use_gpt4_turbo=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"request": request}
+
+        with patch.object(ChatProvider, "_backend") as mock_backend_fn:
+            mock_backend_fn.return_value = MagicMock(achat=fake_achat)
+            with patch("crisprairs.llm.provider._log_audit"):
+                results = asyncio.run(ChatProvider.achat_many(range(5), max_concurrency=2))
+
+        assert [r["request"] for r in results] == [0, 1, 2, 3, 4]
+        assert peak == 2
+
+
+
+class TestResponseCache:
+    def _client(self):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = _Stream('{"gene": "TP53"}')
+        return mock_client
+
+    def test_identical_requests_hit_cache_when_enabled(self):
+        mock_client = self._client()
+        with patch("crisprairs.llm.provider.LLM_CACHE_ENABLED", True), patch.dict(
+            "crisprairs.llm.provider._response_cache", clear=True
+        ), patch.object(OpenAIChat, "_get_client", return_value=mock_client):
+            first = OpenAIChat.chat("Which gene?")
+            first["gene"] = "mutated"
+            second = OpenAIChat.chat("Which gene?")
+
+        assert second == {"gene": "TP53"}
+        assert mock_client.chat.completions.create.call_count == 1
+
+    def test_cache_hits_are_audited_separately(self):
+        mock_client = self._client()
+        with patch("crisprairs.llm.provider.LLM_CACHE_ENABLED", True), patch.dict(
+            "crisprairs.llm.provider._response_cache", clear=True
+        ), patch.object(OpenAIChat, "_get_client", return_value=mock_client), patch.object(
+            ChatProvider, "_provider_name", "openai"
+        ), patch("crisprairs.llm.provider._log_audit") as mock_audit:
+            ChatProvider.chat("Which gene?")
+            ChatProvider.chat("Which gene?")
+
+        events = [call.args[0] for call in mock_audit.call_args_list]
+        assert events == ["llm_call", "llm_cache_hit"]
+
+    def test_cache_disabled_by_default(self):
+        mock_client = self._client()
+        with patch("crisprairs.llm.provider.LLM_CACHE_ENABLED", False), patch.object(
+            OpenAIChat, "_get_client", return_value=mock_client
+        ):
+            OpenAIChat.chat("Which gene?")
+            OpenAIChat.chat("Which gene?")
+
+        assert mock_client.chat.completions.create.call_count == 2
+
+    def test_disabled_cache_skips_key_hashing(self):
+        with patch("crisprairs.llm.provider.LLM_CACHE_ENABLED", False), patch.object(
+            OpenAIChat, "_get_client", return_value=self._client()
+        ), patch("crisprairs.llm.provider._cache_key") as mock_key:
+            OpenAIChat.chat("Which gene?")
+
+        mock_key.assert_not_called()
+
+    def test_whitespace_variants_share_entry_but_case_does_not(self):
+        mock_client = self._client()
+        with patch("crisprairs.llm.provider.LLM_CACHE_ENABLED", True), patch.dict(
+            "crisprairs.llm.provider._response_cache", clear=True
+        ), patch.object(OpenAIChat, "_get_client", return_value=mock_client):
+            OpenAIChat.chat("Knock out  TP53\nin HEK293T")
+            OpenAIChat.chat("Knock out TP53 in   HEK293T ")
+            OpenAIChat.chat("Knock out Trp53 in HEK293T")
+
+        assert mock_client.chat.completions.create.call_count == 2